@@ -0,0 +1,24 @@
+"""
+This example demonstrates how to retrieve all videos for channels through their uploads playlist.
+
+Each page costs 1 quota unit, instead of 100 units for each page of search.list.
+"""
+
+from pyyoutube import Client
+
+API_KEY = "Your key"  # replace this with your api key.
+
+
+def get_all_videos():
+    cli = Client(api_key=API_KEY)
+
+    channel_ids = ["UC_x5XG1OV2P6uZZ5FSM9Ttw", "UCK8sQmJBp8GCxrOtXWBpyEA"]
+
+    for video in cli.channels.iter_all_videos(
+        channel_id=channel_ids, parts=["id", "snippet", "statistics"]
+    ):
+        print(f"Video: {video.id} {video.snippet.title}")
+
+
+if __name__ == "__main__":
+    get_all_videos()
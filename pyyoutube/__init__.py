@@ -1,5 +1,38 @@
-from .api import Api  # noqa
-from .client import Client  # noqa
+"""
+Python wrapper for the YouTube Data API.
+
+Submodules are imported on first access of their names, so importing the
+package stays cheap.
+"""
+
+from typing import TYPE_CHECKING
+
 from .error import *  # noqa
-from .models import *  # noqa
-from .utils.constants import TOPICS  # noqa
+from . import models as _models
+from .utils.lazy import lazy_exports
+
+_EXPORTS = {
+    ".api": ("Api",),
+    ".client": ("Client",),
+    ".models": _models.__all__,
+    ".utils.constants": ("TOPICS",),
+}
+
+__getattr__, __dir__, _lazy_all = lazy_exports(__name__, _EXPORTS)
+__all__ = [
+    "ErrorCode",
+    "ErrorMessage",
+    "PyYouTubeException",
+    "QuotaExceeded",
+    "RateLimited",
+    "NotFound",
+    "Forbidden",
+    "Transient",
+    "error_from_response",
+] + _lazy_all
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .api import Api  # noqa
+    from .client import Client  # noqa
+    from .models import *  # noqa
+    from .utils.constants import TOPICS  # noqa
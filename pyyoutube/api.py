@@ -5,11 +5,18 @@ Main Api implementation.
 from typing import Optional, List, Union
 
 import requests
+from requests.adapters import BaseAdapter
 from requests.auth import HTTPBasicAuth
 from requests.models import Response
 from requests_oauthlib.oauth2_session import OAuth2Session
 
-from pyyoutube.error import ErrorCode, ErrorMessage, PyYouTubeException
+from pyyoutube.error import (
+    ErrorCode,
+    ErrorMessage,
+    PyYouTubeException,
+    error_from_response,
+    non_json_error,
+)
 from pyyoutube.models import (
     AccessToken,
     UserProfile,
@@ -106,6 +113,7 @@ class Api(object):
         access_token: Optional[str] = None,
         timeout: Optional[int] = None,
         proxies: Optional[dict] = None,
+        transport: Optional[BaseAdapter] = None,
     ) -> None:
         """
         This Api provide two method to work. Use api key or use access token.
@@ -126,6 +134,9 @@ class Api(object):
                 If you want use proxy, need point this param.
                 param style like requests lib style.
                 Refer https://2.python-requests.org//en/latest/user/advanced/#proxies
+            transport(BaseAdapter, optional):
+                Requests adapter sending every request of the session, like
+                pyyoutube.transport.CassetteTransport.
 
         Returns:
             YouTube Api instance.
@@ -137,6 +148,9 @@ class Api(object):
         self._refresh_token = None  # This keep current user's refresh token.
         self._timeout = timeout
         self.session = requests.Session()
+        if transport is not None:
+            self.session.mount("https://", transport)
+            self.session.mount("http://", transport)
         self.proxies = proxies
 
         if not (
@@ -322,9 +336,14 @@ class Api(object):
         Return:
              response's data
         """
-        data = response.json()
+        try:
+            data = response.json()
+        except ValueError:
+            if response.ok:
+                raise
+            data = non_json_error(response)
         if "error" in data:
-            raise PyYouTubeException(response)
+            raise error_from_response(response, data)
         return data
 
     @staticmethod
@@ -0,0 +1,279 @@
+"""
+Parser for the caption tracks downloaded by captions.download.
+
+Supported formats are the ``tfmt`` values sbv, srt, ttml and vtt.
+"""
+
+import codecs
+import re
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+from pyyoutube.error import ErrorCode, ErrorMessage, PyYouTubeException
+
+CAPTION_FORMATS = ("sbv", "srt", "ttml", "vtt")
+
+_CLOCK_RE = re.compile(r"^(?:(\d+):)?(\d{1,2}):(\d{1,2})(?:[.,](\d+))?$")
+_OFFSET_RE = re.compile(r"^(\d+(?:\.\d+)?)(h|m|s|ms)$")
+_OFFSET_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+class Cue(NamedTuple):
+    start: float
+    end: float
+    text: str
+
+
+def _invalid(message: str) -> PyYouTubeException:
+    return PyYouTubeException(
+        ErrorMessage(status_code=ErrorCode.INVALID_PARAMS, message=message)
+    )
+
+
+def _check_format(fmt: str):
+    if fmt not in CAPTION_FORMATS:
+        raise _invalid(f"Caption format must be one of {','.join(CAPTION_FORMATS)}")
+
+
+def parse_timestamp(value: str) -> float:
+    """Parse caption timestamp like 01:02:03.456, 02:03,456 or 1.5s to seconds."""
+    value = value.strip()
+    m = _CLOCK_RE.match(value)
+    if m is not None:
+        hours, minutes, seconds, fraction = m.groups()
+        total = int(hours or 0) * 3600 + int(minutes) * 60 + int(seconds)
+        if fraction:
+            total += int(fraction) / 10 ** len(fraction)
+        return float(total)
+    m = _OFFSET_RE.match(value)
+    if m is not None:
+        return float(m.group(1)) * _OFFSET_UNITS[m.group(2)]
+    raise _invalid(f"Invalid caption timestamp: {value}")
+
+
+def format_timestamp(seconds: float, fmt: str) -> str:
+    """Format seconds to the timestamp of the caption format."""
+    millis = int(round(seconds * 1000))
+    hours, millis = divmod(millis, 3600000)
+    minutes, millis = divmod(millis, 60000)
+    secs, millis = divmod(millis, 1000)
+    if fmt == "srt":
+        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    if fmt == "sbv":
+        return f"{hours:d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}.{millis:03d}"
+
+
+def _iter_lines(chunks: Iterable[Union[str, bytes]]) -> Iterator[str]:
+    """Split text or bytes chunks into lines without joining the whole track."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    for chunk in chunks:
+        if isinstance(chunk, bytes):
+            chunk = decoder.decode(chunk)
+        buffer += chunk
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+def _iter_blocks(lines: Iterator[str]) -> Iterator[List[str]]:
+    block = []
+    for line in lines:
+        if line.strip():
+            block.append(line)
+        elif block:
+            yield block
+            block = []
+    if block:
+        yield block
+
+
+def _iter_text_cues(lines: Iterator[str], fmt: str) -> Iterator[Cue]:
+    for block in _iter_blocks(lines):
+        for idx, line in enumerate(block):
+            if fmt == "sbv":
+                start, sep, end = line.partition(",")
+                timing = bool(sep) and _CLOCK_RE.match(start.strip()) is not None
+            else:
+                start, sep, end = line.partition("-->")
+                timing = bool(sep)
+            if timing:
+                # vtt cue settings follow the end time.
+                end = end.split()[0] if end.strip() else end
+                text = "\n".join(block[idx + 1 :])
+                yield Cue(parse_timestamp(start), parse_timestamp(end), text)
+                break
+
+
+def _local_name(tag: str) -> str:
+    return tag.rsplit("}", 1)[-1]
+
+
+def _element_text(elem: ElementTree.Element) -> str:
+    parts = [elem.text or ""]
+    for child in elem:
+        if _local_name(child.tag) == "br":
+            parts.append("\n")
+        else:
+            parts.append(_element_text(child))
+        parts.append(child.tail or "")
+    return "".join(parts).strip()
+
+
+def _iter_ttml_cues(chunks: Iterable[Union[str, bytes]]) -> Iterator[Cue]:
+    parser = ElementTree.XMLPullParser(events=("end",))
+
+    def drain():
+        for _, elem in parser.read_events():
+            if _local_name(elem.tag) != "p":
+                continue
+            begin = parse_timestamp(elem.get("begin", "0s"))
+            if elem.get("end") is not None:
+                end = parse_timestamp(elem.get("end"))
+            else:
+                end = begin + parse_timestamp(elem.get("dur", "0s"))
+            yield Cue(begin, end, _element_text(elem))
+            elem.clear()
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from drain()
+    parser.close()
+    yield from drain()
+
+
+def iter_cues(chunks: Iterable[Union[str, bytes]], fmt: str) -> Iterator[Cue]:
+    """Parse caption cues incrementally.
+
+    Args:
+        chunks:
+            Text or bytes chunks of the track, like the lines of a file or
+            the chunks of captions.iter_download.
+        fmt:
+            Caption format, one of sbv, srt, ttml and vtt.
+
+    Returns:
+        Iterator of cues in the order of the track.
+    """
+    _check_format(fmt)
+    if fmt == "ttml":
+        return _iter_ttml_cues(chunks)
+    return _iter_text_cues(_iter_lines(chunks), fmt)
+
+
+class CaptionTrack:
+    def __init__(self, cues: Iterable[Union[Cue, Tuple[float, float, str]]] = ()):
+        """Caption track stored as a compact cue table.
+
+        Args:
+            cues:
+                Cues with start, end seconds and text.
+        """
+        cues = list(cues)
+        if any(cues[i][0] > cues[i + 1][0] for i in range(len(cues) - 1)):
+            cues.sort(key=lambda c: c[0])
+        self.starts = array("d", (c[0] for c in cues))
+        self.ends = array("d", (c[1] for c in cues))
+        self.texts: List[str] = [c[2] for c in cues]
+
+        # Running maximum of the end times, to stop the backward scan of cues_at early.
+        self._max_ends = array("d")
+        current = float("-inf")
+        for end in self.ends:
+            current = max(current, end)
+            self._max_ends.append(current)
+
+    @classmethod
+    def parse(cls, content: Union[str, bytes], fmt: str) -> "CaptionTrack":
+        """Parse the whole track content."""
+        return cls(iter_cues([content], fmt))
+
+    @classmethod
+    def parse_chunks(
+        cls, chunks: Iterable[Union[str, bytes]], fmt: str
+    ) -> "CaptionTrack":
+        """Parse the track from text or bytes chunks."""
+        return cls(iter_cues(chunks, fmt))
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    def __getitem__(self, idx: int) -> Cue:
+        return Cue(self.starts[idx], self.ends[idx], self.texts[idx])
+
+    def __iter__(self) -> Iterator[Cue]:
+        return map(Cue, self.starts, self.ends, self.texts)
+
+    def cues_at(self, t: float) -> List[Cue]:
+        """Cues on screen at the time.
+
+        Args:
+            t:
+                Time in seconds.
+
+        Returns:
+            Cues with start <= t < end, ordered by start.
+        """
+        idx = bisect_right(self.starts, t) - 1
+        found = []
+        while idx >= 0 and self._max_ends[idx] > t:
+            if self.ends[idx] > t:
+                found.append(self[idx])
+            idx -= 1
+        found.reverse()
+        return found
+
+    def text_at(self, t: float) -> Optional[str]:
+        """Text on screen at the time, None if nothing shown."""
+        cues = self.cues_at(t)
+        if not cues:
+            return None
+        return "\n".join(cue.text for cue in cues)
+
+    def dumps(self, fmt: str) -> str:
+        """Serialize the track to the caption format.
+
+        Args:
+            fmt:
+                Caption format, one of sbv, srt, ttml and vtt.
+
+        Returns:
+            Track content.
+        """
+        _check_format(fmt)
+        if fmt == "ttml":
+            return self._dumps_ttml()
+
+        blocks = ["WEBVTT\n"] if fmt == "vtt" else []
+        for idx, cue in enumerate(self, start=1):
+            start = format_timestamp(cue.start, fmt)
+            end = format_timestamp(cue.end, fmt)
+            if fmt == "sbv":
+                blocks.append(f"{start},{end}\n{cue.text}\n")
+            elif fmt == "srt":
+                blocks.append(f"{idx}\n{start} --> {end}\n{cue.text}\n")
+            else:
+                blocks.append(f"{start} --> {end}\n{cue.text}\n")
+        return "\n".join(blocks)
+
+    def _dumps_ttml(self) -> str:
+        lines = [
+            '<?xml version="1.0" encoding="utf-8" ?>',
+            '<tt xml:lang="" xmlns="http://www.w3.org/ns/ttml">',
+            "<body><div>",
+        ]
+        for cue in self:
+            text = "<br/>".join(escape(line) for line in cue.text.split("\n"))
+            start = format_timestamp(cue.start, "ttml")
+            end = format_timestamp(cue.end, "ttml")
+            lines.append(f'<p begin="{start}" end="{end}">{text}</p>')
+        lines.append("</div></body>")
+        lines.append("</tt>")
+        return "\n".join(lines) + "\n"
@@ -2,27 +2,33 @@
 New Client for YouTube API
 """
 
-import inspect
+import asyncio
 import json
-from typing import List, Optional, Tuple, Union
+from functools import partial
+from typing import Hashable, List, Optional, Tuple, Union
 
 import requests
 from requests import Response
+from requests.adapters import BaseAdapter
 from requests.sessions import merge_setting
 from requests.structures import CaseInsensitiveDict
 from requests_oauthlib.oauth2_session import OAuth2Session
 
-import pyyoutube.resources as resources
 from pyyoutube.models.base import BaseModel
-from pyyoutube.error import ErrorCode, ErrorMessage, PyYouTubeException
+from pyyoutube.error import (
+    ErrorCode,
+    ErrorMessage,
+    PyYouTubeException,
+    error_from_response,
+    non_json_error,
+)
+from pyyoutube.instrumentation import Instrumentation, current_call
+from pyyoutube.loaders import Loaders
 from pyyoutube.models import (
     AccessToken,
 )
-from pyyoutube.resources.base_resource import Resource
-
-
-def _is_resource_endpoint(obj):
-    return isinstance(obj, Resource)
+from pyyoutube.resources.base_resource import LazyResource
+from pyyoutube.utils.coalesce import SingleFlight
 
 
 class Client:
@@ -42,36 +48,26 @@ class Client:
     ]
     DEFAULT_STATE = "Python-YouTube"
 
-    activities = resources.ActivitiesResource()
-    captions = resources.CaptionsResource()
-    channels = resources.ChannelsResource()
-    channelBanners = resources.ChannelBannersResource()
-    channelSections = resources.ChannelSectionsResource()
-    comments = resources.CommentsResource()
-    commentThreads = resources.CommentThreadsResource()
-    i18nLanguages = resources.I18nLanguagesResource()
-    i18nRegions = resources.I18nRegionsResource()
-    members = resources.MembersResource()
-    membershipsLevels = resources.MembershipLevelsResource()
-    playlistItems = resources.PlaylistItemsResource()
-    playlists = resources.PlaylistsResource()
-    search = resources.SearchResource()
-    subscriptions = resources.SubscriptionsResource()
-    thumbnails = resources.ThumbnailsResource()
-    videoAbuseReportReasons = resources.VideoAbuseReportReasonsResource()
-    videoCategories = resources.VideoCategoriesResource()
-    videos = resources.VideosResource()
-    watermarks = resources.WatermarksResource()
-
-    def __new__(cls, *args, **kwargs):
-        self = super().__new__(cls)
-        sub_resources = inspect.getmembers(self, _is_resource_endpoint)
-        for name, resource in sub_resources:
-            resource_cls = type(resource)
-            resource = resource_cls(self)
-            setattr(self, name, resource)
-
-        return self
+    activities = LazyResource("ActivitiesResource")
+    captions = LazyResource("CaptionsResource")
+    channels = LazyResource("ChannelsResource")
+    channelBanners = LazyResource("ChannelBannersResource")
+    channelSections = LazyResource("ChannelSectionsResource")
+    comments = LazyResource("CommentsResource")
+    commentThreads = LazyResource("CommentThreadsResource")
+    i18nLanguages = LazyResource("I18nLanguagesResource")
+    i18nRegions = LazyResource("I18nRegionsResource")
+    members = LazyResource("MembersResource")
+    membershipsLevels = LazyResource("MembershipLevelsResource")
+    playlistItems = LazyResource("PlaylistItemsResource")
+    playlists = LazyResource("PlaylistsResource")
+    search = LazyResource("SearchResource")
+    subscriptions = LazyResource("SubscriptionsResource")
+    thumbnails = LazyResource("ThumbnailsResource")
+    videoAbuseReportReasons = LazyResource("VideoAbuseReportReasonsResource")
+    videoCategories = LazyResource("VideoCategoriesResource")
+    videos = LazyResource("VideosResource")
+    watermarks = LazyResource("WatermarksResource")
 
     def __init__(
         self,
@@ -84,6 +80,9 @@ class Client:
         timeout: Optional[int] = None,
         proxies: Optional[dict] = None,
         headers: Optional[dict] = None,
+        coalesce_requests: bool = False,
+        transport: Optional[BaseAdapter] = None,
+        instrumentation: Optional[Instrumentation] = None,
     ) -> None:
         """Class initial
 
@@ -106,6 +105,15 @@ class Client:
                 Proxies for every request.
             headers:
                 Headers for every request.
+            coalesce_requests:
+                Whether concurrent identical GET requests share one HTTP call.
+                The callers then get the same parsed dict with return_json,
+                copy it before changing it.
+            transport:
+                Requests adapter sending every request of the session, like
+                pyyoutube.transport.CassetteTransport.
+            instrumentation:
+                Hooks and metrics for the calls, see pyyoutube.instrumentation.
 
         Raises:
             PyYouTubeException: Missing either credentials.
@@ -118,8 +126,14 @@ class Client:
         self.timeout = timeout
         self.proxies = proxies
         self.headers = headers
+        self.single_flight = SingleFlight() if coalesce_requests else None
+        self.loaders = Loaders(self)
+        self.instrumentation = instrumentation
 
         self.session = requests.Session()
+        if transport is not None:
+            self.session.mount("https://", transport)
+            self.session.mount("http://", transport)
         self.merge_headers()
 
         if not self._has_client_data() and client_secret_path is not None:
@@ -208,9 +222,23 @@ class Client:
         Raises:
             PyYouTubeException: If response has errors.
         """
-        data = response.json()
+        # Coalesced requests share the response, decode its body only once.
+        data = response.__dict__.get("_decoded_json")
+        if data is None:
+            call = response.__dict__.get("_instrumented_call")
+            try:
+                if call is None:
+                    data = response.json()
+                else:
+                    data = call.instrumentation.parse(call, response.json)
+            except ValueError:
+                if response.ok:
+                    raise
+                # Error pages of proxies and load balancers, like a 502 in html.
+                data = non_json_error(response)
+            response._decoded_json = data
         if "error" in data:
-            raise PyYouTubeException(response)
+            raise error_from_response(response, data)
         return data
 
     def request(
@@ -251,9 +279,65 @@ class Client:
             PyYouTubeException: Missing credentials when need credentials.
                                 Request http error.
         """
+        send, key = self._prepare_request(
+            path, method, params, data, json, enforce_auth, is_upload, **kwargs
+        )
+        if key is not None:
+            return self.single_flight.do(key, send)
+        return send()
+
+    async def arequest(
+        self,
+        path: str,
+        method: str = "GET",
+        params: Optional[dict] = None,
+        data: Optional[dict] = None,
+        json: Optional[dict] = None,
+        enforce_auth: bool = True,
+        is_upload: bool = False,
+        **kwargs,
+    ):
+        """Send request to YouTube from a coroutine.
+
+        The request runs in the loop's default executor. With coalesce_requests,
+        identical GET requests from coroutines and threads share one HTTP call.
+
+        Args:
+            Same as ``request``.
+
+        Returns:
+            Response for request.
+
+        Raises:
+            PyYouTubeException: Missing credentials when need credentials.
+                                Request http error.
+        """
+        send, key = self._prepare_request(
+            path, method, params, data, json, enforce_auth, is_upload, **kwargs
+        )
+        if key is None:
+            return await asyncio.get_running_loop().run_in_executor(None, send)
+        return await self.single_flight.do_async(key, send)
+
+    def _prepare_request(
+        self,
+        path: str,
+        method: str,
+        params: Optional[dict],
+        data: Optional[dict],
+        json: Optional[dict],
+        enforce_auth: bool,
+        is_upload: bool,
+        **kwargs,
+    ):
+        """Build the function sending the request, and its coalescing key.
+
+        The key is None if the request must not be coalesced.
+        """
+        url = path
         if not path.startswith("http"):
             base_url = self.BASE_UPLOAD_URL if is_upload else self.BASE_URL
-            path = base_url + path
+            url = base_url + path
 
         # Add credentials to request
         if enforce_auth:
@@ -272,23 +356,53 @@ class Client:
         if isinstance(json, BaseModel):
             json = json.to_dict_ignore_none()
 
-        try:
-            response = self.session.request(
-                method=method,
-                url=path,
-                params=params,
-                data=data,
-                json=json,
-                proxies=self.proxies,
-                timeout=self.timeout,
-                **kwargs,
+        send = partial(
+            self._send,
+            method=method,
+            url=url,
+            params=params,
+            data=data,
+            json=json,
+            proxies=self.proxies,
+            timeout=self.timeout,
+            **kwargs,
+        )
+        # A body parsed but never decoded, with return_json, is not timed later.
+        current_call.set(None)
+        if self.instrumentation is not None:
+            send = self.instrumentation.wrap_send(send, method, path, url, params)
+        key = None
+        if (
+            self.single_flight is not None
+            and method.upper() == "GET"
+            and data is None
+            and json is None
+            and not kwargs
+        ):
+            key = self._coalesce_key(path, params, enforce_auth)
+        return send, key
+
+    def _coalesce_key(
+        self, url: str, params: Optional[dict], enforce_auth: bool
+    ) -> Hashable:
+        # Normalize the params, requests drops those with None value.
+        items = tuple(
+            sorted(
+                (name, str(value))
+                for name, value in (params or {}).items()
+                if value is not None
             )
+        )
+        credential = (self.api_key, self.access_token) if enforce_auth else None
+        return "GET", url, items, credential
+
+    def _send(self, **kwargs) -> Response:
+        try:
+            return self.session.request(**kwargs)
         except requests.HTTPError as e:
             raise PyYouTubeException(
                 ErrorMessage(status_code=ErrorCode.HTTP_ERROR, message=e.args[0])
             )
-        else:
-            return response
 
     def add_token_to_headers(self):
         if self.access_token:
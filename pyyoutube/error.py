@@ -1,9 +1,34 @@
 from dataclasses import dataclass
-from typing import Optional, Union
+from typing import List, Optional, Tuple, Type, Union, TYPE_CHECKING
 
-from requests import Response
+if TYPE_CHECKING:
+    from requests import Response  # pragma: no cover
 
-__all__ = ["ErrorCode", "ErrorMessage", "PyYouTubeException"]
+__all__ = [
+    "ErrorCode",
+    "ErrorMessage",
+    "PyYouTubeException",
+    "QuotaExceeded",
+    "RateLimited",
+    "NotFound",
+    "Forbidden",
+    "Transient",
+    "error_from_response",
+]
+
+# Error reasons of the API, by exception class.
+QUOTA_REASONS = frozenset(
+    {"quotaExceeded", "dailyLimitExceeded", "dailyLimitExceededUnreg"}
+)
+RATE_LIMIT_REASONS = frozenset(
+    {
+        "rateLimitExceeded",
+        "userRateLimitExceeded",
+        "servingLimitExceeded",
+        "concurrentLimitExceeded",
+    }
+)
+TRANSIENT_REASONS = frozenset({"backendError", "internalError", "serviceUnavailable"})
 
 
 class ErrorCode:
@@ -12,6 +37,7 @@ class ErrorCode:
     INVALID_PARAMS = 10002
     NEED_AUTHORIZATION = 10003
     AUTHORIZE_URL_FIRST = 10004
+    QUOTA_EXHAUSTED = 10005
 
 
 @dataclass
@@ -32,11 +58,29 @@ class PyYouTubeException(Exception):
     'message': 'No filter selected. Expected one of: forUsername, managedByMe, categoryId, mine, mySubscribers, id, idParam'}}
     """
 
-    def __init__(self, response: Optional[Union[ErrorMessage, Response]]):
+    # Whether sending the request again may succeed.
+    retryable: bool = False
+
+    def __init__(
+        self,
+        response: Optional[Union[ErrorMessage, "Response"]],
+        data: Optional[dict] = None,
+    ):
+        """
+        Args:
+            response:
+                Error message, or response of the API.
+            data:
+                Body of the response if already parsed, to not parse it again.
+        """
         self.status_code: Optional[int] = None
         self.error_type: Optional[str] = None
         self.message: Optional[str] = None
-        self.response: Optional[Union[ErrorMessage, Response]] = response
+        self.reason: Optional[str] = None
+        self.domain: Optional[str] = None
+        self.errors: List[dict] = []
+        self.response: Optional[Union[ErrorMessage, "Response"]] = response
+        self.data: Optional[dict] = data
         self.error_handler()
 
     def error_handler(self):
@@ -44,20 +88,23 @@ class PyYouTubeException(Exception):
         Error has two big type(but not the error type.): This module's error, Api return error.
         So This will change two error to one format
         """
+        # Imported here, so importing pyyoutube does not load requests.
+        from requests import Response
+
         if isinstance(self.response, ErrorMessage):
             self.status_code = self.response.status_code
             self.message = self.response.message
             self.error_type = "PyYouTubeException"
         elif isinstance(self.response, Response):
-            res_data = self.response.json()
-            if "error" in res_data:
-                error = res_data["error"]
-                if isinstance(error, dict):
-                    self.status_code = res_data["error"]["code"]
-                    self.message = res_data["error"]["message"]
-                else:
-                    self.status_code = self.response.status_code
-                    self.message = error
+            self.data = _response_data(self.response, self.data)
+            if "error" in self.data:
+                (
+                    self.status_code,
+                    self.message,
+                    self.errors,
+                    self.reason,
+                    self.domain,
+                ) = _error_fields(self.response, self.data["error"])
                 self.error_type = "YouTubeException"
 
     def __repr__(self):
@@ -67,3 +114,100 @@ class PyYouTubeException(Exception):
 
     def __str__(self):
         return self.__repr__()
+
+
+class QuotaExceeded(PyYouTubeException):
+    """The quota of the project is used up, until it is reset."""
+
+
+class RateLimited(PyYouTubeException):
+    """Too many requests in a short time, retry after a delay."""
+
+    retryable = True
+
+
+class NotFound(PyYouTubeException):
+    """The requested resource does not exist."""
+
+
+class Forbidden(PyYouTubeException):
+    """The credentials do not allow the request."""
+
+
+class Transient(PyYouTubeException):
+    """Server side failure, retry after a delay."""
+
+    retryable = True
+
+
+def non_json_error(response: "Response") -> dict:
+    """Error body standing for a response not in json, like the errors of proxies."""
+    return {"error": response.reason or "Unknown error"}
+
+
+def _response_data(response: "Response", data: Optional[dict]) -> dict:
+    if data is None:
+        # Decoded by Client.parse_response.
+        data = response.__dict__.get("_decoded_json")
+    if data is None:
+        try:
+            data = response.json()
+        except ValueError:
+            data = non_json_error(response)
+    return data
+
+
+def _error_fields(
+    response: "Response", error: Union[dict, str]
+) -> Tuple[Optional[int], Optional[str], List[dict], Optional[str], Optional[str]]:
+    """Status code, message, errors, reason and domain of an error body."""
+    if not isinstance(error, dict):
+        return response.status_code, error, [], error, None
+    errors = error.get("errors") or []
+    first = errors[0] if errors else {}
+    return (
+        error.get("code") or response.status_code,
+        error.get("message"),
+        errors,
+        first.get("reason") or error.get("status"),
+        first.get("domain"),
+    )
+
+
+def error_class(
+    status_code: Optional[int], reason: Optional[str]
+) -> Type[PyYouTubeException]:
+    """Exception class for the status code and reason of an API error."""
+    if reason in QUOTA_REASONS:
+        return QuotaExceeded
+    if reason in RATE_LIMIT_REASONS or status_code == 429:
+        return RateLimited
+    if reason in TRANSIENT_REASONS or (status_code or 0) >= 500:
+        return Transient
+    if status_code == 404 or (reason or "").endswith(("notFound", "NotFound")):
+        return NotFound
+    if status_code == 403:
+        return Forbidden
+    return PyYouTubeException
+
+
+def error_from_response(
+    response: "Response", data: Optional[dict] = None
+) -> PyYouTubeException:
+    """Build the exception for an error response, classified by its reason.
+
+    Args:
+        response:
+            Error response of the API.
+        data:
+            Body of the response if already parsed.
+
+    Returns:
+        Instance of a PyYouTubeException subclass like QuotaExceeded, or of
+        PyYouTubeException for other errors.
+    """
+    data = _response_data(response, data)
+    status_code, reason = response.status_code, None
+    if "error" in data:
+        status_code, _, _, reason, _ = _error_fields(response, data["error"])
+    return error_class(status_code, reason)(response, data)
@@ -0,0 +1,796 @@
+"""
+Local stand-in for the YouTube Data API, to load test without spending quota.
+
+It serves synthetic channels, videos and comments built with the library's models,
+with page tokens, the 50 ids limit, etags, quota errors and resumable uploads.
+
+Usage:
+    with FakeYouTubeServer(latency=0.05, error_rate=0.01, quota=10000) as server:
+        client = Client(api_key="KEY")
+        server.configure(client)
+        channel = client.channels.list(channel_id=server.dataset.channel_ids[0])
+
+    # Or from a shell, then point BASE_URL and BASE_UPLOAD_URL at it.
+    python -m pyyoutube.fake_server --port 8080
+"""
+
+import argparse
+import base64
+import datetime
+import hashlib
+import itertools
+import json
+import random
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from pyyoutube.models import (
+    Channel,
+    ChannelContentDetails,
+    ChannelSnippet,
+    ChannelStatistics,
+    Comment,
+    CommentSnippet,
+    CommentThread,
+    CommentThreadSnippet,
+    PlaylistItem,
+    PlaylistItemContentDetails,
+    PlaylistItemSnippet,
+    RelatedPlaylists,
+    ResourceId,
+    Video,
+    VideoContentDetails,
+    VideoSnippet,
+    VideoStatistics,
+)
+from pyyoutube.utils.constants import QUOTA_COSTS, RESOURCE_PARTS_MAPPING
+
+if TYPE_CHECKING:
+    from pyyoutube import Client  # pragma: no cover
+
+# Quota units of each request, like the real API.
+METHOD_QUOTA_COSTS = {"GET": 1, "POST": 50, "PUT": 50, "DELETE": 50}
+
+MAX_IDS = 50
+
+# Resource -> (item kind, max of maxResults)
+RESOURCES = {
+    "channels": ("channel", 50),
+    "videos": ("video", 50),
+    "playlistItems": ("playlistItem", 50),
+    "commentThreads": ("commentThread", 100),
+    "comments": ("comment", 100),
+}
+
+# Injected error status -> (domain, reason)
+ERROR_REASONS = {
+    403: ("youtube.quota", "quotaExceeded"),
+    429: ("usageLimits", "rateLimitExceeded"),
+    500: ("global", "backendError"),
+    503: ("global", "backendError"),
+}
+
+
+def _fake_id(prefix: str, length: int, *parts) -> str:
+    digest = hashlib.sha1(":".join(map(str, parts)).encode("utf-8")).digest()
+    value = base64.urlsafe_b64encode(digest).decode("ascii").rstrip("=")
+    return prefix + value[: length - len(prefix)]
+
+
+def _etag(data) -> str:
+    content = json.dumps(data, sort_keys=True).encode("utf-8")
+    return base64.urlsafe_b64encode(hashlib.sha1(content).digest()[:18]).decode()
+
+
+def _refresh_etag(data: dict) -> dict:
+    data.pop("etag", None)
+    data["etag"] = _etag(data)
+    return data
+
+
+def _error(status: int, message: str, reason: str, domain: str = "global") -> tuple:
+    error = {"message": message, "domain": domain, "reason": reason}
+    return (
+        status,
+        {},
+        {"error": {"code": status, "message": message, "errors": [error]}},
+    )
+
+
+class _ApiError(Exception):
+    def __init__(self, *args) -> None:
+        self.response = _error(*args)
+
+
+class FakeDataset:
+    def __init__(
+        self,
+        channels: int = 5,
+        videos_per_channel: int = 50,
+        comments_per_video: int = 10,
+        replies_per_comment: int = 2,
+        seed: int = 0,
+    ) -> None:
+        """Synthetic channels with their uploads, and comments of the videos.
+
+        The same arguments always generate the same data.
+
+        Args:
+            channels:
+                Count of channels.
+            videos_per_channel:
+                Count of uploaded videos in each channel.
+            comments_per_video:
+                Count of comment threads for each video.
+            replies_per_comment:
+                Count of replies in each comment thread.
+            seed:
+                Seed of the ids and values.
+        """
+        self.seed = seed
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.channels: Dict[str, dict] = OrderedDict()
+        self.videos: Dict[str, dict] = OrderedDict()
+        self.playlist_items: Dict[str, List[dict]] = defaultdict(list)
+        self.comment_threads: Dict[str, dict] = OrderedDict()
+        self.comments: Dict[str, dict] = OrderedDict()
+        self.threads_by_video: Dict[str, List[dict]] = defaultdict(list)
+        self.threads_by_channel: Dict[str, List[dict]] = defaultdict(list)
+        self.replies_by_parent: Dict[str, List[dict]] = defaultdict(list)
+        self._counter = itertools.count()
+
+        for _ in range(channels):
+            channel_id = self.add_channel()
+            for _ in range(videos_per_channel):
+                video_id = self.add_video(channel_id)
+                for _ in range(comments_per_video):
+                    self.add_comment_thread(video_id, replies=replies_per_comment)
+
+    @property
+    def channel_ids(self) -> List[str]:
+        return list(self.channels)
+
+    @property
+    def video_ids(self) -> List[str]:
+        return list(self.videos)
+
+    def _next_id(self, prefix: str, length: int) -> str:
+        return _fake_id(prefix, length, self.seed, next(self._counter))
+
+    def _published_at(self) -> str:
+        published = datetime.datetime(2020, 1, 1) + datetime.timedelta(
+            seconds=self._random.randrange(3 * 365 * 86400)
+        )
+        return published.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def add_channel(self, title: Optional[str] = None) -> str:
+        """Add a channel with an empty uploads playlist, returns its id."""
+        with self._lock:
+            channel_id = self._next_id("UC", 24)
+            title = title or f"Channel {len(self.channels)}"
+            channel = Channel(
+                kind="youtube#channel",
+                id=channel_id,
+                snippet=ChannelSnippet(
+                    title=title,
+                    description=f"Description of {title}",
+                    customUrl=f"@channel{len(self.channels)}",
+                    publishedAt=self._published_at(),
+                ),
+                contentDetails=ChannelContentDetails(
+                    relatedPlaylists=RelatedPlaylists(uploads="UU" + channel_id[2:])
+                ),
+                statistics=ChannelStatistics(
+                    viewCount=self._random.randrange(10**7),
+                    subscriberCount=self._random.randrange(10**6),
+                    hiddenSubscriberCount=False,
+                    videoCount=0,
+                ),
+            )
+            self.channels[channel_id] = _refresh_etag(channel.to_dict_ignore_none())
+            return channel_id
+
+    def add_video(self, channel_id: str, snippet: Optional[dict] = None) -> str:
+        """Add a video to the channel and its uploads playlist, returns its id.
+
+        Args:
+            channel_id:
+                ID of the channel uploading the video.
+            snippet:
+                Snippet of the video, generated if not provided.
+        """
+        with self._lock:
+            channel = self.channels[channel_id]
+            video_id = self._next_id("", 11)
+            published_at = self._published_at()
+            snippet = VideoSnippet.from_dict(
+                {
+                    "title": f"Video {len(self.videos)}",
+                    "description": f"Description of video {len(self.videos)}",
+                    "tags": ["fake", "video"],
+                    "categoryId": "22",
+                    **(snippet or {}),
+                    "publishedAt": published_at,
+                    "channelId": channel_id,
+                    "channelTitle": channel["snippet"]["title"],
+                }
+            )
+            seconds = self._random.randrange(1, 3 * 3600)
+            video = Video(
+                kind="youtube#video",
+                id=video_id,
+                snippet=snippet,
+                contentDetails=VideoContentDetails(
+                    duration=f"PT{seconds // 3600}H{seconds // 60 % 60}M{seconds % 60}S",
+                    dimension="2d",
+                    definition="hd",
+                    caption="false",
+                    licensedContent=False,
+                ),
+                statistics=VideoStatistics(
+                    viewCount=self._random.randrange(10**6),
+                    likeCount=self._random.randrange(10**4),
+                    commentCount=0,
+                ),
+            )
+            self.videos[video_id] = _refresh_etag(video.to_dict_ignore_none())
+
+            playlist_id = channel["contentDetails"]["relatedPlaylists"]["uploads"]
+            uploads = self.playlist_items[playlist_id]
+            item = PlaylistItem(
+                kind="youtube#playlistItem",
+                id=_fake_id("", 48, playlist_id, video_id),
+                snippet=PlaylistItemSnippet(
+                    publishedAt=published_at,
+                    channelId=channel_id,
+                    title=snippet.title,
+                    description=snippet.description,
+                    channelTitle=snippet.channelTitle,
+                    playlistId=playlist_id,
+                    position=len(uploads),
+                    resourceId=ResourceId(kind="youtube#video", videoId=video_id),
+                ),
+                contentDetails=PlaylistItemContentDetails(
+                    videoId=video_id, videoPublishedAt=published_at
+                ),
+            )
+            uploads.append(_refresh_etag(item.to_dict_ignore_none()))
+            channel["statistics"]["videoCount"] += 1
+            _refresh_etag(channel)
+            return video_id
+
+    def _comment(self, video_id: str, parent_id: Optional[str] = None) -> dict:
+        comment_id = self._next_id("Ug", 26)
+        if parent_id is not None:
+            comment_id = f"{parent_id}.{comment_id}"
+        text = f"Comment {len(self.comments)}"
+        comment = Comment(
+            kind="youtube#comment",
+            id=comment_id,
+            snippet=CommentSnippet(
+                authorDisplayName=f"@user{self._random.randrange(1000)}",
+                channelId=self.videos[video_id]["snippet"]["channelId"],
+                videoId=video_id,
+                textDisplay=text,
+                textOriginal=text,
+                parentId=parent_id,
+                canRate=True,
+                viewerRating="none",
+                likeCount=self._random.randrange(100),
+                publishedAt=self._published_at(),
+            ),
+        )
+        data = _refresh_etag(comment.to_dict_ignore_none())
+        self.comments[comment_id] = data
+        return data
+
+    def add_comment_thread(self, video_id: str, replies: int = 0) -> str:
+        """Add a comment thread to the video, returns its id."""
+        with self._lock:
+            video = self.videos[video_id]
+            top_level = self._comment(video_id)
+            reply_comments = [
+                self._comment(video_id, parent_id=top_level["id"])
+                for _ in range(replies)
+            ]
+            self.replies_by_parent[top_level["id"]].extend(reply_comments)
+            thread = CommentThread(
+                kind="youtube#commentThread",
+                id=top_level["id"],
+                snippet=CommentThreadSnippet(
+                    channelId=video["snippet"]["channelId"],
+                    videoId=video_id,
+                    canReply=True,
+                    totalReplyCount=replies,
+                    isPublic=True,
+                ),
+            )
+            # Comments are already converted, decoding them again is slow.
+            data = thread.to_dict_ignore_none()
+            data["snippet"]["topLevelComment"] = top_level
+            if reply_comments:
+                data["replies"] = {"comments": reply_comments}
+            _refresh_etag(data)
+            self.comment_threads[data["id"]] = data
+            self.threads_by_video[video_id].append(data)
+            self.threads_by_channel[video["snippet"]["channelId"]].append(data)
+            video["statistics"]["commentCount"] += 1 + replies
+            _refresh_etag(video)
+            return data["id"]
+
+
+class FakeYouTubeServer:
+    def __init__(
+        self,
+        dataset: Optional[FakeDataset] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Union[float, Callable[[], float]] = 0.0,
+        error_rate: float = 0.0,
+        error_statuses: Sequence[int] = (500, 503),
+        quota: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        """HTTP server behaving like the YouTube Data API on synthetic data.
+
+        Supported requests:
+            GET channels, videos, playlistItems, commentThreads and comments.
+            POST and PUT resumable video uploads.
+
+        Args:
+            dataset:
+                Data to serve, defaults to FakeDataset().
+            host:
+                Host to listen on.
+            port:
+                Port to listen on, 0 picks a free one.
+            latency:
+                Seconds to wait before each response, or a function returning them.
+            error_rate:
+                Probability for a request to fail with one of error_statuses.
+            error_statuses:
+                Statuses of the injected errors.
+            quota:
+                Quota units of the API key, requests beyond it fail with a
+                quotaExceeded error. No limit if not provided.
+            seed:
+                Seed of the error injection.
+        """
+        self.dataset = dataset or FakeDataset()
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.error_rate = error_rate
+        self.error_statuses = tuple(error_statuses)
+        self.quota = quota
+        self.quota_used = 0
+        self.requests: Counter = Counter()  # (method, resource, status) -> count
+        self._random = random.Random(seed)
+        self._failures: List[int] = []
+        self._uploads: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/youtube/v3/"
+
+    @property
+    def upload_url(self) -> str:
+        return f"http://{self.host}:{self.port}/upload/youtube/v3/"
+
+    def configure(self, client: "Client"):
+        """Point the client at this server."""
+        client.BASE_URL = self.base_url
+        client.BASE_UPLOAD_URL = self.upload_url
+
+    def start(self):
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self._server.fake = self
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = self._thread = None
+
+    def __enter__(self) -> "FakeYouTubeServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def fail_next(self, status: int = 503, count: int = 1):
+        """Make the next requests fail with the status."""
+        with self._lock:
+            self._failures.extend([status] * count)
+
+    def reset_quota(self):
+        with self._lock:
+            self.quota_used = 0
+
+    def handle(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[dict] = None,
+        body: bytes = b"",
+    ) -> tuple:
+        """Process a request.
+
+        Args:
+            method:
+                HTTP method.
+            url:
+                Path with the query string.
+            headers:
+                Request headers, lowercase names.
+            body:
+                Request body.
+
+        Returns:
+            Status, response headers and json body, or None without body.
+        """
+        headers = headers or {}
+        parts = urlsplit(url)
+        params = dict(parse_qsl(parts.query, keep_blank_values=True))
+        path = parts.path
+        is_upload = path.startswith("/upload/youtube/v3/")
+        resource = path.split("/")[-1]
+
+        if "key" not in params and "access_token" not in params:
+            if not headers.get("authorization", "").startswith("Bearer "):
+                return _error(
+                    403,
+                    "The request is missing a valid API key.",
+                    "forbidden",
+                )
+
+        with self._lock:
+            if self._failures:
+                return self._injected_error(self._failures.pop(0))
+            if self.error_rate and self._random.random() < self.error_rate:
+                return self._injected_error(self._random.choice(self.error_statuses))
+            cost = METHOD_QUOTA_COSTS.get(method, 1)
+            if is_upload and method == "POST":
+                cost = QUOTA_COSTS["videos.insert"]
+            elif is_upload:
+                cost = 0  # Charged when the upload starts.
+            if self.quota is not None and self.quota_used + cost > self.quota:
+                return self._injected_error(403)
+            self.quota_used += cost
+
+        if is_upload and method == "POST":
+            return self._start_upload(resource, params, headers, body)
+        if is_upload and method == "PUT":
+            return self._upload_chunk(params, headers, body)
+        if method == "GET" and path.startswith("/youtube/v3/"):
+            if resource in RESOURCES:
+                return self._list(resource, params, headers)
+        return _error(404, f"Not found: {method} {path}", "notFound")
+
+    @staticmethod
+    def _injected_error(status: int) -> tuple:
+        domain, reason = ERROR_REASONS.get(status, ("global", "backendError"))
+        if reason == "quotaExceeded":
+            message = (
+                "The request cannot be completed because you have exceeded your quota."
+            )
+        else:
+            message = f"Injected error {reason}."
+        return _error(status, message, reason, domain)
+
+    def _list(self, resource: str, params: dict, headers: dict) -> tuple:
+        kind, max_results_limit = RESOURCES[resource]
+        if not params.get("part"):
+            return _error(
+                400,
+                "No part parameter, required.",
+                "required",
+                "global",
+            )
+        parts = params["part"].split(",")
+        for part in parts:
+            if part not in RESOURCE_PARTS_MAPPING[resource]:
+                return _error(
+                    400,
+                    f"'{part}' is not a valid part of {resource}.",
+                    "unknownPart",
+                    "youtube.part",
+                )
+
+        try:
+            max_results = int(params.get("maxResults", 5))
+        except ValueError:
+            max_results = -1
+        if not 0 <= max_results <= max_results_limit:
+            return _error(
+                400,
+                f"Invalid value for maxResults, must be 0 to {max_results_limit}.",
+                "invalidParameter",
+                "youtube.parameter",
+            )
+
+        # Uploads add items from other threads, select the page under the lock.
+        with self.dataset._lock:
+            try:
+                items, paged = self._find(resource, params)
+            except _ApiError as e:
+                return e.response
+
+            data = {"kind": f"youtube#{kind}ListResponse"}
+            if paged:
+                offset = 0
+                if params.get("pageToken"):
+                    offset = self._decode_page_token(resource, params["pageToken"])
+                    if offset is None or offset > len(items):
+                        return _error(
+                            400,
+                            "The page token is invalid.",
+                            "invalidPageToken",
+                            "youtube.parameter",
+                        )
+                end = offset + max_results
+                if end < len(items):
+                    data["nextPageToken"] = self._page_token(resource, end)
+                if offset > 0:
+                    data["prevPageToken"] = self._page_token(
+                        resource, max(0, offset - max_results)
+                    )
+                total = len(items)
+                items = items[offset:end]
+            else:
+                total = len(items)
+            data["pageInfo"] = {"totalResults": total, "resultsPerPage": max_results}
+            data["items"] = [self._select_parts(item, parts) for item in items]
+        data["etag"] = etag = _etag(data)
+
+        if headers.get("if-none-match") == etag:
+            return 304, {"ETag": etag}, None
+        return 200, {"ETag": etag}, data
+
+    def _find(self, resource: str, params: dict):
+        """Items matching the filter, and whether they are paged.
+
+        Called with the lock of the dataset held.
+        """
+        dataset = self.dataset
+        if params.get("id"):
+            ids = params["id"].split(",")
+            if len(ids) > MAX_IDS:
+                raise _ApiError(
+                    400,
+                    f"The id parameter must not contain more than {MAX_IDS} ids.",
+                    "invalidParameter",
+                    "youtube.parameter",
+                )
+            by_id = {
+                "channels": dataset.channels,
+                "videos": dataset.videos,
+                "commentThreads": dataset.comment_threads,
+                "comments": dataset.comments,
+                "playlistItems": {
+                    item["id"]: item
+                    for items in dataset.playlist_items.values()
+                    for item in items
+                },
+            }[resource]
+            return [by_id[i] for i in ids if i in by_id], False
+
+        if resource == "channels" and params.get("mine") == "true":
+            return list(dataset.channels.values())[:1], False
+        if resource == "videos" and params.get("chart") == "mostPopular":
+            videos = sorted(
+                dataset.videos.values(),
+                key=lambda v: -v["statistics"]["viewCount"],
+            )
+            return videos, True
+        if resource == "playlistItems" and params.get("playlistId"):
+            if params["playlistId"] not in dataset.playlist_items:
+                raise _ApiError(
+                    404,
+                    "The playlist identified with the request's playlistId parameter cannot be found.",
+                    "playlistNotFound",
+                    "youtube.playlistItem",
+                )
+            return dataset.playlist_items[params["playlistId"]], True
+        if resource == "commentThreads" and params.get("videoId"):
+            if params["videoId"] not in dataset.videos:
+                raise _ApiError(
+                    404,
+                    "The video identified by the videoId parameter could not be found.",
+                    "videoNotFound",
+                    "youtube.commentThread",
+                )
+            return dataset.threads_by_video[params["videoId"]], True
+        if resource == "commentThreads" and params.get("allThreadsRelatedToChannelId"):
+            channel_id = params["allThreadsRelatedToChannelId"]
+            return dataset.threads_by_channel.get(channel_id, []), True
+        if resource == "comments" and params.get("parentId"):
+            return dataset.replies_by_parent.get(params["parentId"], []), True
+        raise _ApiError(
+            400,
+            "No filter selected.",
+            "missingRequiredParameter",
+            "youtube.parameter",
+        )
+
+    @staticmethod
+    def _select_parts(item: dict, parts: List[str]) -> dict:
+        data = {"kind": item["kind"], "etag": item["etag"], "id": item["id"]}
+        for part in parts:
+            if part in item:
+                data[part] = item[part]
+        return data
+
+    @staticmethod
+    def _page_token(resource: str, offset: int) -> str:
+        value = f"{resource}:{offset}".encode("utf-8")
+        return base64.urlsafe_b64encode(value).decode("ascii").rstrip("=")
+
+    @staticmethod
+    def _decode_page_token(resource: str, token: str) -> Optional[int]:
+        try:
+            value = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            name, offset = value.decode("utf-8").split(":")
+            offset = int(offset)
+        except ValueError:
+            return None
+        return offset if name == resource and offset >= 0 else None
+
+    def _start_upload(
+        self, resource: str, params: dict, headers: dict, body: bytes
+    ) -> tuple:
+        if resource != "videos" or params.get("uploadType") != "resumable":
+            return _error(
+                400,
+                "Only resumable video uploads are supported.",
+                "invalidParameter",
+                "youtube.parameter",
+            )
+        try:
+            metadata = json.loads(body) if body else {}
+            size = int(headers.get("x-upload-content-length", -1))
+        except ValueError:
+            return _error(400, "Invalid upload metadata.", "parseError")
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self._uploads[upload_id] = {
+                "metadata": metadata,
+                "size": size,
+                "received": 0,
+            }
+        location = f"{self.upload_url}videos?uploadType=resumable&upload_id={upload_id}"
+        return 200, {"Location": location}, None
+
+    def _upload_chunk(self, params: dict, headers: dict, body: bytes) -> tuple:
+        with self._lock:
+            upload = self._uploads.get(params.get("upload_id"))
+        if upload is None:
+            return _error(404, "The upload session does not exist.", "notFound")
+
+        # Content-Range: bytes begin-end/size, or bytes */size to query the status.
+        content_range = headers.get("content-range", "")
+        try:
+            span, size = content_range.split(" ")[1].split("/")
+            size = int(size)
+            if span != "*":
+                begin, end = (int(value) for value in span.split("-"))
+        except (IndexError, ValueError):
+            return _error(400, "Invalid Content-Range header.", "badContent")
+
+        with self._lock:
+            # Chunks not starting at the stored range are ignored, the client
+            # resumes from the range in the 308 response.
+            if span != "*" and begin == upload["received"]:
+                if end - begin + 1 != len(body):
+                    return _error(400, "Chunk length mismatch.", "badContent")
+                upload["received"] = end + 1
+            received = upload["received"]
+            if received < size:
+                if received == 0:
+                    return 308, {}, None
+                return 308, {"Range": f"bytes=0-{received - 1}"}, None
+            if self._uploads.pop(params["upload_id"], None) is None:
+                return _error(404, "The upload session does not exist.", "notFound")
+
+        channel_id = self.dataset.channel_ids[0]
+        video_id = self.dataset.add_video(
+            channel_id, snippet=upload["metadata"].get("snippet")
+        )
+        return 200, {}, self.dataset.videos[video_id]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _process(self):
+        fake: FakeYouTubeServer = self.server.fake
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        headers = {name.lower(): value for name, value in self.headers.items()}
+        status, response_headers, data = fake.handle(
+            self.command, self.path, headers, body
+        )
+
+        latency = fake.latency() if callable(fake.latency) else fake.latency
+        if latency > 0:
+            time.sleep(latency)
+
+        content = json.dumps(data).encode("utf-8") if data is not None else b""
+        self.send_response(status)
+        for name, value in response_headers.items():
+            self.send_header(name, value)
+        if content:
+            self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+        resource = urlsplit(self.path).path.split("/")[-1]
+        with fake._lock:
+            fake.requests[(self.command, resource, status)] += 1
+
+    do_GET = do_POST = do_PUT = do_DELETE = _process
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Fake YouTube Data API server.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--channels", type=int, default=5)
+    parser.add_argument("--videos", type=int, default=50, help="Videos per channel.")
+    parser.add_argument(
+        "--comments", type=int, default=10, help="Comment threads per video."
+    )
+    parser.add_argument("--replies", type=int, default=2, help="Replies per thread.")
+    parser.add_argument("--latency", type=float, default=0.0, help="In seconds.")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--quota", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    dataset = FakeDataset(
+        channels=args.channels,
+        videos_per_channel=args.videos,
+        comments_per_video=args.comments,
+        replies_per_comment=args.replies,
+        seed=args.seed,
+    )
+    server = FakeYouTubeServer(
+        dataset,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        quota=args.quota,
+        seed=args.seed,
+    )
+    server.start()
+    print(f"BASE_URL={server.base_url}")
+    print(f"BASE_UPLOAD_URL={server.upload_url}")
+    print(f"Channels: {','.join(dataset.channel_ids)}")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
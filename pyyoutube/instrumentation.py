@@ -0,0 +1,376 @@
+"""
+Instrumentation of the client calls: hooks, timings and counters.
+
+A call goes through these phases, each one timed:
+    send: Until the response headers arrive, with connection and server time.
+    download: Reading the response body.
+    parse: Decoding the json body, by Client.parse_response.
+    decode: Building the model, by Model.from_dict.
+
+Hooks get the Call at these events:
+    request: Before sending.
+    response: After the body is downloaded, or the sending failed.
+    parse: After the body is parsed.
+    decode: After the model is built.
+
+Nothing is done for clients without instrumentation.
+
+Usage:
+    instrumentation = Instrumentation()
+    instrumentation.add_hook("response", lambda call: print(call.status, call.timings))
+    client = Client(api_key="KEY", instrumentation=instrumentation)
+    client.videos.list(video_id="VIDEO_ID")
+    print(instrumentation.to_prometheus())
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from pyyoutube.error import ErrorCode, ErrorMessage, PyYouTubeException
+
+if TYPE_CHECKING:
+    from requests import Response  # pragma: no cover
+
+EVENTS = ("request", "response", "parse", "decode")
+PHASES = ("send", "download", "parse", "decode")
+
+# Upper bounds in seconds of the timing histograms, as the Prometheus clients.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Call whose body was parsed last in this context. Decoding that same body, and
+# no other data, is timed as the decode phase of the call.
+current_call: ContextVar[Optional["Call"]] = ContextVar(
+    "pyyoutube_current_call", default=None
+)
+
+Hook = Callable[["Call"], None]
+
+
+def endpoint_of(path: str) -> str:
+    """Endpoint name of a request path or url, like videos."""
+    if path.startswith("http"):
+        path = urlsplit(path).path
+    return path.rstrip("/").rsplit("/", 1)[-1]
+
+
+@dataclass
+class Call:
+    """One HTTP call of a client, filled as it goes through the phases."""
+
+    instrumentation: "Instrumentation" = field(repr=False)
+    method: str
+    endpoint: str
+    url: str
+    params: Optional[dict] = field(default=None, repr=False)
+    started_ns: int = 0  # Wall clock, for tracing.
+    status: Optional[int] = None
+    reason: Optional[str] = None  # Error reason, from the body or the exception.
+    error: Optional[BaseException] = None
+    model: Optional[str] = None  # Name of the decoded model.
+    timings: Dict[str, float] = field(default_factory=dict)
+    response: Optional["Response"] = field(default=None, repr=False)
+    body: Any = field(default=None, repr=False)  # Parsed json, until decoded.
+    context: Dict[str, Any] = field(default_factory=dict, repr=False)  # For hooks.
+
+
+class Histogram:
+    def __init__(self, buckets: Tuple[float, ...]) -> None:
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last one for +Inf.
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.max = max(self.max, value)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+class Instrumentation:
+    def __init__(
+        self,
+        hooks: Optional[Dict[str, List[Hook]]] = None,
+        buckets: Tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> None:
+        """Hooks and metrics for the calls of clients.
+
+        Args:
+            hooks:
+                Functions called with the Call, by event.
+            buckets:
+                Upper bounds in seconds of the timing histograms.
+        """
+        self.hooks: Dict[str, List[Hook]] = {event: [] for event in EVENTS}
+        for event, event_hooks in (hooks or {}).items():
+            for hook in event_hooks:
+                self.add_hook(event, hook)
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._requests: Counter = Counter()  # (method, endpoint, status)
+        self._errors: Counter = Counter()  # (endpoint, reason)
+        self._phases: Dict[Tuple[str, str], Histogram] = {}
+
+    def add_hook(self, event: str, hook: Hook):
+        """Call the hook with the Call at the event.
+
+        Raises:
+            PyYouTubeException: Unknown event.
+        """
+        if event not in self.hooks:
+            raise PyYouTubeException(
+                ErrorMessage(
+                    status_code=ErrorCode.INVALID_PARAMS,
+                    message=f"Event must be one of {','.join(EVENTS)}, not {event}",
+                )
+            )
+        self.hooks[event].append(hook)
+
+    def _emit(self, event: str, call: Call):
+        for hook in self.hooks[event]:
+            hook(call)
+
+    def _observe(self, call: Call, phase: str, seconds: float):
+        call.timings[phase] = seconds
+        key = (call.endpoint, phase)
+        with self._lock:
+            histogram = self._phases.get(key)
+            if histogram is None:
+                histogram = self._phases[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    def _count_error(self, call: Call, reason: str):
+        call.reason = reason
+        with self._lock:
+            self._errors[(call.endpoint, reason)] += 1
+
+    def wrap_send(
+        self, send: Callable[[], "Response"], method: str, path: str, url: str, params
+    ) -> Callable[[], "Response"]:
+        """Wrap the function sending a request, to time and count its call."""
+
+        def instrumented_send() -> "Response":
+            call = Call(
+                instrumentation=self,
+                method=method.upper(),
+                endpoint=endpoint_of(path),
+                url=url,
+                params=params,
+            )
+            self._emit("request", call)
+            call.started_ns = time.time_ns()
+            start = time.perf_counter()
+            try:
+                response = send()
+            except Exception as e:
+                call.error = e
+                self._observe(call, "send", time.perf_counter() - start)
+                with self._lock:
+                    self._requests[(call.method, call.endpoint, "error")] += 1
+                self._count_error(call, type(e).__name__)
+                self._emit("response", call)
+                raise
+            total = time.perf_counter() - start
+            # Requests measures the time until the headers are parsed.
+            sent = min(response.elapsed.total_seconds(), total)
+            self._observe(call, "send", sent)
+            self._observe(call, "download", total - sent)
+            call.status = response.status_code
+            call.response = response
+            with self._lock:
+                self._requests[(call.method, call.endpoint, call.status)] += 1
+            response._instrumented_call = call
+            self._emit("response", call)
+            return response
+
+        return instrumented_send
+
+    def parse(self, call: Call, parse: Callable[[], Any]) -> Any:
+        """Time the json parsing of the call body, and count its error reason."""
+        start = time.perf_counter()
+        try:
+            data = parse()
+        except ValueError as e:
+            self._observe(call, "parse", time.perf_counter() - start)
+            call.error = e
+            self._count_error(call, "invalidJson")
+            self._emit("parse", call)
+            raise
+        self._observe(call, "parse", time.perf_counter() - start)
+
+        error = data.get("error") if isinstance(data, dict) else None
+        if error is not None:
+            reason = "unknown"
+            if isinstance(error, dict):
+                errors = error.get("errors") or [{}]
+                reason = errors[0].get("reason") or error.get("status") or reason
+            elif isinstance(error, str):
+                reason = error
+            self._count_error(call, reason)
+        else:
+            call.body = data
+            current_call.set(call)
+        self._emit("parse", call)
+        return data
+
+    def decode(self, call: Call, model: type, decode: Callable[[], Any]) -> Any:
+        """Time the model decoding of the call body."""
+        call.body = None
+        start = time.perf_counter()
+        try:
+            return decode()
+        finally:
+            call.model = model.__name__
+            self._observe(call, "decode", time.perf_counter() - start)
+            self._emit("decode", call)
+
+    def metrics(self) -> dict:
+        """Counters and timings.
+
+        Returns:
+            requests: Count by (method, endpoint, status).
+            errors: Count by (endpoint, reason).
+            phases: By (endpoint, phase), count, sum, avg and max seconds.
+        """
+        with self._lock:
+            return {
+                "requests": dict(self._requests),
+                "errors": dict(self._errors),
+                "phases": {
+                    key: {
+                        "count": histogram.count,
+                        "sum": histogram.sum,
+                        "avg": histogram.sum / histogram.count,
+                        "max": histogram.max,
+                    }
+                    for key, histogram in self._phases.items()
+                },
+            }
+
+    def reset(self):
+        with self._lock:
+            self._requests.clear()
+            self._errors.clear()
+            self._phases.clear()
+
+    def to_prometheus(self, namespace: str = "pyyoutube") -> str:
+        """Metrics in the Prometheus text exposition format."""
+        lines = [
+            f"# HELP {namespace}_requests_total HTTP calls by endpoint and status.",
+            f"# TYPE {namespace}_requests_total counter",
+        ]
+        with self._lock:
+            for (method, endpoint, status), count in sorted(
+                self._requests.items(), key=str
+            ):
+                labels = _labels(method=method, endpoint=endpoint, status=status)
+                lines.append(f"{namespace}_requests_total{{{labels}}} {count}")
+
+            lines.append(
+                f"# HELP {namespace}_errors_total Errors by endpoint and reason."
+            )
+            lines.append(f"# TYPE {namespace}_errors_total counter")
+            for (endpoint, reason), count in sorted(self._errors.items()):
+                labels = _labels(endpoint=endpoint, reason=reason)
+                lines.append(f"{namespace}_errors_total{{{labels}}} {count}")
+
+            name = f"{namespace}_phase_seconds"
+            lines.append(f"# HELP {name} Time of the call phases.")
+            lines.append(f"# TYPE {name} histogram")
+            for (endpoint, phase), histogram in sorted(self._phases.items()):
+                labels = _labels(endpoint=endpoint, phase=phase)
+                cumulative = 0
+                bounds = [repr(float(bound)) for bound in histogram.buckets] + ["+Inf"]
+                for bound, count in zip(bounds, histogram.counts):
+                    cumulative += count
+                    lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+
+class OpenTelemetryHooks:
+    def __init__(self, tracer=None) -> None:
+        """Hooks recording the calls as OpenTelemetry spans.
+
+        A client span covers sending and downloading, with child spans for
+        parsing and decoding. Requires the opentelemetry-api package.
+
+        Args:
+            tracer:
+                Tracer creating the spans, defaults to the global pyyoutube tracer.
+        """
+        from opentelemetry import trace
+
+        self._trace = trace
+        self.tracer = tracer or trace.get_tracer("pyyoutube")
+
+    def install(self, instrumentation: Instrumentation) -> "OpenTelemetryHooks":
+        instrumentation.add_hook("response", self.on_response)
+        instrumentation.add_hook("parse", self.on_parse)
+        instrumentation.add_hook("decode", self.on_decode)
+        return self
+
+    def _set_error(self, span, call: Call):
+        if call.error is not None:
+            span.record_exception(call.error)
+        span.set_attribute("error.type", call.reason)
+        span.set_status(self._trace.Status(self._trace.StatusCode.ERROR))
+
+    def on_response(self, call: Call):
+        end = time.time_ns()
+        attributes = {
+            "http.request.method": call.method,
+            "url.full": call.url,
+            "pyyoutube.endpoint": call.endpoint,
+        }
+        if call.status is not None:
+            attributes["http.response.status_code"] = call.status
+        span = self.tracer.start_span(
+            f"{call.method} {call.endpoint}",
+            kind=self._trace.SpanKind.CLIENT,
+            attributes=attributes,
+            start_time=call.started_ns,
+        )
+        if call.error is not None:
+            self._set_error(span, call)
+        span.end(end_time=end)
+        call.context["otel_span"] = span
+
+    def _child_span(self, call: Call, name: str, phase: str, **attributes):
+        end = time.time_ns()
+        parent = call.context.get("otel_span")
+        span = self.tracer.start_span(
+            name,
+            context=self._trace.set_span_in_context(parent) if parent else None,
+            attributes=attributes,
+            start_time=end - int(call.timings[phase] * 1e9),
+        )
+        return span, end
+
+    def on_parse(self, call: Call):
+        span, end = self._child_span(call, "parse", "parse")
+        if call.reason is not None:
+            self._set_error(span, call)
+        span.end(end_time=end)
+
+    def on_decode(self, call: Call):
+        span, end = self._child_span(
+            call, f"decode {call.model}", "decode", **{"pyyoutube.model": call.model}
+        )
+        span.end(end_time=end)
@@ -0,0 +1,179 @@
+"""
+Loaders merging concurrent single id lookups into batched list requests.
+
+Usage:
+    video = client.loaders.video.load("VIDEO_ID")
+    channel = await client.loaders.channel.load_async("CHANNEL_ID")
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Union, TYPE_CHECKING
+
+from pyyoutube.utils.constants import MAX_IDS_PER_REQUEST
+
+if TYPE_CHECKING:
+    from pyyoutube import Client  # pragma: no cover
+
+
+class BatchLoader:
+    def __init__(
+        self,
+        fetch: Callable[[List[str]], Iterable[Any]],
+        max_batch_size: int = MAX_IDS_PER_REQUEST,
+        window_ms: float = 2,
+        max_workers: int = 4,
+    ) -> None:
+        """Collect the ids requested within a short window and fetch them together.
+
+        A batch is fetched ``window_ms`` after its first id was requested, or as
+        soon as it holds ``max_batch_size`` ids.
+
+        Args:
+            fetch:
+                Function getting the items of a list of ids. Items need an ``id``.
+            max_batch_size:
+                Maximum ids in a fetch.
+            window_ms:
+                Milliseconds to wait for other ids before fetching.
+            max_workers:
+                Number of fetches running at the same time.
+        """
+        self.fetch = fetch
+        self.max_batch_size = max_batch_size
+        self.window = window_ms / 1000
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="pyyoutube-loader"
+        )
+        self._lock = threading.Lock()
+        self._pending: Dict[str, List[Future]] = {}
+        self._timer: Optional[threading.Timer] = None
+        self.batches = 0
+
+    def submit(self, item_id: str) -> Future:
+        """Request an item.
+
+        Returns:
+            Future of the item, resolved with None if it does not exist.
+        """
+        future = Future()
+        with self._lock:
+            self._pending.setdefault(item_id, []).append(future)
+            if len(self._pending) >= self.max_batch_size:
+                batch = self._take()
+                self._executor.submit(self._run, batch)
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window, self._flush)
+                self._timer.daemon = True
+                self._timer.start()
+        return future
+
+    def _take(self) -> Dict[str, List[Future]]:
+        # Called with the lock held.
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, {}
+        return batch
+
+    def _flush(self):
+        with self._lock:
+            batch = self._take()
+        if batch:
+            self._run(batch)
+
+    def _run(self, batch: Dict[str, List[Future]]):
+        self.batches += 1
+        try:
+            items = {item.id: item for item in self.fetch(list(batch))}
+        except BaseException as e:
+            for futures in batch.values():
+                for future in futures:
+                    future.set_exception(e)
+            return
+        for item_id, futures in batch.items():
+            for future in futures:
+                future.set_result(items.get(item_id))
+
+    def load(self, item_id: str, timeout: Optional[float] = None) -> Any:
+        """Get an item, batched with the concurrent loads.
+
+        Returns:
+            The item, or None if it does not exist.
+
+        Raises:
+            PyYouTubeException: The batch request failed.
+        """
+        return self.submit(item_id).result(timeout)
+
+    def load_many(self, item_ids: Iterable[str]) -> List[Any]:
+        """Get items in the order of the ids, None for the missing ones."""
+        futures = [self.submit(item_id) for item_id in item_ids]
+        return [future.result() for future in futures]
+
+    async def load_async(self, item_id: str) -> Any:
+        """Coroutine version of ``load``."""
+        return await asyncio.wrap_future(self.submit(item_id))
+
+
+class Loaders:
+    def __init__(
+        self,
+        client: "Client",
+        parts: Optional[Dict[str, Union[str, list, tuple, set]]] = None,
+        window_ms: float = 2,
+    ) -> None:
+        """Batch loaders for the video, channel, playlist and comment resources.
+
+        Args:
+            client:
+                Client instance.
+            parts:
+                Parts to get for each loader name, defaults to all the parts.
+            window_ms:
+                Milliseconds to wait for other ids before fetching.
+        """
+        self.client = client
+        self.parts = parts or {}
+        self.window_ms = window_ms
+        self._loaders: Dict[str, BatchLoader] = {}
+        self._lock = threading.Lock()
+
+    def _fetch_videos(self, ids: List[str]):
+        parts = self.parts.get("video")
+        return self.client.videos.list(parts=parts, video_id=ids).items or []
+
+    def _fetch_channels(self, ids: List[str]):
+        parts = self.parts.get("channel")
+        return self.client.channels.list(parts=parts, channel_id=ids).items or []
+
+    def _fetch_playlists(self, ids: List[str]):
+        parts = self.parts.get("playlist")
+        return self.client.playlists.list(parts=parts, playlist_id=ids).items or []
+
+    def _fetch_comments(self, ids: List[str]):
+        parts = self.parts.get("comment")
+        return self.client.comments.list(parts=parts, comment_id=ids).items or []
+
+    def _get(self, name: str, fetch: Callable[[List[str]], Iterable[Any]]):
+        with self._lock:
+            if name not in self._loaders:
+                self._loaders[name] = BatchLoader(fetch, window_ms=self.window_ms)
+            return self._loaders[name]
+
+    @property
+    def video(self) -> BatchLoader:
+        return self._get("video", self._fetch_videos)
+
+    @property
+    def channel(self) -> BatchLoader:
+        return self._get("channel", self._fetch_channels)
+
+    @property
+    def playlist(self) -> BatchLoader:
+        return self._get("playlist", self._fetch_playlists)
+
+    @property
+    def comment(self) -> BatchLoader:
+        return self._get("comment", self._fetch_comments)
@@ -2,15 +2,117 @@
 Media object to upload.
 """
 
+import hashlib
 import mimetypes
 import os
 from typing import IO, Optional, Tuple
 
 from requests import Response
 
-from pyyoutube.error import PyYouTubeException, ErrorMessage, ErrorCode
+from pyyoutube.error import (
+    PyYouTubeException,
+    ErrorMessage,
+    ErrorCode,
+    error_from_response,
+)
 
 DEFAULT_CHUNK_SIZE = 20 * 1024 * 1024
+CHECKSUM_ALGORITHMS = ("md5", "sha256", "crc32c")
+
+
+def _crc32c_table():
+    table = []
+    for i in range(256):
+        crc = i
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0x82F63B78 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+_CRC32C_TABLE = None
+
+
+def _crc32c_extend_python(crc: int, data: bytes) -> int:
+    """Pure python CRC32C, a byte at a time: about 6 MB/s."""
+    global _CRC32C_TABLE
+    if _CRC32C_TABLE is None:
+        _CRC32C_TABLE = _crc32c_table()
+    table = _CRC32C_TABLE
+    crc ^= 0xFFFFFFFF
+    for byte in data:
+        crc = table[(crc ^ byte) & 0xFF] ^ (crc >> 8)
+    return crc ^ 0xFFFFFFFF
+
+
+def _find_crc32c_extend():
+    """Fastest CRC32C available, from the google-crc32c or crc32c C extensions."""
+    try:
+        import google_crc32c
+    except ImportError:
+        pass
+    else:
+        # Without its C extension, google-crc32c is pure python as well.
+        if google_crc32c.implementation == "c":
+            return google_crc32c.extend
+    try:
+        import crc32c
+    except ImportError:
+        return _crc32c_extend_python
+    return lambda crc, data: crc32c.crc32c(data, crc)
+
+
+_crc32c_extend = None
+
+
+class Crc32c:
+    """CRC32C (Castagnoli) hash with the hashlib interface.
+
+    Uses the C implementation of the google-crc32c or crc32c package if one is
+    installed, a much slower pure python one otherwise.
+    """
+
+    name = "crc32c"
+    digest_size = 4
+
+    def __init__(self, data: bytes = b"") -> None:
+        global _crc32c_extend
+        if _crc32c_extend is None:
+            _crc32c_extend = _find_crc32c_extend()
+        self._crc = 0
+        if data:
+            self.update(data)
+
+    def update(self, data: bytes):
+        self._crc = _crc32c_extend(self._crc, data)
+
+    def digest(self) -> bytes:
+        return self._crc.to_bytes(4, "big")
+
+    def hexdigest(self) -> str:
+        return self.digest().hex()
+
+
+def new_checksum(algorithm: str):
+    """Create a hash object for the checksum algorithm.
+
+    Args:
+        algorithm:
+            One of md5, sha256 or crc32c.
+
+    Returns:
+        Hash object with update/digest/hexdigest methods.
+    """
+    if algorithm == "crc32c":
+        return Crc32c()
+    if algorithm in CHECKSUM_ALGORITHMS:
+        return hashlib.new(algorithm)
+    raise PyYouTubeException(
+        ErrorMessage(
+            status_code=ErrorCode.INVALID_PARAMS,
+            message=f"Checksum algorithm must be one of {','.join(CHECKSUM_ALGORITHMS)}",
+        )
+    )
 
 
 class Media:
@@ -20,6 +122,7 @@ class Media:
         mimetype: Optional[str] = None,
         filename: Optional[str] = None,
         chunk_size: int = DEFAULT_CHUNK_SIZE,
+        checksum: Optional[str] = None,
     ) -> None:
         """Media representing a file to upload with metadata.
 
@@ -34,6 +137,12 @@ class Media:
             chunk_size:
                 File will be uploaded in chunks of this many bytes. Only
                 used if resumable=True.
+            checksum:
+                Hash algorithm to compute while the chunks are read for upload.
+                Accepted values: md5, sha256, crc32c. md5 and sha256 cost a few
+                milliseconds per MB. crc32c needs the google-crc32c or crc32c
+                package to be as fast, its pure python fallback runs at about
+                6 MB/s, minutes of CPU for large videos.
         """
 
         if fd is not None:
@@ -60,6 +169,10 @@ class Media:
         self.fd.seek(0, os.SEEK_END)
         self.size = self.fd.tell()
 
+        self.checksum = checksum
+        self._hasher = new_checksum(checksum) if checksum is not None else None
+        self._hashed_size = 0  # Bytes already added to the hash.
+
     def get_bytes(self, begin: int, length: int) -> bytes:
         """Get bytes from the media.
 
@@ -74,7 +187,47 @@ class Media:
           first.
         """
         self.fd.seek(begin)
-        return self.fd.read(length)
+        data = self.fd.read(length)
+        if self._hasher is not None:
+            self._update_checksum(begin, data)
+        return data
+
+    def _update_checksum(self, begin: int, data: bytes):
+        """Add the not yet hashed part of the chunk to the hash.
+
+        Ranges sent again after a 308 response are already hashed, so only
+        the bytes beyond the hashed offset are used.
+        """
+        if begin > self._hashed_size:
+            # Never happens with sequential uploads, read the skipped bytes.
+            self.fd.seek(self._hashed_size)
+            gap = self.fd.read(begin - self._hashed_size)
+            self.fd.seek(begin + len(data))
+            self._hash(gap)
+        end = begin + len(data)
+        if end > self._hashed_size:
+            self._hash(data[self._hashed_size - begin :])
+
+    def _hash(self, data):
+        self._hashed_size += len(data)
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self._hasher.update(data)
+
+    @property
+    def checksum_complete(self) -> bool:
+        """Whether all bytes of the media have been hashed."""
+        return self._hasher is not None and self._hashed_size >= self.size
+
+    def hexdigest(self) -> Optional[str]:
+        """Checksum of the media as hex string.
+
+        Returns:
+            The hex digest, None if checksum not enabled or the media has not been fully read.
+        """
+        if not self.checksum_complete:
+            return None
+        return self._hasher.hexdigest()
 
 
 class MediaUploadProgress:
@@ -164,7 +317,7 @@ class MediaUpload:
             if resp.status_code == 200 and "location" in resp.headers:
                 self.resumable_uri = resp.headers["location"]
             else:
-                raise PyYouTubeException(resp)
+                raise error_from_response(resp)
 
         data = self.media.get_bytes(self.resumable_progress, self.media.chunk_size)
 
@@ -215,7 +368,7 @@ class MediaUpload:
             if "location" in resp.headers:
                 self.resumable_uri = resp.headers["location"]
         else:
-            raise PyYouTubeException(resp)
+            raise error_from_response(resp)
 
         return (
             MediaUploadProgress(self.resumable_progress, self.media.size),
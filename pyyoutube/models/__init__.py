@@ -1,20 +1,197 @@
-from .activity import *  # noqa
-from .auth import AccessToken, UserProfile
-from .caption import *  # noqa
-from .category import *  # noqa
-from .channel import *  # noqa
-from .channel_banner import *  # noqa
-from .channel_section import *  # noqa
-from .comment import *  # noqa
-from .comment_thread import *  # noqa
-from .common import *  # noqa
-from .i18n import *  # noqa
-from .member import *  # noqa
-from .memberships_level import *  # noqa
-from .playlist_item import *  # noqa
-from .playlist import *  # noqa
-from .search_result import *  # noqa
-from .subscription import *  # noqa
-from .video_abuse_report_reason import *  # noqa
-from .video import *  # noqa
-from .watermark import *  # noqa
+"""
+Models for the YouTube resources. They are imported on first access.
+"""
+
+from typing import TYPE_CHECKING
+
+from pyyoutube.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    ".activity": (
+        "ActivityContentDetailsUpload",
+        "ActivityContentDetailsLike",
+        "ActivityContentDetailsFavorite",
+        "ActivityContentDetailsComment",
+        "ActivityContentDetailsSubscription",
+        "ActivityContentDetailsPlaylistItem",
+        "ActivityContentDetailsRecommendation",
+        "ActivityContentDetailsBulletin",
+        "ActivityContentDetailsSocial",
+        "ActivityContentDetailsChannelItem",
+        "ActivitySnippet",
+        "ActivityContentDetails",
+        "Activity",
+        "ActivityListResponse",
+    ),
+    ".auth": (
+        "AccessToken",
+        "UserProfile",
+    ),
+    ".base": ("BaseModel",),
+    ".caption": (
+        "CaptionSnippet",
+        "Caption",
+        "CaptionListResponse",
+    ),
+    ".category": (
+        "CategorySnippet",
+        "VideoCategorySnippet",
+        "VideoCategory",
+        "VideoCategoryListResponse",
+    ),
+    ".channel": (
+        "RelatedPlaylists",
+        "ChannelBrandingSettingChannel",
+        "ChannelBrandingSettingImage",
+        "ChannelSnippet",
+        "ChannelContentDetails",
+        "ChannelStatistics",
+        "ChannelTopicDetails",
+        "ChannelStatus",
+        "ChannelBrandingSetting",
+        "ChannelAuditDetails",
+        "ChannelContentOwnerDetails",
+        "Channel",
+        "ChannelListResponse",
+    ),
+    ".channel_banner": ("ChannelBanner",),
+    ".channel_section": (
+        "ChannelSectionSnippet",
+        "ChannelSectionContentDetails",
+        "ChannelSection",
+        "ChannelSectionResponse",
+        "ChannelSectionListResponse",
+    ),
+    ".comment": (
+        "CommentSnippetAuthorChannelId",
+        "CommentSnippet",
+        "Comment",
+        "CommentListResponse",
+    ),
+    ".comment_thread": (
+        "CommentThreadSnippet",
+        "CommentThreadReplies",
+        "CommentThread",
+        "CommentThreadListResponse",
+    ),
+    ".common": (
+        "Thumbnail",
+        "Thumbnails",
+        "Topic",
+        "BaseTopicDetails",
+        "Localized",
+        "PageInfo",
+        "BaseApiResponse",
+        "BaseResource",
+        "ResourceId",
+        "Player",
+    ),
+    ".i18n": (
+        "I18nRegionSnippet",
+        "I18nRegion",
+        "I18nRegionListResponse",
+        "I18nLanguageSnippet",
+        "I18nLanguage",
+        "I18nLanguageListResponse",
+    ),
+    ".member": (
+        "MemberSnippetMemberDetails",
+        "MemberSnippetMembershipsDuration",
+        "MemberSnippetMembershipsDurationAtLevel",
+        "MemberSnippetMembershipsDetails",
+        "MemberSnippet",
+        "Member",
+        "MemberListResponse",
+    ),
+    ".memberships_level": (
+        "MembershipLevelSnippetLevelDetails",
+        "MembershipsLevelSnippet",
+        "MembershipsLevel",
+        "MembershipsLevelListResponse",
+    ),
+    ".mixins": (
+        "DatetimeTimeMixin",
+        "PublishedAtMixin",
+    ),
+    ".playlist_item": (
+        "PlaylistItemContentDetails",
+        "PlaylistItemSnippet",
+        "PlaylistItemStatus",
+        "PlaylistItem",
+        "PlaylistItemListResponse",
+    ),
+    ".playlist": (
+        "PlaylistContentDetails",
+        "PlaylistSnippet",
+        "PlaylistStatus",
+        "Playlist",
+        "PlaylistListResponse",
+    ),
+    ".search_result": (
+        "SearchResultSnippet",
+        "SearchResultId",
+        "SearchResult",
+        "SearchListResponse",
+    ),
+    ".subscription": (
+        "SubscriptionSnippet",
+        "SubscriptionContentDetails",
+        "SubscriptionSubscriberSnippet",
+        "Subscription",
+        "SubscriptionListResponse",
+    ),
+    ".video_abuse_report_reason": (
+        "SecondaryReason",
+        "VideoAbuseReportReasonSnippet",
+        "VideoAbuseReportReason",
+        "VideoAbuseReportReasonListResponse",
+    ),
+    ".video": (
+        "RegionRestriction",
+        "ContentRating",
+        "VideoContentDetails",
+        "VideoTopicDetails",
+        "VideoSnippet",
+        "VideoStatistics",
+        "VideoStatus",
+        "VideoRecordingDetails",
+        "VideoLiveStreamingDetails",
+        "PaidProductPlacementDetail",
+        "Video",
+        "VideoListResponse",
+        "VideoReportAbuse",
+        "VideoRatingItem",
+        "VideoGetRatingResponse",
+    ),
+    ".watermark": (
+        "WatermarkTiming",
+        "WatermarkPosition",
+        "Watermark",
+    ),
+}
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .activity import *  # noqa
+    from .auth import AccessToken, UserProfile  # noqa
+    from .base import BaseModel  # noqa
+    from .caption import *  # noqa
+    from .category import *  # noqa
+    from .channel import *  # noqa
+    from .channel_banner import *  # noqa
+    from .channel_section import *  # noqa
+    from .comment import *  # noqa
+    from .comment_thread import *  # noqa
+    from .common import *  # noqa
+    from .i18n import *  # noqa
+    from .member import *  # noqa
+    from .memberships_level import *  # noqa
+    from .mixins import DatetimeTimeMixin, PublishedAtMixin  # noqa
+    from .playlist_item import *  # noqa
+    from .playlist import *  # noqa
+    from .search_result import *  # noqa
+    from .subscription import *  # noqa
+    from .video_abuse_report_reason import *  # noqa
+    from .video import *  # noqa
+    from .watermark import *  # noqa
@@ -7,7 +7,7 @@ from typing import List, Optional
 
 from .base import BaseModel
 from .common import BaseApiResponse, BaseResource, ResourceId, Thumbnails
-from .mixins import DatetimeTimeMixin
+from .mixins import PublishedAtMixin
 
 
 @dataclass
@@ -129,7 +129,7 @@ class ActivityContentDetailsChannelItem(BaseModel):
 
 
 @dataclass
-class ActivitySnippet(BaseModel, DatetimeTimeMixin):
+class ActivitySnippet(BaseModel, PublishedAtMixin):
     """
     A class representing the activity snippet resource info.
 
@@ -4,6 +4,8 @@ from typing import Type, TypeVar
 from dataclasses_json import DataClassJsonMixin
 from dataclasses_json.core import Json, _decode_dataclass
 
+from pyyoutube.instrumentation import current_call
+
 A = TypeVar("A", bound="DataClassJsonMixin")
 
 
@@ -15,7 +17,14 @@ class BaseModel(DataClassJsonMixin):
     def from_dict(cls: Type[A], kvs: Json, *, infer_missing=False) -> A:
         # save original data for lookup
         cls._json = kvs
-        return _decode_dataclass(cls, kvs, infer_missing)
+        call = current_call.get()
+        if call is None or call.body is not kvs:
+            return _decode_dataclass(cls, kvs, infer_missing)
+        # Decoding the body of an instrumented call.
+        current_call.set(None)
+        return call.instrumentation.decode(
+            call, cls, lambda: _decode_dataclass(cls, kvs, infer_missing)
+        )
 
     def to_dict_ignore_none(self):
         return asdict(
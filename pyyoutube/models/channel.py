@@ -15,7 +15,7 @@ from .common import (
     BaseApiResponse,
     Localized,
 )
-from .mixins import DatetimeTimeMixin
+from .mixins import PublishedAtMixin
 
 
 @dataclass
@@ -62,7 +62,7 @@ class ChannelBrandingSettingImage(BaseModel):
 
 
 @dataclass
-class ChannelSnippet(BaseModel, DatetimeTimeMixin):
+class ChannelSnippet(BaseModel, PublishedAtMixin):
     """
     A class representing the channel snippet info.
 
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 from .base import BaseModel
-from .mixins import DatetimeTimeMixin
+from .mixins import PublishedAtMixin
 from .common import BaseApiResponse, BaseResource
 
 
@@ -22,7 +22,7 @@ class CommentSnippetAuthorChannelId(BaseModel):
 
 
 @dataclass
-class CommentSnippet(BaseModel, DatetimeTimeMixin):
+class CommentSnippet(BaseModel, PublishedAtMixin):
     """
     A class representing comment's snippet info.
 
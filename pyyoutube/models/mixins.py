@@ -3,15 +3,30 @@ These are some mixin for models
 """
 
 import datetime
+import functools
 from typing import Optional
 
-import isodate
 from isodate.isoerror import ISO8601Error
 
 from pyyoutube.error import ErrorCode, ErrorMessage, PyYouTubeException
+from pyyoutube.utils.iso8601 import parse_datetime
+
+
+class cached_property(functools.cached_property):
+    """Property computed once and stored on the instance.
+
+    Instances without ``__dict__``, like slotted models, compute it on each access.
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is not None and not hasattr(instance, "__dict__"):
+            return self.func(instance)
+        return super().__get__(instance, owner)
 
 
 class DatetimeTimeMixin:
+    __slots__ = ()
+
     @staticmethod
     def string_to_datetime(dt_str: Optional[str]) -> Optional[datetime.datetime]:
         """
@@ -22,10 +37,19 @@ class DatetimeTimeMixin:
         if not dt_str:
             return None
         try:
-            r = isodate.parse_datetime(dt_str)
+            r = parse_datetime(dt_str)
         except ISO8601Error as e:
             raise PyYouTubeException(
                 ErrorMessage(status_code=ErrorCode.INVALID_PARAMS, message=e.args[0])
             )
         else:
             return r
+
+
+class PublishedAtMixin(DatetimeTimeMixin):
+    __slots__ = ()
+
+    @cached_property
+    def published_at_dt(self) -> Optional[datetime.datetime]:
+        """publishedAt as datetime, parsed once."""
+        return self.string_to_datetime(self.publishedAt)
@@ -7,7 +7,7 @@ from typing import Optional, List
 
 from .base import BaseModel
 from .common import BaseApiResponse, BaseResource, Localized, Player, Thumbnails
-from .mixins import DatetimeTimeMixin
+from .mixins import PublishedAtMixin
 
 
 @dataclass
@@ -22,7 +22,7 @@ class PlaylistContentDetails(BaseModel):
 
 
 @dataclass
-class PlaylistSnippet(BaseModel, DatetimeTimeMixin):
+class PlaylistSnippet(BaseModel, PublishedAtMixin):
     """
     A class representing the playlist snippet info.
 
@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional
 
 from .base import BaseModel
-from .mixins import DatetimeTimeMixin
+from .mixins import DatetimeTimeMixin, PublishedAtMixin
 from .common import BaseApiResponse, BaseResource, ResourceId, Thumbnails
 
 
@@ -26,7 +26,7 @@ class PlaylistItemContentDetails(BaseModel, DatetimeTimeMixin):
 
 
 @dataclass
-class PlaylistItemSnippet(BaseModel, DatetimeTimeMixin):
+class PlaylistItemSnippet(BaseModel, PublishedAtMixin):
     """
     A class representing the playlist item's snippet info.
 
@@ -7,11 +7,11 @@ from typing import Optional, List
 
 from .base import BaseModel
 from .common import BaseApiResponse, BaseResource, Thumbnails
-from .mixins import DatetimeTimeMixin
+from .mixins import PublishedAtMixin
 
 
 @dataclass
-class SearchResultSnippet(BaseModel, DatetimeTimeMixin):
+class SearchResultSnippet(BaseModel, PublishedAtMixin):
     """
     A class representing the search result snippet info.
 
@@ -7,11 +7,11 @@ from typing import List, Optional
 
 from .base import BaseModel
 from .common import BaseApiResponse, BaseResource, ResourceId, Thumbnails
-from .mixins import DatetimeTimeMixin
+from .mixins import PublishedAtMixin
 
 
 @dataclass
-class SubscriptionSnippet(BaseModel, DatetimeTimeMixin):
+class SubscriptionSnippet(BaseModel, PublishedAtMixin):
     """
     A class representing the subscription snippet info.
 
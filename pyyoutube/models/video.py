@@ -5,10 +5,10 @@ These are video related models.
 from dataclasses import dataclass, field
 from typing import Optional, List
 
-import isodate
 from isodate import ISO8601Error
 
 from pyyoutube.error import ErrorCode, ErrorMessage, PyYouTubeException
+from pyyoutube.utils.iso8601 import parse_duration
 from .base import BaseModel
 from .common import (
     BaseApiResponse,
@@ -18,7 +18,7 @@ from .common import (
     Player,
     Thumbnails,
 )
-from .mixins import DatetimeTimeMixin
+from .mixins import DatetimeTimeMixin, PublishedAtMixin, cached_property
 
 
 @dataclass
@@ -131,7 +131,7 @@ class VideoContentDetails(BaseModel):
         if not self.duration:
             return None
         try:
-            seconds = isodate.parse_duration(self.duration).total_seconds()
+            seconds = parse_duration(self.duration)
         except ISO8601Error as e:
             raise PyYouTubeException(
                 ErrorMessage(status_code=ErrorCode.INVALID_PARAMS, message=e.args[0])
@@ -139,6 +139,11 @@ class VideoContentDetails(BaseModel):
         else:
             return int(seconds)
 
+    @cached_property
+    def duration_seconds(self) -> Optional[int]:
+        """duration in seconds, parsed once."""
+        return self.get_video_seconds_duration()
+
 
 @dataclass
 class VideoTopicDetails(BaseTopicDetails):
@@ -166,7 +171,7 @@ class VideoTopicDetails(BaseTopicDetails):
 
 
 @dataclass
-class VideoSnippet(BaseModel, DatetimeTimeMixin):
+class VideoSnippet(BaseModel, PublishedAtMixin):
     """
     A class representing the video snippet info.
 
@@ -0,0 +1,21 @@
+from .comments import CommentHarvester  # noqa
+from .channel_videos import get_uploads_playlist_ids, iter_channel_videos  # noqa
+from .channel_sync import (  # noqa
+    ChannelSync,
+    ChannelSyncState,
+    JSONSyncStateStore,
+    MemorySyncStateStore,
+)
+from .statistics import (  # noqa
+    StatisticsPoint,
+    StatisticsPoller,
+    StatisticsStore,
+)
+from .playlist_edit import (  # noqa
+    PlaylistEditJournal,
+    PlaylistEditOperation,
+    PlaylistEditor,
+    PlaylistEditPlan,
+    PlaylistEditResult,
+    diff_playlist,
+)
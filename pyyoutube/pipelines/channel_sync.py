@@ -0,0 +1,208 @@
+"""
+Incremental sync of channel uploads, fetching only the videos published since the last run.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional, Union, TYPE_CHECKING
+
+from pyyoutube.models import PlaylistItem
+from pyyoutube.pipelines.channel_videos import get_uploads_playlist_ids
+from pyyoutube.utils.constants import MAX_IDS_PER_REQUEST
+from pyyoutube.utils.params_checker import enf_comma_separated
+
+if TYPE_CHECKING:
+    from pyyoutube import Client  # pragma: no cover
+
+# Number of newest video ids remembered per channel.
+KNOWN_VIDEO_IDS_SIZE = 20
+
+
+@dataclass
+class ChannelSyncState:
+    """What is already known about the uploads of a channel."""
+
+    uploads_playlist_id: Optional[str] = None
+    last_published_at: Optional[str] = None
+    known_video_ids: List[str] = field(default_factory=list)
+
+    @property
+    def last_video_id(self) -> Optional[str]:
+        return self.known_video_ids[0] if self.known_video_ids else None
+
+
+class MemorySyncStateStore:
+    """Keep the sync state in memory."""
+
+    def __init__(self) -> None:
+        self._states: Dict[str, ChannelSyncState] = {}
+        self._lock = threading.Lock()
+
+    def get(self, channel_id: str) -> Optional[ChannelSyncState]:
+        with self._lock:
+            return self._states.get(channel_id)
+
+    def set(self, channel_id: str, state: ChannelSyncState):
+        with self._lock:
+            self._states[channel_id] = state
+
+    def save(self):
+        pass
+
+
+class JSONSyncStateStore(MemorySyncStateStore):
+    def __init__(self, path: str) -> None:
+        """Keep the sync state in a local json file.
+
+        Args:
+            path:
+                Path for the state file. Loaded if it exists.
+        """
+        super().__init__()
+        self.path = path
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            self._states = {cid: ChannelSyncState(**s) for cid, s in data.items()}
+
+    def save(self):
+        """Write the state file, replacing the old one atomically."""
+        with self._lock:
+            data = {cid: asdict(state) for cid, state in self._states.items()}
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+
+class ChannelSync:
+    def __init__(
+        self,
+        client: "Client",
+        store: Optional[MemorySyncStateStore] = None,
+        max_workers: int = 4,
+        initial_max_pages: Optional[int] = None,
+    ) -> None:
+        """Fetch the new uploads of channels since the last sync.
+
+        The uploads playlist lists newest videos first, so paging stops at the first
+        already known video. A poll of a channel without new uploads costs one request.
+
+        Args:
+            client:
+                Client instance.
+            store:
+                State store, defaults to an in memory store.
+            max_workers:
+                Number of channels synced at the same time.
+            initial_max_pages:
+                Maximum pages read for a channel seen for the first time.
+                All pages are read if not provided.
+        """
+        self.client = client
+        self.store = store if store is not None else MemorySyncStateStore()
+        self.max_workers = max_workers
+        self.initial_max_pages = initial_max_pages
+
+    def _is_known(self, item: PlaylistItem, state: ChannelSyncState) -> bool:
+        details = item.contentDetails
+        if details.videoId in state.known_video_ids:
+            return True
+        return (
+            state.last_published_at is not None
+            and details.videoPublishedAt is not None
+            and details.videoPublishedAt < state.last_published_at
+        )
+
+    def _sync_channel(
+        self, channel_id: str, state: ChannelSyncState
+    ) -> List[PlaylistItem]:
+        first_sync = not state.known_video_ids and state.last_published_at is None
+        max_pages = self.initial_max_pages if first_sync else None
+
+        new_items, page_token, pages = [], None, 0
+        while True:
+            res = self.client.playlistItems.list(
+                parts="snippet,contentDetails",
+                playlist_id=state.uploads_playlist_id,
+                max_results=MAX_IDS_PER_REQUEST,
+                page_token=page_token,
+            )
+            pages += 1
+            reached_known = False
+            for item in res.items or []:
+                if not first_sync and self._is_known(item, state):
+                    reached_known = True
+                    break
+                new_items.append(item)
+            page_token = res.nextPageToken
+            if reached_known or not page_token:
+                break
+            if max_pages is not None and pages >= max_pages:
+                break
+
+        if new_items:
+            new_ids = [item.contentDetails.videoId for item in new_items]
+            state.known_video_ids = (new_ids + state.known_video_ids)[
+                :KNOWN_VIDEO_IDS_SIZE
+            ]
+            published = [
+                item.contentDetails.videoPublishedAt
+                for item in new_items
+                if item.contentDetails.videoPublishedAt
+            ]
+            if state.last_published_at:
+                published.append(state.last_published_at)
+            if published:
+                # Timestamps are in the same ISO 8601 UTC format, compare as strings.
+                state.last_published_at = max(published)
+        return new_items
+
+    def sync(
+        self, channel_ids: Union[str, list, tuple, set]
+    ) -> Dict[str, List[PlaylistItem]]:
+        """Fetch the new uploads of the channels and update the state store.
+
+        Args:
+            channel_ids:
+                IDs for the channels.
+
+        Returns:
+            Mapping of channel id to the new playlist items, newest first.
+            Channels without uploads playlist are missing.
+        """
+        channel_ids = enf_comma_separated(field="channel_ids", value=channel_ids).split(
+            ","
+        )
+        states = {}
+        unresolved = []
+        for channel_id in channel_ids:
+            state = self.store.get(channel_id)
+            if state is None or state.uploads_playlist_id is None:
+                unresolved.append(channel_id)
+            else:
+                states[channel_id] = state
+        if unresolved:
+            playlists = get_uploads_playlist_ids(self.client, unresolved)
+            for channel_id, playlist_id in playlists.items():
+                state = self.store.get(channel_id) or ChannelSyncState()
+                state.uploads_playlist_id = playlist_id
+                states[channel_id] = state
+
+        def sync_channel(channel_id: str):
+            state = states[channel_id]
+            items = self._sync_channel(channel_id, state)
+            self.store.set(channel_id, state)
+            return items
+
+        ordered = [cid for cid in channel_ids if cid in states]
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = dict(zip(ordered, executor.map(sync_channel, ordered)))
+        finally:
+            # Keep the progress of the channels synced before a failure.
+            self.store.save()
+        return results
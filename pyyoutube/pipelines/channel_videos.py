@@ -0,0 +1,155 @@
+"""
+Pipeline to list all videos of channels through their uploads playlist.
+
+This costs 1 quota unit per page, against 100 units per page with search.list.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterator, List, Optional, Union, TYPE_CHECKING
+
+from pyyoutube.models import Video
+from pyyoutube.utils.constants import MAX_IDS_PER_REQUEST
+from pyyoutube.utils.params_checker import enf_comma_separated
+
+if TYPE_CHECKING:
+    from pyyoutube import Client  # pragma: no cover
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+def _chunks(items: List[str], size: int = MAX_IDS_PER_REQUEST) -> Iterator[List[str]]:
+    for idx in range(0, len(items), size):
+        yield items[idx : idx + size]
+
+
+def get_uploads_playlist_ids(
+    client: "Client", channel_ids: Union[str, list, tuple, set]
+) -> Dict[str, str]:
+    """Get the uploads playlist id for channels.
+
+    Args:
+        client:
+            Client instance.
+        channel_ids:
+            IDs for the channels.
+
+    Returns:
+        Mapping of channel id to its uploads playlist id. Channels not found are missing.
+    """
+    channel_ids = enf_comma_separated(field="channel_ids", value=channel_ids).split(",")
+    playlists = {}
+    for batch in _chunks(channel_ids):
+        res = client.channels.list(
+            parts="contentDetails", channel_id=batch, max_results=MAX_IDS_PER_REQUEST
+        )
+        for channel in res.items or []:
+            details = channel.contentDetails
+            if (
+                details
+                and details.relatedPlaylists
+                and details.relatedPlaylists.uploads
+            ):
+                playlists[channel.id] = details.relatedPlaylists.uploads
+    # keep the order of the given channels
+    return {cid: playlists[cid] for cid in channel_ids if cid in playlists}
+
+
+def iter_channel_videos(
+    client: "Client",
+    channel_ids: Union[str, list, tuple, set],
+    parts: Optional[Union[str, list, tuple, set]] = None,
+    max_workers: int = 4,
+    return_json: bool = False,
+) -> Iterator[Union[dict, Video]]:
+    """Yields all videos uploaded by the channels.
+
+    The uploads playlists are paged concurrently, and each page of 50 video ids is
+    fetched with one videos.list request while the next pages are read.
+
+    Args:
+        client:
+            Client instance.
+        channel_ids:
+            IDs for the channels.
+        parts:
+            Comma-separated list of one or more video resource properties.
+        max_workers:
+            Number of threads for the playlist pages and for the videos requests.
+        return_json:
+            Type for returned data. If you set True JSON data will be returned.
+
+    Returns:
+        Iterator of videos, in playlist order for each channel.
+    """
+    playlist_ids = list(get_uploads_playlist_ids(client, channel_ids).values())
+    if not playlist_ids:
+        return
+
+    batches = queue.Queue(maxsize=max_workers * 2)
+    stop = threading.Event()
+
+    def put(item):
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def walk(playlist_id: str):
+        page_token = None
+        while not stop.is_set():
+            res = client.playlistItems.list(
+                parts="contentDetails",
+                playlist_id=playlist_id,
+                max_results=MAX_IDS_PER_REQUEST,
+                page_token=page_token,
+            )
+            ids = [item.contentDetails.videoId for item in res.items or []]
+            if ids:
+                put(
+                    video_pool.submit(
+                        client.videos.list,
+                        parts=parts,
+                        video_id=ids,
+                        max_results=MAX_IDS_PER_REQUEST,
+                        return_json=return_json,
+                    )
+                )
+            page_token = res.nextPageToken
+            if not page_token:
+                break
+
+    def produce():
+        try:
+            futures = [page_pool.submit(walk, pid) for pid in playlist_ids]
+            for future in futures:
+                future.result()
+            put(_DONE)
+        except Exception as e:
+            put(_Failure(e))
+
+    video_pool = ThreadPoolExecutor(max_workers=max_workers)
+    page_pool = ThreadPoolExecutor(max_workers=min(max_workers, len(playlist_ids)))
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+    try:
+        while True:
+            item = batches.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            res = item.result()
+            yield from (res["items"] if return_json else res.items) or []
+    finally:
+        stop.set()
+        page_pool.shutdown(wait=False)
+        video_pool.shutdown(wait=False)
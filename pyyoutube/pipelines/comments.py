@@ -0,0 +1,174 @@
+"""
+Harvester for all comments and replies of a video.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator, Optional, TYPE_CHECKING
+
+from pyyoutube.models import Comment, CommentThread
+
+if TYPE_CHECKING:
+    from pyyoutube import Client  # pragma: no cover
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+class CommentHarvester:
+    def __init__(
+        self,
+        client: "Client",
+        max_workers: int = 4,
+        buffer_size: int = 1000,
+        order: Optional[str] = None,
+        text_format: Optional[str] = None,
+    ) -> None:
+        """Walk the comment thread pages of a video and fetch the replies concurrently.
+
+        Only threads with more replies than inlined in ``replies.comments`` need
+        extra ``comments.list`` requests, those run on a bounded thread pool.
+
+        Args:
+            client:
+                Client instance.
+            max_workers:
+                Number of threads fetching replies at the same time.
+            buffer_size:
+                Maximum comments waiting to be consumed. Fetching pauses when the
+                buffer is full.
+            order:
+                Order of the comment threads, time or relevance.
+            text_format:
+                Format of the comments text, html or plainText.
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.buffer_size = buffer_size
+        self.order = order
+        self.text_format = text_format
+
+    def _iter_threads(
+        self, video_id: str, stop: threading.Event
+    ) -> Iterator[CommentThread]:
+        page_token = None
+        while not stop.is_set():
+            res = self.client.commentThreads.list(
+                parts="snippet,replies",
+                video_id=video_id,
+                max_results=100,
+                order=self.order,
+                page_token=page_token,
+                text_format=self.text_format,
+            )
+            yield from res.items or []
+            page_token = res.nextPageToken
+            if not page_token:
+                break
+
+    def _iter_replies(self, parent_id: str, stop: threading.Event) -> Iterator[Comment]:
+        page_token = None
+        while not stop.is_set():
+            res = self.client.comments.list(
+                parts="snippet",
+                parent_id=parent_id,
+                max_results=100,
+                page_token=page_token,
+                text_format=self.text_format,
+            )
+            yield from res.items or []
+            page_token = res.nextPageToken
+            if not page_token:
+                break
+
+    def iter_comments(self, video_id: str) -> Iterator[Comment]:
+        """Yields every top level comment and reply of the video once.
+
+        Args:
+            video_id:
+                ID for the video.
+
+        Returns:
+            Iterator of comments. Replies of a thread may come after later threads.
+
+        Raises:
+            PyYouTubeException: A request failed.
+        """
+        buffer = queue.Queue(maxsize=self.buffer_size)
+        stop = threading.Event()
+
+        def put(item):
+            while not stop.is_set():
+                try:
+                    buffer.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    continue
+
+        def fetch_replies(parent_id: str):
+            try:
+                for comment in self._iter_replies(parent_id, stop):
+                    put(comment)
+            except Exception as e:
+                put(_Failure(e))
+
+        def produce():
+            # Limit the submitted reply jobs, so the thread pages are not read too far ahead.
+            slots = threading.BoundedSemaphore(self.max_workers * 2)
+            try:
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    for thread in self._iter_threads(video_id, stop):
+                        put(thread.snippet.topLevelComment)
+                        inline = (thread.replies and thread.replies.comments) or []
+                        for comment in inline:
+                            put(comment)
+                        if (thread.snippet.totalReplyCount or 0) > len(inline):
+                            slots.acquire()
+                            future = executor.submit(fetch_replies, thread.id)
+                            future.add_done_callback(lambda f: slots.release())
+                put(_DONE)
+            except Exception as e:
+                put(_Failure(e))
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        seen = set()
+        try:
+            while True:
+                item = buffer.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, _Failure):
+                    raise item.error
+                if item is None or item.id in seen:
+                    continue
+                seen.add(item.id)
+                yield item
+        finally:
+            stop.set()
+
+    def harvest(self, video_id: str, sink: Callable[[Comment], None]) -> int:
+        """Send every comment of the video to the sink.
+
+        Fetching waits while the sink is slower than the requests.
+
+        Args:
+            video_id:
+                ID for the video.
+            sink:
+                Callable receiving each comment.
+
+        Returns:
+            Number of comments sent to the sink.
+        """
+        count = 0
+        for comment in self.iter_comments(video_id):
+            sink(comment)
+            count += 1
+        return count
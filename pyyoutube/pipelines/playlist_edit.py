@@ -0,0 +1,421 @@
+"""
+Bulk edit of a playlist, to reach a desired order of videos with the fewest writes.
+"""
+
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, TYPE_CHECKING
+
+import requests
+
+from pyyoutube.error import ErrorCode, ErrorMessage, NotFound, PyYouTubeException
+from pyyoutube.utils.constants import MAX_IDS_PER_REQUEST, QUOTA_COSTS
+
+if TYPE_CHECKING:
+    from pyyoutube import Client  # pragma: no cover
+
+DELETE = "delete"
+INSERT = "insert"
+MOVE = "move"
+
+# API method of each operation kind.
+OPERATION_METHODS = {DELETE: "delete", INSERT: "insert", MOVE: "update"}
+
+# Network failures worth another try, besides the retryable API errors.
+RETRYABLE_EXCEPTIONS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+)
+
+
+@dataclass
+class PlaylistEditOperation:
+    """One write to the playlist.
+
+    Deletes need the playlist item id. Inserts and moves put the video at the
+    position, counted once the previous operations of the plan are done.
+    """
+
+    kind: str
+    video_id: str
+    playlist_item_id: Optional[str] = None
+    position: Optional[int] = None
+
+
+@dataclass
+class PlaylistEditPlan:
+    playlist_id: str
+    operations: List[PlaylistEditOperation] = field(default_factory=list)
+    video_ids: Optional[List[str]] = None  # Desired order the plan was made for.
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        counts = {DELETE: 0, INSERT: 0, MOVE: 0}
+        for operation in self.operations:
+            counts[operation.kind] += 1
+        return counts
+
+    @property
+    def quota_cost(self) -> int:
+        return sum(
+            QUOTA_COSTS[f"playlistItems.{OPERATION_METHODS[operation.kind]}"]
+            for operation in self.operations
+        )
+
+
+@dataclass
+class PlaylistEditResult:
+    plan: PlaylistEditPlan
+    done: Set[int] = field(default_factory=set)  # Indexes of the operations.
+    failed: Dict[int, Exception] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return len(self.done) == len(self.plan.operations)
+
+    @property
+    def pending(self) -> List[int]:
+        """Indexes of the operations not done yet."""
+        return [i for i in range(len(self.plan.operations)) if i not in self.done]
+
+
+def longest_increasing_subsequence(values: Sequence[int]) -> List[int]:
+    """Indexes of a longest strictly increasing subsequence of the values."""
+    tails: List[int] = []  # Last value of the best subsequence of each length.
+    tail_indexes: List[int] = []
+    previous: List[int] = [-1] * len(values)
+    for index, value in enumerate(values):
+        length = bisect_left(tails, value)
+        if length == len(tails):
+            tails.append(value)
+            tail_indexes.append(index)
+        else:
+            tails[length] = value
+            tail_indexes[length] = index
+        previous[index] = tail_indexes[length - 1] if length > 0 else -1
+
+    result = []
+    index = tail_indexes[-1] if tail_indexes else -1
+    while index != -1:
+        result.append(index)
+        index = previous[index]
+    return result[::-1]
+
+
+def diff_playlist(
+    current: Sequence[Tuple[str, str]], desired: Sequence[str]
+) -> List[PlaylistEditOperation]:
+    """Operations changing the playlist from the current to the desired order.
+
+    Items of the current playlist are matched to the desired videos, in order for
+    repeated videos. Unmatched items are deleted and missing videos inserted.
+    Matched items in a longest increasing subsequence of desired positions stay,
+    the others are moved, so the count of operations is minimal.
+
+    Args:
+        current:
+            (playlist item id, video id) of the items, in playlist order.
+        desired:
+            Video ids in the desired order.
+
+    Returns:
+        Deletes first, then inserts and moves in the order to apply them.
+    """
+    desired_indexes: Dict[str, deque] = defaultdict(deque)
+    for index, video_id in enumerate(desired):
+        desired_indexes[video_id].append(index)
+
+    operations = []
+    matched: List[int] = []  # Desired index of the kept items, in playlist order.
+    item_ids: Dict[int, str] = {}
+    for item_id, video_id in current:
+        if desired_indexes[video_id]:
+            index = desired_indexes[video_id].popleft()
+            matched.append(index)
+            item_ids[index] = item_id
+        else:
+            operations.append(
+                PlaylistEditOperation(DELETE, video_id, playlist_item_id=item_id)
+            )
+
+    staying = {matched[i] for i in longest_increasing_subsequence(matched)}
+    # The playlist after the deletes, as desired indexes. Each video is put right
+    # after its desired predecessor, which is already in place.
+    playlist = list(matched)
+    for index, video_id in enumerate(desired):
+        if index in staying:
+            continue
+        if index in item_ids:
+            playlist.remove(index)
+        position = playlist.index(index - 1) + 1 if index > 0 else 0
+        playlist.insert(position, index)
+        operations.append(
+            PlaylistEditOperation(
+                MOVE if index in item_ids else INSERT,
+                video_id,
+                playlist_item_id=item_ids.get(index),
+                position=position,
+            )
+        )
+    return operations
+
+
+class PlaylistEditJournal:
+    def __init__(self, path: str) -> None:
+        """Json lines file recording a plan and its done operations, to resume it.
+
+        Args:
+            path:
+                Path for the journal file.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _write(self, entry: dict, mode: str = "a"):
+        with self._lock:
+            with open(self.path, mode) as f:
+                f.write(json.dumps(entry) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+    def start(self, plan: PlaylistEditPlan):
+        self._write(
+            {
+                "event": "plan",
+                "playlist_id": plan.playlist_id,
+                "operations": [asdict(operation) for operation in plan.operations],
+                "video_ids": plan.video_ids,
+            },
+            mode="w",
+        )
+
+    def record(self, index: int, error: Optional[Exception] = None, **data):
+        if error is None:
+            self._write({"event": "done", "index": index, **data})
+        else:
+            self._write({"event": "failed", "index": index, "error": repr(error)})
+
+    def load(self) -> Tuple[Optional[PlaylistEditPlan], Set[int]]:
+        """The plan and the indexes of its done operations."""
+        plan, done = None, set()
+        if not os.path.exists(self.path):
+            return plan, done
+        with open(self.path, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Line cut by a crash while writing.
+                    continue
+                if entry["event"] == "plan":
+                    plan = PlaylistEditPlan(
+                        playlist_id=entry["playlist_id"],
+                        operations=[
+                            PlaylistEditOperation(**operation)
+                            for operation in entry["operations"]
+                        ],
+                        video_ids=entry.get("video_ids"),
+                    )
+                    done = set()
+                elif entry["event"] == "done":
+                    done.add(entry["index"])
+        return plan, done
+
+
+class PlaylistEditor:
+    def __init__(
+        self,
+        client: "Client",
+        playlist_id: str,
+        journal: Optional[PlaylistEditJournal] = None,
+        max_workers: int = 8,
+        max_retries: int = 3,
+        backoff: float = 1.0,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Edit a playlist to reach a desired order of videos.
+
+        Deletes do not depend on each other and run concurrently. Inserts and
+        moves carry positions relying on the previous ones, so they run in order.
+        With a journal, an interrupted or failed edit can be resumed.
+
+        Args:
+            client:
+                Client instance, authorized to edit the playlist.
+            playlist_id:
+                ID for the playlist.
+            journal:
+                Journal recording the progress.
+            max_workers:
+                Number of deletes sent at the same time.
+            max_retries:
+                Tries again of a delete or move failing with a retryable error.
+                Inserts are not retried, resume the edit after their failure.
+            backoff:
+                Seconds before the first retry, doubled for each next one.
+            sleep:
+                Function waiting between the retries.
+        """
+        self.client = client
+        self.playlist_id = playlist_id
+        self.journal = journal
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.sleep = sleep
+
+    def current_items(self) -> List[Tuple[str, str]]:
+        """(playlist item id, video id) of the playlist items, in playlist order."""
+        items, page_token = [], None
+        while True:
+            res = self.client.playlistItems.list(
+                parts="snippet",
+                playlist_id=self.playlist_id,
+                max_results=MAX_IDS_PER_REQUEST,
+                page_token=page_token,
+            )
+            items.extend(
+                (item.id, item.snippet.resourceId.videoId) for item in res.items or []
+            )
+            page_token = res.nextPageToken
+            if not page_token:
+                return items
+
+    def plan(self, video_ids: Sequence[str]) -> PlaylistEditPlan:
+        """Plan the operations to order the playlist as the video ids.
+
+        Args:
+            video_ids:
+                Video ids in the desired order, videos not in it are removed.
+        """
+        video_ids = list(video_ids)
+        operations = diff_playlist(self.current_items(), video_ids)
+        return PlaylistEditPlan(
+            playlist_id=self.playlist_id, operations=operations, video_ids=video_ids
+        )
+
+    def _retry(self, func: Callable):
+        for attempt in range(self.max_retries + 1):
+            try:
+                return func()
+            except (PyYouTubeException, *RETRYABLE_EXCEPTIONS) as e:
+                retryable = not isinstance(e, PyYouTubeException) or e.retryable
+                if not retryable or attempt == self.max_retries:
+                    raise
+                self.sleep(self.backoff * 2**attempt)
+
+    def _apply_operation(self, operation: PlaylistEditOperation) -> dict:
+        playlist_items = self.client.playlistItems
+        if operation.kind == DELETE:
+            try:
+                self._retry(lambda: playlist_items.delete(operation.playlist_item_id))
+            except NotFound:
+                pass  # Already deleted, by a run stopped before journaling it.
+            return {}
+
+        snippet = {
+            "playlistId": self.playlist_id,
+            "resourceId": {"kind": "youtube#video", "videoId": operation.video_id},
+            "position": operation.position,
+        }
+        if operation.kind == INSERT:
+            # Not idempotent: after a lost response the retry would add the video
+            # twice. The run stops instead, resume plans again from the playlist.
+            item = playlist_items.insert(body={"snippet": snippet}, parts="snippet")
+        else:
+            body = {"id": operation.playlist_item_id, "snippet": snippet}
+            item = self._retry(
+                lambda: playlist_items.update(body=body, parts="snippet")
+            )
+        return {"playlist_item_id": item.id}
+
+    def _record(
+        self,
+        result: PlaylistEditResult,
+        index: int,
+        data: Optional[dict] = None,
+        error: Optional[Exception] = None,
+    ):
+        if error is None:
+            result.done.add(index)
+            result.failed.pop(index, None)
+        else:
+            result.failed[index] = error
+        if self.journal is not None:
+            self.journal.record(index, error, **(data or {}))
+
+    def apply(self, plan: PlaylistEditPlan) -> PlaylistEditResult:
+        """Run the operations of the plan.
+
+        Returns:
+            Done and failed operations. Inserts and moves stop at the first failure,
+            and do not start if a delete failed, as their positions would be wrong.
+        """
+        if self.journal is not None:
+            self.journal.start(plan)
+        return self._run(plan, PlaylistEditResult(plan=plan))
+
+    def resume(self) -> PlaylistEditResult:
+        """Finish the edit of the journal plan.
+
+        The remaining operations are planned again from the playlist as it is now,
+        so writes applied but not journaled, before a crash or with their response
+        lost, are not sent twice. A plan without its video ids, not made by
+        ``plan``, runs its operations not done yet instead.
+
+        Raises:
+            PyYouTubeException: No plan in the journal.
+        """
+        plan, done = self.journal.load() if self.journal else (None, set())
+        if plan is None:
+            raise PyYouTubeException(
+                ErrorMessage(
+                    status_code=ErrorCode.MISSING_PARAMS,
+                    message="No playlist edit plan to resume",
+                )
+            )
+        if plan.video_ids is None:
+            return self._run(plan, PlaylistEditResult(plan=plan, done=done))
+        return self.apply(self.plan(plan.video_ids))
+
+    def edit(self, video_ids: Sequence[str]) -> PlaylistEditResult:
+        """Plan and apply the operations to order the playlist as the video ids."""
+        return self.apply(self.plan(video_ids))
+
+    def _run(self, plan: PlaylistEditPlan, result: PlaylistEditResult):
+        deletes, positioned = [], []
+        for index, operation in enumerate(plan.operations):
+            if index not in result.done:
+                (deletes if operation.kind == DELETE else positioned).append(index)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._apply_operation, plan.operations[index]): index
+                for index in deletes
+            }
+            for future in as_completed(futures):
+                try:
+                    data = future.result()
+                except Exception as e:
+                    self._record(result, futures[future], error=e)
+                else:
+                    self._record(result, futures[future], data)
+        if result.failed:
+            return result
+
+        for index in positioned:
+            try:
+                data = self._apply_operation(plan.operations[index])
+            except Exception as e:
+                self._record(result, index, error=e)
+                break
+            self._record(result, index, data)
+        return result
@@ -0,0 +1,291 @@
+"""
+Poller to store video statistics as delta encoded time series.
+
+Each video has an append-only file of records. A record holds a bitmask of the
+present metrics, then the zigzag varint deltas from the previous record for the
+timestamp and each present metric.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple, Union, TYPE_CHECKING
+
+from pyyoutube.error import ErrorCode, ErrorMessage, PyYouTubeException
+from pyyoutube.utils.constants import MAX_IDS_PER_REQUEST
+from pyyoutube.utils.params_checker import enf_comma_separated
+
+if TYPE_CHECKING:
+    from pyyoutube import Client  # pragma: no cover
+
+METRICS = ("viewCount", "likeCount", "commentCount")
+
+
+@dataclass
+class StatisticsPoint:
+    timestamp: int
+    viewCount: Optional[int] = None
+    likeCount: Optional[int] = None
+    commentCount: Optional[int] = None
+
+
+def _write_varint(value: int, out: bytearray):
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _zigzag(value: int) -> int:
+    return value << 1 if value >= 0 else ((-value) << 1) - 1
+
+
+def _unzigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def encode_point(point: StatisticsPoint, previous: Optional[StatisticsPoint]) -> bytes:
+    """Encode a point as deltas from the previous point of the series."""
+    out = bytearray()
+    values = [getattr(point, m) for m in METRICS]
+    mask = sum(1 << i for i, v in enumerate(values) if v is not None)
+    _write_varint(mask, out)
+    _write_varint(
+        _zigzag(point.timestamp - (previous.timestamp if previous else 0)), out
+    )
+    for metric, value in zip(METRICS, values):
+        if value is None:
+            continue
+        last = getattr(previous, metric) if previous else None
+        _write_varint(_zigzag(value - (last or 0)), out)
+    return bytes(out)
+
+
+def _decode_records(data: bytes) -> Iterator[Tuple[StatisticsPoint, int]]:
+    """Decode the records of a series file, with the offset of their end."""
+    pos, size = 0, len(data)
+
+    def read_varint() -> int:
+        nonlocal pos
+        shift = result = 0
+        while True:
+            byte = data[pos]
+            pos += 1
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+    previous = None
+    while pos < size:
+        try:
+            mask = read_varint()
+            timestamp = _unzigzag(read_varint())
+            timestamp += previous.timestamp if previous else 0
+            point = StatisticsPoint(timestamp=timestamp)
+            for i, metric in enumerate(METRICS):
+                last = getattr(previous, metric) if previous else None
+                if mask & (1 << i):
+                    setattr(point, metric, _unzigzag(read_varint()) + (last or 0))
+                else:
+                    # Keep the last known value, so the next delta has a base.
+                    setattr(point, metric, last)
+        except IndexError:
+            # Record cut by a crash while appending, the mask tells its length.
+            return
+        previous = point
+        yield point, pos
+
+
+def decode_points(data: bytes) -> Iterator[StatisticsPoint]:
+    """Decode the records of a series file, a truncated last record is ignored."""
+    for point, _ in _decode_records(data):
+        yield point
+
+
+class StatisticsStore:
+    def __init__(self, directory: str, cache_size: int = 100_000) -> None:
+        """Append-only per video statistics files.
+
+        Args:
+            directory:
+                Directory for the series files.
+            cache_size:
+                Number of videos whose last point is kept in memory. Appending
+                to the other ones reads their file again.
+        """
+        self.directory = directory
+        self.cache_size = cache_size
+        self._last: "OrderedDict[str, StatisticsPoint]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def path(self, video_id: str) -> str:
+        # Split into sub directories, so a directory holds a manageable number of files.
+        return os.path.join(self.directory, video_id[:2], f"{video_id}.stats")
+
+    def _read(self, video_id: str) -> bytes:
+        path = self.path(video_id)
+        if not os.path.exists(path):
+            return b""
+        with open(path, "rb") as f:
+            return f.read()
+
+    def _last_point(self, video_id: str) -> Optional[StatisticsPoint]:
+        with self._lock:
+            if video_id in self._last:
+                self._last.move_to_end(video_id)
+                return self._last[video_id]
+        data = self._read(video_id)
+        last, end = None, 0
+        for last, end in _decode_records(data):
+            pass
+        if end < len(data):
+            # Drop the truncated record, the next one would be read as its rest.
+            with open(self.path(video_id), "r+b") as f:
+                f.truncate(end)
+        return last
+
+    def append(self, video_id: str, point: StatisticsPoint):
+        """Append a point to the series of the video."""
+        previous = self._last_point(video_id)
+        record = encode_point(point, previous)
+        path = self.path(video_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "ab") as f:
+            f.write(record)
+        # A metric missing in this point keeps its last value in the series.
+        for metric in METRICS:
+            if getattr(point, metric) is None and previous is not None:
+                setattr(point, metric, getattr(previous, metric))
+        with self._lock:
+            self._last[video_id] = point
+            self._last.move_to_end(video_id)
+            if len(self._last) > self.cache_size:
+                self._last.popitem(last=False)
+
+    def series(
+        self, video_id: str, start: Optional[int] = None, end: Optional[int] = None
+    ) -> List[StatisticsPoint]:
+        """Points of the video between the timestamps, both included."""
+        return [
+            p
+            for p in decode_points(self._read(video_id))
+            if (start is None or p.timestamp >= start)
+            and (end is None or p.timestamp <= end)
+        ]
+
+    def rate(
+        self,
+        video_id: str,
+        metric: str = "viewCount",
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> Optional[float]:
+        """Average change per second of the metric over the window.
+
+        Args:
+            video_id:
+                ID for the video.
+            metric:
+                One of viewCount, likeCount and commentCount.
+            start:
+                Window start timestamp.
+            end:
+                Window end timestamp.
+
+        Returns:
+            Change per second, None if less than two points in the window.
+        """
+        if metric not in METRICS:
+            raise PyYouTubeException(
+                ErrorMessage(
+                    status_code=ErrorCode.INVALID_PARAMS,
+                    message=f"Metric must be one of {','.join(METRICS)}",
+                )
+            )
+        points = [
+            p
+            for p in self.series(video_id, start, end)
+            if getattr(p, metric) is not None
+        ]
+        if len(points) < 2 or points[-1].timestamp == points[0].timestamp:
+            return None
+        first, last = points[0], points[-1]
+        return (getattr(last, metric) - getattr(first, metric)) / (
+            last.timestamp - first.timestamp
+        )
+
+
+class StatisticsPoller:
+    def __init__(
+        self,
+        client: "Client",
+        directory: str,
+        max_workers: int = 4,
+    ) -> None:
+        """Snapshot video statistics into delta encoded local files.
+
+        Args:
+            client:
+                Client instance.
+            directory:
+                Directory for the series files.
+            max_workers:
+                Number of videos.list requests running at the same time.
+        """
+        self.client = client
+        self.store = StatisticsStore(directory)
+        self.max_workers = max_workers
+
+    def _fetch(self, video_ids: List[str]) -> List[Tuple[str, dict]]:
+        res = self.client.videos.list(
+            parts="statistics",
+            video_id=video_ids,
+            max_results=MAX_IDS_PER_REQUEST,
+            return_json=True,
+        )
+        return [(item["id"], item.get("statistics", {})) for item in res["items"]]
+
+    def poll(
+        self,
+        video_ids: Union[str, list, tuple, set],
+        timestamp: Optional[int] = None,
+    ) -> int:
+        """Fetch the statistics of the videos and append them to their series.
+
+        Args:
+            video_ids:
+                IDs for the videos.
+            timestamp:
+                Unix timestamp of the snapshot, defaults to now.
+
+        Returns:
+            Number of points written. Deleted or private videos are skipped.
+        """
+        video_ids = enf_comma_separated(field="video_ids", value=video_ids).split(",")
+        timestamp = int(time.time()) if timestamp is None else timestamp
+        batches = [
+            video_ids[i : i + MAX_IDS_PER_REQUEST]
+            for i in range(0, len(video_ids), MAX_IDS_PER_REQUEST)
+        ]
+
+        written = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for items in executor.map(self._fetch, batches):
+                for video_id, statistics in items:
+                    point = StatisticsPoint(timestamp=timestamp)
+                    for metric in METRICS:
+                        if statistics.get(metric) is not None:
+                            setattr(point, metric, int(statistics[metric]))
+                    self.store.append(video_id, point)
+                    written += 1
+        return written
+
+    def series(self, video_id: str, start=None, end=None) -> List[StatisticsPoint]:
+        return self.store.series(video_id, start, end)
+
+    def rate(self, video_id: str, metric: str = "viewCount", start=None, end=None):
+        return self.store.rate(video_id, metric, start, end)
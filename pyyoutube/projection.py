@@ -0,0 +1,160 @@
+"""
+Build the ``fields`` system parameter from model attribute paths.
+
+Usage:
+    video = FieldPath(Video)
+    projection = Projection(Video, video.snippet.title, "statistics.viewCount")
+    client.videos.list(
+        video_id="VIDEO_ID",
+        parts=projection.parts,
+        fields=projection.list_fields(),
+    )
+
+References: https://developers.google.com/youtube/v3/getting-started#fields
+"""
+
+import dataclasses
+import typing
+from functools import lru_cache
+from typing import Dict, List, Tuple, Union
+
+from pyyoutube.error import ErrorCode, ErrorMessage, PyYouTubeException
+
+# Properties of every resource, they are not parts.
+RESOURCE_PROPERTIES = ("kind", "etag", "id")
+
+
+def _model_of(tp) -> Union[type, None]:
+    """Dataclass in an annotation like Optional[List[Model]], None for scalars and maps."""
+    while typing.get_origin(tp) in (Union, list):
+        args = [a for a in typing.get_args(tp) if a is not type(None)]
+        if len(args) != 1:
+            return None
+        tp = args[0]
+    return tp if dataclasses.is_dataclass(tp) else None
+
+
+@lru_cache(maxsize=None)
+def _field_types(model: type) -> Dict[str, object]:
+    hints = typing.get_type_hints(model)
+    return {f.name: hints[f.name] for f in dataclasses.fields(model)}
+
+
+def resolve_path(model: type, path: str) -> Tuple[str, ...]:
+    """Check the attribute path against the model dataclasses.
+
+    Args:
+        model:
+            Model class the path starts from.
+        path:
+            Dotted attribute path like snippet.thumbnails.default.url.
+
+    Returns:
+        Names in the path.
+
+    Raises:
+        PyYouTubeException: The path is not an attribute of the model.
+    """
+    names = tuple(path.split("."))
+    current = model
+    for name in names:
+        types = _field_types(current) if current is not None else {}
+        if name not in types:
+            raise PyYouTubeException(
+                ErrorMessage(
+                    status_code=ErrorCode.INVALID_PARAMS,
+                    message=f"Attribute {path} not found in {model.__name__}",
+                )
+            )
+        current = _model_of(types[name])
+    return names
+
+
+class FieldPath:
+    def __init__(self, model: type, names: Tuple[str, ...] = ()) -> None:
+        """Attribute path checked on access, like ``FieldPath(Video).snippet.title``.
+
+        Args:
+            model:
+                Model class the path starts from.
+            names:
+                Names already in the path.
+        """
+        self._model = model
+        self._names = names
+
+    def __getattr__(self, name: str) -> "FieldPath":
+        if name.startswith("_"):
+            raise AttributeError(name)
+        names = self._names + (name,)
+        resolve_path(self._model, ".".join(names))
+        return FieldPath(self._model, names)
+
+    def __str__(self) -> str:
+        return ".".join(self._names)
+
+    def __repr__(self) -> str:
+        return f"FieldPath({self._model.__name__}.{self})"
+
+
+class Projection:
+    def __init__(self, model: type, *paths: Union[str, FieldPath]) -> None:
+        """Fields mask selecting only the given attributes of a model.
+
+        Selecting an attribute selects everything below it. Attributes missing in
+        the response are left to their default value when decoded.
+
+        Args:
+            model:
+                Model class of the resource, like Video.
+            paths:
+                Attribute paths, as dotted strings or FieldPath.
+
+        Raises:
+            PyYouTubeException: A path is not an attribute of the model.
+        """
+        self.model = model
+        self.paths: List[Tuple[str, ...]] = []
+        self._tree: dict = {}
+        for path in paths:
+            names = resolve_path(model, str(path))
+            self.paths.append(names)
+            node = self._tree
+            for name in names[:-1]:
+                # An empty dict marks a fully selected subtree.
+                if node.get(name) == {}:
+                    break
+                node = node.setdefault(name, {})
+            else:
+                node[names[-1]] = {}
+
+    @staticmethod
+    def _render(tree: dict) -> str:
+        return ",".join(
+            f"{name}({Projection._render(children)})" if children else name
+            for name, children in tree.items()
+        )
+
+    @property
+    def fields(self) -> str:
+        """Mask for a single resource, like id,snippet(title)."""
+        return self._render(self._tree)
+
+    def list_fields(self, *extra: str) -> str:
+        """Mask for a list response, like items(id,snippet(title)),nextPageToken.
+
+        Args:
+            extra:
+                Other response properties to keep. Defaults to nextPageToken.
+        """
+        extra = extra or ("nextPageToken",)
+        return ",".join((f"items({self.fields})",) + extra)
+
+    @property
+    def parts(self) -> str:
+        """Parts needed for the selected attributes."""
+        parts = [name for name in self._tree if name not in RESOURCE_PROPERTIES]
+        return ",".join(parts) if parts else "id"
+
+    def __str__(self) -> str:
+        return self.fields
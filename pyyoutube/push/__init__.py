@@ -0,0 +1,8 @@
+from .receiver import (  # noqa
+    PushNotification,
+    PushNotificationReceiver,
+    parse_feed,
+    verify_signature,
+)
+from .leases import JSONLeaseStore, Lease, LeaseManager, MemoryLeaseStore  # noqa
+from .enrichment import VideoEnricher  # noqa
@@ -0,0 +1,191 @@
+"""
+Micro-batching stage to enrich push notifications with the full video resources.
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional, Union, TYPE_CHECKING
+
+from pyyoutube.models import Video
+from pyyoutube.push.receiver import PushNotification
+from pyyoutube.utils.constants import MAX_IDS_PER_REQUEST
+
+if TYPE_CHECKING:
+    from pyyoutube import Client  # pragma: no cover
+
+_STOP = object()
+
+
+class VideoEnricher:
+    def __init__(
+        self,
+        client: "Client",
+        handlers: Optional[List[Callable[[Video], None]]] = None,
+        parts: Union[str, list, tuple, set] = "snippet,contentDetails,statistics",
+        max_batch_size: int = MAX_IDS_PER_REQUEST,
+        max_delay_ms: int = 500,
+        on_error: Optional[Callable[[Exception], None]] = None,
+        latency_samples: int = 1000,
+    ) -> None:
+        """Buffer the notified video ids, then get them with one videos.list per batch.
+
+        A batch is sent when it holds ``max_batch_size`` ids, or ``max_delay_ms``
+        after its first id arrived. The instance can be given as ``on_notification``
+        to PushNotificationReceiver.
+
+        Args:
+            client:
+                Client instance.
+            handlers:
+                Callables receiving each enriched video.
+            parts:
+                Parts of the videos to get.
+            max_batch_size:
+                Maximum ids in a request, up to 50.
+            max_delay_ms:
+                Maximum milliseconds an id waits for its batch to fill.
+            on_error:
+                Called with the exceptions of failed requests and handlers.
+            latency_samples:
+                Number of recent latencies kept for the metrics.
+        """
+        self.client = client
+        self.handlers = list(handlers or [])
+        self.parts = parts
+        self.max_batch_size = min(max_batch_size, MAX_IDS_PER_REQUEST)
+        self.max_delay = max_delay_ms / 1000
+        self.on_error = on_error
+
+        self._queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._latencies = deque(maxlen=latency_samples)
+        self._counts = dict.fromkeys(
+            ("batches", "requested", "enriched", "missing", "errors"), 0
+        )
+
+    def add_handler(self, handler: Callable[[Video], None]):
+        self.handlers.append(handler)
+
+    def start(self):
+        """Start the batching thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        """Send the buffered ids, then stop the batching thread."""
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def submit(self, item: Union[str, PushNotification]) -> bool:
+        """Queue a video id, or the video of a notification.
+
+        Returns:
+            False for the notifications of deleted videos, which are not queued.
+        """
+        if isinstance(item, PushNotification):
+            if item.deleted:
+                return False
+            item = item.video_id
+        self._queue.put((item, time.monotonic()))
+        return True
+
+    __call__ = submit
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                return
+            # Keep the earliest arrival of an id notified several times.
+            batch: Dict[str, float] = {item[0]: item[1]}
+            deadline = item[1] + self.max_delay
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    # Past the deadline, still take the ids already queued.
+                    if remaining > 0:
+                        item = self._queue.get(timeout=remaining)
+                    else:
+                        item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.setdefault(item[0], item[1])
+            self._process(batch)
+
+    def _error(self, error: Exception):
+        with self._lock:
+            self._counts["errors"] += 1
+        if self.on_error is not None:
+            self.on_error(error)
+
+    def _process(self, batch: Dict[str, float]):
+        try:
+            res = self.client.videos.list(
+                parts=self.parts,
+                video_id=list(batch),
+                max_results=self.max_batch_size,
+            )
+        except Exception as e:
+            self._error(e)
+            return
+        videos = res.items or []
+        now = time.monotonic()
+        with self._lock:
+            self._counts["batches"] += 1
+            self._counts["requested"] += len(batch)
+            self._counts["enriched"] += len(videos)
+            # Private or deleted videos are not returned.
+            self._counts["missing"] += len(batch) - len(videos)
+            self._latencies.extend(now - batch[v.id] for v in videos if v.id in batch)
+        for video in videos:
+            for handler in self.handlers:
+                try:
+                    handler(video)
+                except Exception as e:
+                    self._error(e)
+
+    def metrics(self) -> dict:
+        """Counters, batch fill and latency of the enrichment.
+
+        Returns:
+            batches, requested, enriched, missing and errors counts, ``batch_fill``
+            the average fraction of the id slots used per request, and
+            ``latency_avg``, ``latency_p50``, ``latency_p95`` and ``latency_max``
+            in seconds from the notification to the enriched video, over the
+            recent videos.
+        """
+        with self._lock:
+            metrics = dict(self._counts)
+            latencies = sorted(self._latencies)
+        metrics["batch_fill"] = (
+            metrics["requested"] / (metrics["batches"] * self.max_batch_size)
+            if metrics["batches"]
+            else 0.0
+        )
+        if latencies:
+            count = len(latencies)
+            metrics["latency_avg"] = sum(latencies) / count
+            metrics["latency_p50"] = latencies[(count - 1) // 2]
+            metrics["latency_p95"] = latencies[int((count - 1) * 0.95)]
+            metrics["latency_max"] = latencies[-1]
+        else:
+            for key in ("latency_avg", "latency_p50", "latency_p95", "latency_max"):
+                metrics[key] = 0.0
+        return metrics
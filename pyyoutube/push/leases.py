@@ -0,0 +1,308 @@
+"""
+Lease manager to keep many push notification subscriptions alive.
+"""
+
+import heapq
+import json
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+from urllib.parse import parse_qs, urlparse
+
+if TYPE_CHECKING:
+    from pyyoutube import Client  # pragma: no cover
+
+DEFAULT_LEASE_SECONDS = 432000  # The hub default, 5 days.
+
+
+@dataclass
+class Lease:
+    """Subscription state for a channel."""
+
+    channel_id: str
+    expires_at: float = 0.0  # 0 means not subscribed yet.
+    failures: int = 0
+    retry_at: float = 0.0
+    renew_offset: float = 0.0  # Jitter, seconds to renew earlier than the others.
+
+
+class MemoryLeaseStore:
+    """Keep the leases in memory."""
+
+    def __init__(self) -> None:
+        self._leases: Dict[str, Lease] = {}
+        self._lock = threading.Lock()
+
+    def get(self, channel_id: str) -> Optional[Lease]:
+        with self._lock:
+            return self._leases.get(channel_id)
+
+    def set(self, lease: Lease):
+        with self._lock:
+            self._leases[lease.channel_id] = lease
+
+    def delete(self, channel_id: str):
+        with self._lock:
+            self._leases.pop(channel_id, None)
+
+    def all(self) -> List[Lease]:
+        with self._lock:
+            return list(self._leases.values())
+
+    def save(self):
+        pass
+
+
+class JSONLeaseStore(MemoryLeaseStore):
+    def __init__(self, path: str) -> None:
+        """Keep the leases in a local json file.
+
+        Args:
+            path:
+                Path for the leases file. Loaded if it exists.
+        """
+        super().__init__()
+        self.path = path
+        if os.path.exists(path):
+            with open(path, "r") as f:
+                data = json.load(f)
+            self._leases = {cid: Lease(**lease) for cid, lease in data.items()}
+
+    def save(self):
+        """Write the leases file, replacing the old one atomically."""
+        with self._lock:
+            data = {cid: asdict(lease) for cid, lease in self._leases.items()}
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+
+def channel_id_from_topic(topic: str) -> Optional[str]:
+    """Get the channel id from a hub topic url."""
+    values = parse_qs(urlparse(topic).query).get("channel_id")
+    return values[0] if values else None
+
+
+class LeaseManager:
+    def __init__(
+        self,
+        client: "Client",
+        callback_url: str,
+        store: Optional[MemoryLeaseStore] = None,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+        renew_before: int = 86400,
+        jitter: int = 3600,
+        max_workers: int = 8,
+        secret: Optional[str] = None,
+        retry_base: int = 60,
+        retry_max: int = 3600,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Renew the push subscriptions before their leases expire.
+
+        Leases are kept in a priority queue ordered by renewal time. Each lease gets a
+        random offset up to ``jitter`` seconds, so the renewals of channels subscribed
+        together are spread out.
+
+        Args:
+            client:
+                Client instance.
+            callback_url:
+                The URL receiving the notifications.
+            store:
+                Lease store, defaults to an in memory store.
+            lease_seconds:
+                Lease requested from the hub.
+            renew_before:
+                Seconds before the expiry to renew a lease.
+            jitter:
+                Maximum random seconds to renew earlier.
+            max_workers:
+                Number of renewal requests running at the same time.
+            secret:
+                Secret for the notification signatures.
+            retry_base:
+                Delay for the first retry of a failed renewal, doubled for each failure.
+            retry_max:
+                Maximum delay between retries.
+            clock:
+                Function returning the current unix time.
+        """
+        self.client = client
+        self.callback_url = callback_url
+        self.store = store if store is not None else MemoryLeaseStore()
+        self.lease_seconds = lease_seconds
+        self.renew_before = renew_before
+        self.jitter = jitter
+        self.max_workers = max_workers
+        self.secret = secret
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.clock = clock
+
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, str]] = []
+        for lease in self.store.all():
+            self._push(lease)
+
+    def renew_at(self, lease: Lease) -> float:
+        """Time the lease is due for renewal."""
+        if not lease.expires_at:
+            renew_at = 0.0
+        else:
+            renew_at = lease.expires_at - self.renew_before - lease.renew_offset
+        return max(renew_at, lease.retry_at)
+
+    def _push(self, lease: Lease):
+        with self._lock:
+            heapq.heappush(self._heap, (self.renew_at(lease), lease.channel_id))
+
+    def add(self, channel_ids: Iterable[str]):
+        """Add channels to subscribe. They are due for renewal immediately."""
+        for channel_id in channel_ids:
+            if self.store.get(channel_id) is not None:
+                continue
+            lease = Lease(
+                channel_id=channel_id, renew_offset=random.uniform(0, self.jitter)
+            )
+            self.store.set(lease)
+            self._push(lease)
+
+    def remove(self, channel_id: str, unsubscribe: bool = True):
+        """Stop renewing the lease of a channel."""
+        self.store.delete(channel_id)
+        if unsubscribe:
+            self.client.subscribe_push_notification(
+                channel_id=channel_id,
+                callback_url=self.callback_url,
+                mode="unsubscribe",
+                secret=self.secret,
+            )
+
+    def confirm(self, channel_id: str, lease_seconds: Optional[int]):
+        """Record the lease granted by the hub in its verification request."""
+        lease = self.store.get(channel_id)
+        if lease is None or lease_seconds is None:
+            return
+        lease.expires_at = self.clock() + lease_seconds
+        self.store.set(lease)
+        self._push(lease)
+
+    def on_verification(
+        self, mode: str, topic: str, lease_seconds: Optional[int]
+    ) -> bool:
+        """Verification callback for PushNotificationReceiver.
+
+        Accepts subscriptions of managed channels and records their lease.
+        """
+        channel_id = channel_id_from_topic(topic)
+        managed = channel_id is not None and self.store.get(channel_id) is not None
+        if mode == "subscribe":
+            if managed:
+                self.confirm(channel_id, lease_seconds)
+            return managed
+        return not managed
+
+    def due(self, limit: Optional[int] = None) -> List[Lease]:
+        """Pop the leases due for renewal, earliest first."""
+        now = self.clock()
+        leases, seen = [], set()
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                if limit is not None and len(leases) >= limit:
+                    break
+                renew_at, channel_id = heapq.heappop(self._heap)
+                lease = self.store.get(channel_id)
+                # Skip entries outdated by a later push for the same lease.
+                if lease is None or self.renew_at(lease) != renew_at:
+                    continue
+                if channel_id in seen:
+                    continue
+                seen.add(channel_id)
+                leases.append(lease)
+        return leases
+
+    def _renew(self, lease: Lease) -> bool:
+        try:
+            ok = self.client.subscribe_push_notification(
+                channel_id=lease.channel_id,
+                callback_url=self.callback_url,
+                lease_seconds=self.lease_seconds,
+                secret=self.secret,
+            )
+        except Exception:
+            ok = False
+
+        if not ok:
+            lease.failures += 1
+            delay = min(self.retry_max, self.retry_base * 2 ** (lease.failures - 1))
+            lease.retry_at = self.clock() + random.uniform(delay / 2, delay)
+        else:
+            # The hub verifies asynchronously, confirm() updates the granted lease.
+            lease.failures = 0
+            lease.retry_at = 0.0
+            lease.expires_at = self.clock() + self.lease_seconds
+            lease.renew_offset = random.uniform(0, self.jitter)
+        self.store.set(lease)
+        self._push(lease)
+        return ok
+
+    def renew_due(self, limit: Optional[int] = None) -> Tuple[int, int]:
+        """Renew the due leases with bounded concurrency.
+
+        Args:
+            limit:
+                Maximum leases to renew in this call.
+
+        Returns:
+            Numbers of renewed and failed leases.
+        """
+        leases = self.due(limit=limit)
+        if not leases:
+            return 0, 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self._renew, leases))
+        self.store.save()
+        renewed = sum(results)
+        return renewed, len(results) - renewed
+
+    def run(self, stop: threading.Event, interval: float = 60.0):
+        """Renew due leases until the stop event is set."""
+        while not stop.is_set():
+            self.renew_due()
+            stop.wait(interval)
+
+    def metrics(self, near_expiry: Optional[int] = None) -> Dict[str, int]:
+        """Counts of the leases by state.
+
+        Args:
+            near_expiry:
+                Seconds before the expiry for a lease to count as near expiry.
+                Defaults to renew_before.
+
+        Returns:
+            total, subscribed, pending, expired, near_expiry and failing counts.
+        """
+        now = self.clock()
+        near_expiry = self.renew_before if near_expiry is None else near_expiry
+        metrics = dict.fromkeys(
+            ("total", "subscribed", "pending", "expired", "near_expiry", "failing"), 0
+        )
+        for lease in self.store.all():
+            metrics["total"] += 1
+            if lease.failures:
+                metrics["failing"] += 1
+            if not lease.expires_at:
+                metrics["pending"] += 1
+            elif lease.expires_at <= now:
+                metrics["expired"] += 1
+            else:
+                metrics["subscribed"] += 1
+                if lease.expires_at - now <= near_expiry:
+                    metrics["near_expiry"] += 1
+        return metrics
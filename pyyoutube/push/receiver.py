@@ -0,0 +1,398 @@
+"""
+Receiver for the PubSubHubbub push notifications subscribed with Client.subscribe_push_notification.
+
+References:
+    https://developers.google.com/youtube/v3/guides/push_notifications
+    https://pubsubhubbub.github.io/PubSubHubbub/pubsubhubbub-core-0.4.html
+"""
+
+import datetime
+import hashlib
+import hmac
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+from urllib.parse import parse_qsl
+from xml.etree import ElementTree
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+YT_NS = "{http://www.youtube.com/xml/schemas/2015}"
+TOMBSTONE_NS = "{http://purl.org/atompub/tombstones/1.0}"
+
+_DATETIME_RE = re.compile(r"^(.*?T\d{2}:\d{2}:\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})?$")
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class PushNotification:
+    """A video published, updated or deleted in a subscribed channel."""
+
+    video_id: str
+    channel_id: Optional[str] = None
+    published: Optional[datetime.datetime] = None
+    updated: Optional[datetime.datetime] = None
+    title: Optional[str] = None
+    link: Optional[str] = None
+    deleted: bool = False
+
+
+def parse_feed_datetime(value: Optional[str]) -> Optional[datetime.datetime]:
+    """Parse feed timestamp like 2015-03-09T19:05:24.552394234+00:00.
+
+    Fractions are truncated to microseconds.
+    """
+    if not value:
+        return None
+    m = _DATETIME_RE.match(value.strip())
+    if m is None:
+        return None
+    base, fraction, tz = m.groups()
+    text = base
+    if fraction:
+        text += "." + fraction[:6].ljust(6, "0")
+    if tz:
+        text += "+00:00" if tz == "Z" else tz
+    try:
+        return datetime.datetime.fromisoformat(text)
+    except ValueError:
+        return None
+
+
+def _text(elem: ElementTree.Element, tag: str) -> Optional[str]:
+    child = elem.find(tag)
+    return child.text.strip() if child is not None and child.text else None
+
+
+def _parse_entry(elem: ElementTree.Element) -> Optional[PushNotification]:
+    if elem.tag == f"{ATOM_NS}entry":
+        video_id = _text(elem, f"{YT_NS}videoId")
+        if video_id is None:
+            return None
+        link = elem.find(f"{ATOM_NS}link")
+        return PushNotification(
+            video_id=video_id,
+            channel_id=_text(elem, f"{YT_NS}channelId"),
+            published=parse_feed_datetime(_text(elem, f"{ATOM_NS}published")),
+            updated=parse_feed_datetime(_text(elem, f"{ATOM_NS}updated")),
+            title=_text(elem, f"{ATOM_NS}title"),
+            link=link.get("href") if link is not None else None,
+        )
+    # <at:deleted-entry ref="yt:video:VIDEO_ID" when="...">
+    ref = elem.get("ref", "")
+    uri = _text(elem, f"{TOMBSTONE_NS}by/{ATOM_NS}uri") or ""
+    return PushNotification(
+        video_id=ref.rsplit(":", 1)[-1],
+        channel_id=uri.rsplit("/", 1)[-1] or None,
+        updated=parse_feed_datetime(elem.get("when")),
+        deleted=True,
+    )
+
+
+class FeedParser:
+    """Incremental Atom feed parser."""
+
+    def __init__(self) -> None:
+        self._parser = ElementTree.XMLPullParser(events=("end",))
+        self.notifications: List[PushNotification] = []
+
+    def _drain(self):
+        for _, elem in self._parser.read_events():
+            if elem.tag in (f"{ATOM_NS}entry", f"{TOMBSTONE_NS}deleted-entry"):
+                notification = _parse_entry(elem)
+                if notification is not None:
+                    self.notifications.append(notification)
+                elem.clear()
+
+    def feed(self, data: bytes):
+        self._parser.feed(data)
+        self._drain()
+
+    def close(self) -> List[PushNotification]:
+        self._parser.close()
+        self._drain()
+        return self.notifications
+
+
+def parse_feed(body: Union[bytes, Iterable[bytes]]) -> List[PushNotification]:
+    """Parse the Atom feed of a notification.
+
+    Args:
+        body:
+            Feed content, or an iterable of its chunks.
+
+    Returns:
+        Notifications in the feed.
+    """
+    parser = FeedParser()
+    for chunk in [body] if isinstance(body, (bytes, str)) else body:
+        parser.feed(chunk)
+    return parser.close()
+
+
+def _signature_matches(hexdigest: str, signature: Optional[str]) -> bool:
+    method, _, value = (signature or "").partition("=")
+    # Bytes, compare_digest rejects strings with non-ASCII characters.
+    value = value.strip().lower().encode("utf-8")
+    return method == "sha1" and hmac.compare_digest(hexdigest.encode("ascii"), value)
+
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    """Check the X-Hub-Signature header in constant time."""
+    expected = hmac.new(secret.encode("utf-8"), body, hashlib.sha1).hexdigest()
+    return _signature_matches(expected, signature)
+
+
+class NotificationReader:
+    def __init__(self, receiver: "PushNotificationReceiver") -> None:
+        """Parse and hash a notification body in a single pass.
+
+        Args:
+            receiver:
+                Receiver to dispatch the notifications.
+        """
+        self.receiver = receiver
+        self.parser = FeedParser()
+        self.digest = (
+            hmac.new(receiver.secret.encode("utf-8"), digestmod=hashlib.sha1)
+            if receiver.secret is not None
+            else None
+        )
+        self.failed = False
+
+    def feed(self, chunk: bytes):
+        if self.digest is not None:
+            self.digest.update(chunk)
+        if self.failed:
+            return
+        try:
+            self.parser.feed(chunk)
+        except ElementTree.ParseError:
+            self.failed = True
+
+    def finish(self, signature: Optional[str] = None) -> List[PushNotification]:
+        """Verify the signature, then dispatch the new notifications.
+
+        Returns:
+            The new notifications. Empty if the body or the signature is invalid.
+        """
+        if not self.failed:
+            try:
+                notifications = self.parser.close()
+            except ElementTree.ParseError:
+                self.failed = True
+        if self.failed:
+            return []
+        if self.digest is not None and not _signature_matches(
+            self.digest.hexdigest(), signature
+        ):
+            return []
+        return self.receiver._dispatch(notifications)
+
+
+class PushNotificationReceiver:
+    def __init__(
+        self,
+        secret: Optional[str] = None,
+        on_notification: Optional[Callable[[PushNotification], None]] = None,
+        on_verification: Optional[Callable[[str, str, Optional[int]], bool]] = None,
+        cache_size: int = 4096,
+    ) -> None:
+        """Callback endpoint for the hub.
+
+        Use ``handle`` in any web framework, or mount ``wsgi_app`` / ``asgi_app``.
+
+        Args:
+            secret:
+                The secret given to subscribe_push_notification. Notifications without a
+                valid signature are ignored if provided.
+            on_notification:
+                Called for each new notification. Redeliveries are skipped.
+            on_verification:
+                Called with mode, topic and lease seconds when the hub verifies a
+                (un)subscription. Return False to deny it.
+            cache_size:
+                Number of notifications remembered to skip redeliveries.
+        """
+        self.secret = secret
+        self.on_notification = on_notification
+        self.on_verification = on_verification
+        self.cache_size = cache_size
+        self._seen: "OrderedDict[tuple, None]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(notification: PushNotification) -> tuple:
+        return notification.video_id, notification.updated, notification.deleted
+
+    def is_duplicate(self, notification: PushNotification) -> bool:
+        """Record the notification, return True if it was already received."""
+        key = self._key(notification)
+        with self._lock:
+            if key in self._seen:
+                self._seen.move_to_end(key)
+                return True
+            self._seen[key] = None
+            if len(self._seen) > self.cache_size:
+                self._seen.popitem(last=False)
+        return False
+
+    def forget(self, notification: PushNotification):
+        """Drop the notification from the record, its redelivery is dispatched."""
+        with self._lock:
+            self._seen.pop(self._key(notification), None)
+
+    def handle_verification(self, params: Mapping[str, str]) -> Tuple[int, str]:
+        """Answer the hub's verification of intent.
+
+        Returns:
+            Status code and the body to respond.
+        """
+        mode = params.get("hub.mode")
+        topic = params.get("hub.topic")
+        challenge = params.get("hub.challenge")
+        if mode not in ("subscribe", "unsubscribe") or not topic or not challenge:
+            return 400, ""
+        lease_seconds = params.get("hub.lease_seconds")
+        try:
+            lease_seconds = int(lease_seconds) if lease_seconds else None
+        except ValueError:
+            return 400, ""
+        if self.on_verification is not None:
+            if self.on_verification(mode, topic, lease_seconds) is False:
+                return 404, ""
+        return 200, challenge
+
+    def handle_notification(
+        self, body: Union[bytes, Iterable[bytes]], signature: Optional[str] = None
+    ) -> List[PushNotification]:
+        """Verify and parse a notification, then dispatch the new entries.
+
+        Args:
+            body:
+                Request body, or an iterable of its chunks.
+            signature:
+                Value of the X-Hub-Signature header.
+
+        Returns:
+            The new notifications. Empty if the signature is invalid.
+        """
+        reader = self.reader()
+        for chunk in [body] if isinstance(body, bytes) else body:
+            reader.feed(chunk)
+        return reader.finish(signature)
+
+    def reader(self) -> "NotificationReader":
+        """Reader to feed a notification body chunk by chunk."""
+        return NotificationReader(self)
+
+    def _dispatch(
+        self, notifications: List[PushNotification]
+    ) -> List[PushNotification]:
+        new = [n for n in notifications if not self.is_duplicate(n)]
+        if self.on_notification is not None:
+            for index, notification in enumerate(new):
+                try:
+                    self.on_notification(notification)
+                except Exception:
+                    # Not handled, the hub redelivers them after the error.
+                    for pending in new[index:]:
+                        self.forget(pending)
+                    raise
+        return new
+
+    def handle(
+        self,
+        method: str,
+        params: Mapping[str, str],
+        headers: Mapping[str, str],
+        body: Union[bytes, Iterable[bytes]] = b"",
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """Framework independent handler.
+
+        Args:
+            method:
+                HTTP method of the request.
+            params:
+                Query parameters.
+            headers:
+                Request headers, the keys are case-insensitive.
+            body:
+                Request body, or an iterable of its chunks.
+
+        Returns:
+            Status code, headers and body for the response.
+        """
+        if method == "GET":
+            status, text = self.handle_verification(params)
+            return status, {"Content-Type": "text/plain"}, text.encode("utf-8")
+        if method == "POST":
+            signature = None
+            for key, value in headers.items():
+                if key.lower() == "x-hub-signature":
+                    signature = value
+            # Always acknowledge, the hub must not retry messages with a bad signature.
+            self.handle_notification(body, signature)
+            return 204, {}, b""
+        return 405, {"Allow": "GET, POST"}, b""
+
+    def wsgi_app(self, environ, start_response):
+        """WSGI application for the callback url."""
+        params = dict(parse_qsl(environ.get("QUERY_STRING", "")))
+        headers = {}
+        if "HTTP_X_HUB_SIGNATURE" in environ:
+            headers["X-Hub-Signature"] = environ["HTTP_X_HUB_SIGNATURE"]
+
+        def read_body():
+            stream = environ["wsgi.input"]
+            remaining = int(environ.get("CONTENT_LENGTH") or 0)
+            while remaining > 0:
+                chunk = stream.read(min(READ_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                yield chunk
+
+        status, resp_headers, body = self.handle(
+            environ["REQUEST_METHOD"], params, headers, read_body()
+        )
+        reason = HTTPStatus(status).phrase
+        start_response(f"{status} {reason}", list(resp_headers.items()))
+        return [body]
+
+    async def asgi_app(self, scope, receive, send):
+        """ASGI application for the callback url."""
+        if scope["type"] != "http":
+            return
+        params = dict(parse_qsl(scope.get("query_string", b"").decode("latin-1")))
+        headers = {
+            key.decode("latin-1"): value.decode("latin-1")
+            for key, value in scope.get("headers", [])
+        }
+
+        if scope["method"] == "POST":
+            reader = self.reader()
+            while True:
+                message = await receive()
+                reader.feed(message.get("body", b""))
+                if not message.get("more_body"):
+                    break
+            signature = headers.get("x-hub-signature")
+            reader.finish(signature)
+            status, resp_headers, body = 204, {}, b""
+        else:
+            status, resp_headers, body = self.handle(scope["method"], params, headers)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (k.lower().encode("latin-1"), v.encode("latin-1"))
+                    for k, v in resp_headers.items()
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
@@ -1,20 +1,54 @@
-from .activities import ActivitiesResource  # noqa
-from .captions import CaptionsResource  # noqa
-from .channel_banners import ChannelBannersResource  # noqa
-from .channels import ChannelsResource  # noqa
-from .channel_sections import ChannelSectionsResource  # noqa
-from .comments import CommentsResource  # noqa
-from .comment_threads import CommentThreadsResource  # noqa
-from .i18n_languages import I18nLanguagesResource  # noqa
-from .i18n_regions import I18nRegionsResource  # noqa
-from .members import MembersResource  # noqa
-from .membership_levels import MembershipLevelsResource  # noqa
-from .playlist_items import PlaylistItemsResource  # noqa
-from .playlists import PlaylistsResource  # noqa
-from .search import SearchResource  # noqa
-from .subscriptions import SubscriptionsResource  # noqa
-from .thumbnails import ThumbnailsResource  # noqa
-from .video_abuse_report_reasons import VideoAbuseReportReasonsResource  # noqa
-from .video_categories import VideoCategoriesResource  # noqa
-from .videos import VideosResource  # noqa
-from .watermarks import WatermarksResource  # noqa
+"""
+Resources of the YouTube Data API. They are imported on first access.
+"""
+
+from typing import TYPE_CHECKING
+
+from pyyoutube.utils.lazy import lazy_exports
+
+_EXPORTS = {
+    ".activities": ("ActivitiesResource",),
+    ".captions": ("CaptionsResource",),
+    ".channel_banners": ("ChannelBannersResource",),
+    ".channels": ("ChannelsResource",),
+    ".channel_sections": ("ChannelSectionsResource",),
+    ".comments": ("CommentsResource",),
+    ".comment_threads": ("CommentThreadsResource",),
+    ".i18n_languages": ("I18nLanguagesResource",),
+    ".i18n_regions": ("I18nRegionsResource",),
+    ".members": ("MembersResource",),
+    ".membership_levels": ("MembershipLevelsResource",),
+    ".playlist_items": ("PlaylistItemsResource",),
+    ".playlists": ("PlaylistsResource",),
+    ".search": ("SearchResource",),
+    ".subscriptions": ("SubscriptionsResource",),
+    ".thumbnails": ("ThumbnailsResource",),
+    ".video_abuse_report_reasons": ("VideoAbuseReportReasonsResource",),
+    ".video_categories": ("VideoCategoriesResource",),
+    ".videos": ("VideosResource",),
+    ".watermarks": ("WatermarksResource",),
+}
+
+__getattr__, __dir__, __all__ = lazy_exports(__name__, _EXPORTS)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .activities import ActivitiesResource  # noqa
+    from .captions import CaptionsResource  # noqa
+    from .channel_banners import ChannelBannersResource  # noqa
+    from .channels import ChannelsResource  # noqa
+    from .channel_sections import ChannelSectionsResource  # noqa
+    from .comments import CommentsResource  # noqa
+    from .comment_threads import CommentThreadsResource  # noqa
+    from .i18n_languages import I18nLanguagesResource  # noqa
+    from .i18n_regions import I18nRegionsResource  # noqa
+    from .members import MembersResource  # noqa
+    from .membership_levels import MembershipLevelsResource  # noqa
+    from .playlist_items import PlaylistItemsResource  # noqa
+    from .playlists import PlaylistsResource  # noqa
+    from .search import SearchResource  # noqa
+    from .subscriptions import SubscriptionsResource  # noqa
+    from .thumbnails import ThumbnailsResource  # noqa
+    from .video_abuse_report_reasons import VideoAbuseReportReasonsResource  # noqa
+    from .video_categories import VideoCategoriesResource  # noqa
+    from .videos import VideosResource  # noqa
+    from .watermarks import WatermarksResource  # noqa
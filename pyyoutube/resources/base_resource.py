@@ -2,6 +2,7 @@
 Base resource class.
 """
 
+import importlib
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -21,3 +22,29 @@ class Resource:
     @property
     def api_key(self):
         return self._client.api_key
+
+
+class LazyResource:
+    def __init__(self, resource_cls_name: str):
+        """Client attribute creating its resource on first access.
+
+        The resource is stored on the client instance, which shadows this
+        descriptor for later accesses.
+
+        Args:
+            resource_cls_name:
+                Name of the resource class in pyyoutube.resources.
+        """
+        self.resource_cls_name = resource_cls_name
+        self.name = None
+
+    def __set_name__(self, owner, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        resources = importlib.import_module("pyyoutube.resources")
+        resource = getattr(resources, self.resource_cls_name)(instance)
+        instance.__dict__[self.name] = resource
+        return resource
@@ -2,9 +2,14 @@
 Captions resource implementation
 """
 
-from typing import Optional, Union
+import os
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO, Dict, Iterator, List, Optional, Union
 
-from requests import Response
+from requests import RequestException, Response
+
+from pyyoutube.error import PyYouTubeException, error_from_response
 
 from pyyoutube.resources.base_resource import Resource
 from pyyoutube.media import Media, MediaUpload
@@ -186,6 +191,7 @@ class CaptionsResource(Resource):
         on_behalf_of_content_owner: Optional[str] = None,
         tfmt: Optional[str] = None,
         tlang: Optional[str] = None,
+        stream: bool = False,
         **kwargs,
     ) -> Response:
         """Downloads a caption track.
@@ -206,6 +212,8 @@ class CaptionsResource(Resource):
                     vtt – Web Video Text Tracks caption
             tlang:
                 Specifies that the API response should return a translation of the specified caption track.
+            stream:
+                If True, the response body is not downloaded until it is read.
             **kwargs:
                 Additional parameters for system parameters.
                 Refer: https://cloud.google.com/apis/docs/system-parameters.
@@ -223,9 +231,184 @@ class CaptionsResource(Resource):
         response = self._client.request(
             path=f"captions/{caption_id}",
             params=params,
+            stream=stream,
         )
         return response
 
+    def iter_download(
+        self,
+        caption_id: str,
+        chunk_size: int = 64 * 1024,
+        on_behalf_of_content_owner: Optional[str] = None,
+        tfmt: Optional[str] = None,
+        tlang: Optional[str] = None,
+        **kwargs,
+    ) -> Iterator[bytes]:
+        """Downloads a caption track and yields its content in chunks.
+
+        The track is never fully buffered in memory.
+
+        Args:
+            caption_id:
+                ID for the caption track that is being downloaded.
+            chunk_size:
+                Size of the chunks to yield.
+            on_behalf_of_content_owner:
+                This parameter can only be used in a properly authorized request.
+                Note: This parameter is intended exclusively for YouTube content partners.
+            tfmt:
+                Specifies that the caption track should be returned in a specific format.
+            tlang:
+                Specifies that the API response should return a translation of the specified caption track.
+            **kwargs:
+                Additional parameters for system parameters.
+                Refer: https://cloud.google.com/apis/docs/system-parameters.
+
+        Returns:
+            Iterator of bytes chunks.
+
+        Raises:
+            PyYouTubeException: Request not success.
+        """
+        response = self.download(
+            caption_id=caption_id,
+            on_behalf_of_content_owner=on_behalf_of_content_owner,
+            tfmt=tfmt,
+            tlang=tlang,
+            stream=True,
+            **kwargs,
+        )
+        with response:
+            if not response.ok:
+                raise error_from_response(response)
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if chunk:
+                    yield chunk
+
+    def download_to(
+        self,
+        caption_id: str,
+        destination: Union[str, os.PathLike, IO[bytes]],
+        chunk_size: int = 64 * 1024,
+        on_behalf_of_content_owner: Optional[str] = None,
+        tfmt: Optional[str] = None,
+        tlang: Optional[str] = None,
+        **kwargs,
+    ) -> int:
+        """Downloads a caption track into a file.
+
+        Args:
+            caption_id:
+                ID for the caption track that is being downloaded.
+            destination:
+                File path or binary file object to write the track to.
+            chunk_size:
+                Size of the chunks read from the response.
+            on_behalf_of_content_owner:
+                This parameter can only be used in a properly authorized request.
+                Note: This parameter is intended exclusively for YouTube content partners.
+            tfmt:
+                Specifies that the caption track should be returned in a specific format.
+            tlang:
+                Specifies that the API response should return a translation of the specified caption track.
+            **kwargs:
+                Additional parameters for system parameters.
+                Refer: https://cloud.google.com/apis/docs/system-parameters.
+
+        Returns:
+            Number of bytes written.
+
+        Raises:
+            PyYouTubeException: Request not success.
+        """
+        chunks = self.iter_download(
+            caption_id=caption_id,
+            chunk_size=chunk_size,
+            on_behalf_of_content_owner=on_behalf_of_content_owner,
+            tfmt=tfmt,
+            tlang=tlang,
+            **kwargs,
+        )
+        if hasattr(destination, "write"):
+            return sum(destination.write(chunk) for chunk in chunks)
+
+        # Request the track before creating the file, so errors leave nothing behind.
+        first = next(chunks, b"")
+        # Write aside, a download failing midway must not leave a truncated track.
+        directory, name = os.path.split(os.fspath(destination))
+        fd, temp_path = tempfile.mkstemp(
+            dir=directory or None, prefix=f".{name}.", suffix=".part"
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                written = f.write(first)
+                for chunk in chunks:
+                    written += f.write(chunk)
+            os.replace(temp_path, destination)
+        except BaseException:
+            os.remove(temp_path)
+            raise
+        return written
+
+    def download_many(
+        self,
+        caption_ids: List[str],
+        directory: Union[str, os.PathLike],
+        max_workers: int = 4,
+        on_behalf_of_content_owner: Optional[str] = None,
+        tfmt: Optional[str] = None,
+        tlang: Optional[str] = None,
+        **kwargs,
+    ) -> Dict[str, Union[str, PyYouTubeException, RequestException]]:
+        """Downloads many caption tracks concurrently into a directory.
+
+        Each track is saved as ``{caption_id}.{tfmt}``, or with ``caption`` extension if
+        no format specified.
+
+        Args:
+            caption_ids:
+                IDs for the caption tracks to download.
+            directory:
+                Directory to save the tracks.
+            max_workers:
+                Maximum number of tracks downloading at the same time.
+            on_behalf_of_content_owner:
+                This parameter can only be used in a properly authorized request.
+                Note: This parameter is intended exclusively for YouTube content partners.
+            tfmt:
+                Specifies that the caption track should be returned in a specific format.
+            tlang:
+                Specifies that the API response should return a translation of the specified caption track.
+            **kwargs:
+                Additional parameters for system parameters.
+                Refer: https://cloud.google.com/apis/docs/system-parameters.
+
+        Returns:
+            Mapping of caption id to the saved file path, or to the exception if download failed.
+        """
+        extension = tfmt or "caption"
+
+        def download(
+            caption_id: str,
+        ) -> Union[str, PyYouTubeException, RequestException]:
+            path = os.path.join(directory, f"{caption_id}.{extension}")
+            try:
+                self.download_to(
+                    caption_id=caption_id,
+                    destination=path,
+                    on_behalf_of_content_owner=on_behalf_of_content_owner,
+                    tfmt=tfmt,
+                    tlang=tlang,
+                    **kwargs,
+                )
+            except (PyYouTubeException, RequestException) as e:
+                return e
+            return path
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(download, caption_ids)
+            return dict(zip(caption_ids, results))
+
     def delete(
         self,
         caption_id: str,
@@ -2,11 +2,11 @@
 Channel resource implementation.
 """
 
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 from pyyoutube.error import PyYouTubeException, ErrorMessage, ErrorCode
 from pyyoutube.resources.base_resource import Resource
-from pyyoutube.models import Channel, ChannelListResponse
+from pyyoutube.models import Channel, ChannelListResponse, Video
 from pyyoutube.utils.params_checker import enf_comma_separated, enf_parts
 
 
@@ -119,6 +119,42 @@ class ChannelsResource(Resource):
         data = self._client.parse_response(response=response)
         return data if return_json else ChannelListResponse.from_dict(data)
 
+    def iter_all_videos(
+        self,
+        channel_id: Union[str, list, tuple, set],
+        parts: Optional[Union[str, list, tuple, set]] = None,
+        max_workers: int = 4,
+        return_json: bool = False,
+    ) -> Iterator[Union[dict, Video]]:
+        """Yields all videos of the channels through their uploads playlist.
+
+        Uses channels.list, playlistItems.list and videos.list which cost 1 quota unit each,
+        instead of 100 units for each search.list page.
+
+        Args:
+            channel_id:
+                Comma-separated list of the YouTube channel ID(s).
+            parts:
+                Comma-separated list of one or more video resource properties.
+            max_workers:
+                Number of threads for the playlist pages and for the videos requests.
+            return_json:
+                Type for returned data. If you set True JSON data will be returned.
+
+        Returns:
+            Iterator of videos data.
+        """
+        # Imported here, the pipelines are not loaded until used.
+        from pyyoutube.pipelines.channel_videos import iter_channel_videos
+
+        return iter_channel_videos(
+            client=self._client,
+            channel_ids=channel_id,
+            parts=parts,
+            max_workers=max_workers,
+            return_json=return_json,
+        )
+
     def update(
         self,
         part: str,
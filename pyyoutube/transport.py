@@ -0,0 +1,278 @@
+"""
+Record/replay transport to run clients against saved responses.
+
+Transports are requests adapters mounted on the session of Client or Api.
+
+Usage:
+    # Record the real exchanges.
+    transport = CassetteTransport("cassette.json", mode="record")
+    client = Client(api_key="KEY", transport=transport)
+    client.videos.list(video_id="VIDEO_ID")
+    transport.save()
+
+    # Serve them back offline, with 50 ms per request.
+    transport = CassetteTransport("cassette.json", mode="replay", latency=0.05)
+    client = Client(api_key="KEY", transport=transport)
+"""
+
+import base64
+import io
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from pyyoutube.error import ErrorCode, ErrorMessage, PyYouTubeException
+
+# Query or form parameters holding credentials, never saved in a cassette.
+CREDENTIAL_PARAMS = (
+    "key",
+    "access_token",
+    "refresh_token",
+    "client_secret",
+    "code",
+    "hub.secret",
+)
+
+# Json fields of response bodies holding credentials, like the OAuth tokens.
+CREDENTIAL_FIELDS = frozenset(
+    {"access_token", "refresh_token", "id_token", "client_secret"}
+)
+REDACTED = "REDACTED"
+
+# Response headers not worth saving, or holding credentials.
+SKIPPED_HEADERS = (
+    "content-encoding",
+    "content-length",
+    "transfer-encoding",
+    "set-cookie",
+)
+
+
+def _scrub_query(query: str) -> str:
+    return urlencode(
+        sorted(
+            (name, value)
+            for name, value in parse_qsl(query, keep_blank_values=True)
+            if name not in CREDENTIAL_PARAMS
+        )
+    )
+
+
+def request_key(request: PreparedRequest) -> str:
+    """Key matching a request with its recording, without the credentials."""
+    parts = urlsplit(request.url)
+    url = urlunsplit(parts._replace(query=_scrub_query(parts.query)))
+    key = f"{request.method.upper()} {url}"
+    body = request.body
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    if body:
+        content_type = request.headers.get("Content-Type", "")
+        if content_type.startswith("application/x-www-form-urlencoded"):
+            body = _scrub_query(body)
+        key += f" {body}"
+    return key
+
+
+def _redact(data):
+    if isinstance(data, dict):
+        return {
+            k: REDACTED if k in CREDENTIAL_FIELDS else _redact(v)
+            for k, v in data.items()
+        }
+    if isinstance(data, list):
+        return [_redact(v) for v in data]
+    return data
+
+
+def _scrub_body(content: bytes) -> bytes:
+    """Json body with the credential fields redacted, other bodies as they are."""
+    if not any(field.encode() in content for field in CREDENTIAL_FIELDS):
+        return content
+    try:
+        data = json.loads(content)
+    except ValueError:
+        return content
+    return json.dumps(_redact(data)).encode("utf-8")
+
+
+def _encode_body(content: bytes) -> Dict[str, str]:
+    try:
+        return {"body": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body_base64": base64.b64encode(content).decode("ascii")}
+
+
+def _decode_body(data: dict) -> bytes:
+    if "body_base64" in data:
+        return base64.b64decode(data["body_base64"])
+    return data.get("body", "").encode("utf-8")
+
+
+class Cassette:
+    def __init__(self, path: Optional[str] = None) -> None:
+        """Recorded exchanges, saved in a json file.
+
+        Args:
+            path:
+                Path for the cassette file. Loaded if it exists.
+        """
+        self.path = path
+        self.interactions: List[dict] = []
+        self._by_key: Dict[str, List[dict]] = defaultdict(list)
+        self._played: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        if path is not None and os.path.exists(path):
+            with open(path, "r") as f:
+                for interaction in json.load(f)["interactions"]:
+                    self._add(interaction)
+
+    def _add(self, interaction: dict):
+        self.interactions.append(interaction)
+        self._by_key[interaction["key"]].append(interaction)
+
+    def record(self, request: PreparedRequest, response: Response):
+        interaction = {
+            "key": request_key(request),
+            "status": response.status_code,
+            "reason": response.reason,
+            "headers": {
+                k: v
+                for k, v in response.headers.items()
+                if k.lower() not in SKIPPED_HEADERS
+            },
+            **_encode_body(_scrub_body(response.content)),
+        }
+        with self._lock:
+            self._add(interaction)
+
+    def play(self, key: str, repeat: bool = True) -> Optional[dict]:
+        """Next recorded interaction of the request.
+
+        Identical requests get the recordings in order. After the last one, it is
+        served again if ``repeat``.
+        """
+        with self._lock:
+            recorded = self._by_key.get(key)
+            if not recorded:
+                return None
+            index = self._played[key]
+            if index >= len(recorded):
+                if not repeat:
+                    return None
+                index = len(recorded) - 1
+            self._played[key] = index + 1
+            return recorded[index]
+
+    def rewind(self):
+        with self._lock:
+            self._played.clear()
+
+    def save(self, path: Optional[str] = None):
+        """Write the cassette file, replacing the old one atomically."""
+        path = path or self.path
+        with self._lock:
+            data = {"interactions": list(self.interactions)}
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=1)
+        os.replace(tmp_path, path)
+
+
+class CassetteTransport(BaseAdapter):
+    def __init__(
+        self,
+        cassette: Union[str, Cassette],
+        mode: str = "replay",
+        latency: Union[float, Callable[[], float]] = 0.0,
+        repeat: bool = True,
+        adapter: Optional[BaseAdapter] = None,
+    ) -> None:
+        """Transport recording the exchanges into a cassette, or serving them back.
+
+        Args:
+            cassette:
+                Cassette, or path for its file.
+            mode:
+                record sends the requests and records the responses.
+                replay serves the recorded responses without network.
+            latency:
+                Seconds to wait before serving a replayed response, or a function
+                returning them, to simulate the network.
+            repeat:
+                Whether to serve the last recording again when identical requests
+                outnumber the recordings.
+            adapter:
+                Adapter sending the requests in record mode, defaults to HTTPAdapter.
+
+        Raises:
+            PyYouTubeException: Unknown mode.
+        """
+        super().__init__()
+        if mode not in ("record", "replay"):
+            raise PyYouTubeException(
+                ErrorMessage(
+                    status_code=ErrorCode.INVALID_PARAMS,
+                    message=f"Transport mode must be record or replay, not {mode}",
+                )
+            )
+        self.cassette = (
+            cassette if isinstance(cassette, Cassette) else Cassette(cassette)
+        )
+        self.mode = mode
+        self.latency = latency
+        self.repeat = repeat
+        self.adapter = adapter
+        if mode == "record" and adapter is None:
+            self.adapter = HTTPAdapter()
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        if self.mode == "record":
+            response = self.adapter.send(request, **kwargs)
+            self.cassette.record(request, response)
+            return response
+
+        key = request_key(request)
+        interaction = self.cassette.play(key, repeat=self.repeat)
+        if interaction is None:
+            raise PyYouTubeException(
+                ErrorMessage(
+                    status_code=ErrorCode.HTTP_ERROR,
+                    message=f"No recorded response for {key}",
+                )
+            )
+        latency = self.latency() if callable(self.latency) else self.latency
+        if latency > 0:
+            time.sleep(latency)
+        return self._build_response(request, interaction)
+
+    def _build_response(self, request: PreparedRequest, interaction: dict) -> Response:
+        response = Response()
+        response.status_code = interaction["status"]
+        response.reason = interaction.get("reason")
+        response.headers = CaseInsensitiveDict(interaction.get("headers", {}))
+        content = _decode_body(interaction)
+        response._content = content
+        # Read already, iter_content serves the content; raw for the stream users.
+        response._content_consumed = True
+        response.raw = io.BytesIO(content)
+        response.encoding = "utf-8"
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def save(self, path: Optional[str] = None):
+        self.cassette.save(path)
+
+    def close(self):
+        if self.adapter is not None:
+            self.adapter.close()
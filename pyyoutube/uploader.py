@@ -0,0 +1,339 @@
+"""
+Upload scheduler to publish batches of videos with their thumbnails, captions and playlist placement.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Union, TYPE_CHECKING
+
+from pyyoutube.error import ErrorCode, ErrorMessage, QuotaExceeded
+from pyyoutube.media import Media, MediaUpload
+from pyyoutube.models import Caption, PlaylistItem, Video
+from pyyoutube.utils.constants import QUOTA_COSTS
+
+if TYPE_CHECKING:
+    from pyyoutube import Client  # pragma: no cover
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CaptionUploadJob:
+    """A caption track to upload once the video id is known."""
+
+    body: Union[dict, Caption]
+    media: Media
+    parts: Optional[Union[str, list, tuple, set]] = None
+
+
+@dataclass
+class UploadJob:
+    """One entry of the upload manifest.
+
+    The thumbnail, captions and playlist items are chained after the video upload,
+    because they all need the new video id.
+    """
+
+    body: Union[dict, Video]
+    media: Media
+    parts: Optional[Union[str, list, tuple, set]] = None
+    notify_subscribers: Optional[bool] = None
+    thumbnail: Optional[Media] = None
+    captions: List[CaptionUploadJob] = field(default_factory=list)
+    playlist_ids: List[str] = field(default_factory=list)
+    client: Optional["Client"] = None
+
+
+@dataclass
+class UploadResult:
+    """Outcome for one manifest entry."""
+
+    job: UploadJob
+    video: Optional[Video] = None
+    thumbnail: Optional[dict] = None
+    captions: List[Caption] = field(default_factory=list)
+    playlist_items: List[PlaylistItem] = field(default_factory=list)
+    errors: List[Exception] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+@dataclass
+class UploadSchedulerProgress:
+    """Aggregate progress over all jobs of a run."""
+
+    total_bytes: int = 0
+    uploaded_bytes: int = 0
+    total_jobs: int = 0
+    finished_jobs: int = 0
+    failed_jobs: int = 0
+    quota_used: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Uploaded bytes per second."""
+        if self.elapsed <= 0:
+            return 0.0
+        return self.uploaded_bytes / self.elapsed
+
+    def progress(self) -> float:
+        if not self.total_bytes:
+            return 0.0
+        return self.uploaded_bytes / self.total_bytes
+
+
+class QuotaBudget:
+    def __init__(self, limit: int):
+        """Thread safe counter for the quota units a run may spend.
+
+        Args:
+            limit:
+                Maximum quota units to spend.
+        """
+        self.limit = limit
+        self.used = 0
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> int:
+        return self.limit - self.used
+
+    def consume(self, units: int):
+        """Reserve quota units.
+
+        Raises:
+            QuotaExceeded: Not enough quota left.
+        """
+        with self._lock:
+            if self.used + units > self.limit:
+                raise QuotaExceeded(
+                    ErrorMessage(
+                        status_code=ErrorCode.QUOTA_EXHAUSTED,
+                        message=f"Quota budget exhausted, need {units} units but {self.limit - self.used} left",
+                    )
+                )
+            self.used += units
+
+
+def _credential_key(client: "Client") -> str:
+    return client.access_token or client.api_key or str(id(client))
+
+
+class UploadScheduler:
+    def __init__(
+        self,
+        client: "Client",
+        max_workers: int = 4,
+        per_credential_concurrency: int = 2,
+        quota: Optional[Union[int, QuotaBudget]] = None,
+        quota_costs: Optional[Dict[str, int]] = None,
+        on_progress: Optional[Callable[[UploadSchedulerProgress], None]] = None,
+    ) -> None:
+        """Run the media uploads of a manifest on a bounded worker pool.
+
+        Args:
+            client:
+                Default client instance. Each job can use its own client.
+            max_workers:
+                Number of threads uploading at the same time.
+            per_credential_concurrency:
+                Maximum running upload steps for one credential.
+            quota:
+                Quota units the run may spend. No limit if not provided.
+            quota_costs:
+                Overrides for the quota cost of each operation.
+            on_progress:
+                Callback called with a progress snapshot after each uploaded chunk.
+        """
+        self.client = client
+        self.max_workers = max_workers
+        self.per_credential_concurrency = per_credential_concurrency
+        if isinstance(quota, int):
+            quota = QuotaBudget(limit=quota)
+        self.quota = quota
+        self.quota_costs = {**QUOTA_COSTS, **(quota_costs or {})}
+        self.on_progress = on_progress
+
+        self._lock = threading.Lock()
+        self._semaphores: Dict[str, threading.BoundedSemaphore] = {}
+        self._progress = UploadSchedulerProgress()
+        self._started = 0.0
+
+    def _semaphore(self, client: "Client") -> threading.BoundedSemaphore:
+        key = _credential_key(client)
+        with self._lock:
+            if key not in self._semaphores:
+                self._semaphores[key] = threading.BoundedSemaphore(
+                    self.per_credential_concurrency
+                )
+            return self._semaphores[key]
+
+    def _charge(self, operation: str):
+        units = self.quota_costs.get(operation, 0)
+        if self.quota is not None:
+            self.quota.consume(units)
+        with self._lock:
+            self._progress.quota_used += units
+
+    def _report(self, uploaded: int = 0, finished: bool = False, failed=False):
+        with self._lock:
+            self._progress.uploaded_bytes += uploaded
+            if finished:
+                self._progress.finished_jobs += 1
+            if failed:
+                self._progress.failed_jobs += 1
+            self._progress.elapsed = time.monotonic() - self._started
+            snapshot = UploadSchedulerProgress(**self._progress.__dict__)
+        if self.on_progress is not None:
+            # A failing callback must not fail the upload nor stop the run.
+            try:
+                self.on_progress(snapshot)
+            except Exception:
+                logger.exception("Upload progress callback failed")
+
+    @property
+    def progress(self) -> UploadSchedulerProgress:
+        with self._lock:
+            return UploadSchedulerProgress(**self._progress.__dict__)
+
+    def _run_upload(self, client: "Client", operation: str, upload: MediaUpload):
+        with self._semaphore(client):
+            self._charge(operation)
+            response, sent = None, 0
+            while response is None:
+                status, response = upload.next_chunk()
+                done = upload.media.size if status is None else status.progressed_seize
+                self._report(uploaded=max(done - sent, 0))
+                sent = max(done, sent)
+            return response
+
+    def _upload_video(self, job: UploadJob, result: UploadResult) -> Video:
+        client = job.client or self.client
+        body = job.body if isinstance(job.body, Video) else Video.from_dict(job.body)
+        upload = client.videos.insert(
+            body=body,
+            media=job.media,
+            parts=job.parts,
+            notify_subscribers=job.notify_subscribers,
+        )
+        data = self._run_upload(client, "videos.insert", upload)
+        result.video = Video.from_dict(data)
+        return result.video
+
+    def _upload_thumbnail(self, job: UploadJob, result: UploadResult):
+        client = job.client or self.client
+        upload = client.thumbnails.set(video_id=result.video.id, media=job.thumbnail)
+        result.thumbnail = self._run_upload(client, "thumbnails.set", upload)
+
+    def _upload_caption(self, job: UploadJob, result: UploadResult, caption):
+        client = job.client or self.client
+        body = (
+            caption.body.to_dict_ignore_none()
+            if isinstance(caption.body, Caption)
+            else dict(caption.body)
+        )
+        body.setdefault("snippet", {})["videoId"] = result.video.id
+        upload = client.captions.insert(
+            body=Caption.from_dict(body), media=caption.media, parts=caption.parts
+        )
+        data = self._run_upload(client, "captions.insert", upload)
+        with self._lock:
+            result.captions.append(Caption.from_dict(data))
+
+    def _insert_playlist_item(self, job: UploadJob, result: UploadResult, playlist_id):
+        client = job.client or self.client
+        body = {
+            "snippet": {
+                "playlistId": playlist_id,
+                "resourceId": {"kind": "youtube#video", "videoId": result.video.id},
+            }
+        }
+        with self._semaphore(client):
+            self._charge("playlistItems.insert")
+            item = client.playlistItems.insert(body=body, parts="snippet")
+        with self._lock:
+            result.playlist_items.append(item)
+
+    def run(self, jobs: List[UploadJob]) -> List[UploadResult]:
+        """Upload all jobs and wait for them to finish.
+
+        Videos are uploaded first, the dependent steps of a job are scheduled
+        on the pool as soon as its video id is known.
+
+        Args:
+            jobs:
+                Manifest of the upload jobs.
+
+        Returns:
+            Results in the same order as the jobs.
+        """
+        results = [UploadResult(job=job) for job in jobs]
+        self._started = time.monotonic()
+        with self._lock:
+            self._progress.total_jobs += len(jobs)
+            for job in jobs:
+                self._progress.total_bytes += job.media.size
+                if job.thumbnail is not None:
+                    self._progress.total_bytes += job.thumbnail.size
+                for caption in job.captions:
+                    self._progress.total_bytes += caption.media.size
+
+        pending = threading.Semaphore(0)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+
+            def finish(result: UploadResult):
+                try:
+                    self._report(finished=True, failed=not result.ok)
+                finally:
+                    pending.release()
+
+            def step(fn, result: UploadResult, remaining: List[int], *args):
+                try:
+                    fn(result.job, result, *args)
+                except Exception as e:
+                    with self._lock:
+                        result.errors.append(e)
+                finally:
+                    with self._lock:
+                        remaining[0] -= 1
+                        last = remaining[0] == 0
+                    if last:
+                        finish(result)
+
+            def start(result: UploadResult):
+                job = result.job
+                try:
+                    self._upload_video(job, result)
+                except Exception as e:
+                    result.errors.append(e)
+                    finish(result)
+                    return
+
+                followups = []
+                if job.thumbnail is not None:
+                    followups.append((self._upload_thumbnail,))
+                for caption in job.captions:
+                    followups.append((self._upload_caption, caption))
+                for playlist_id in job.playlist_ids:
+                    followups.append((self._insert_playlist_item, playlist_id))
+
+                if not followups:
+                    finish(result)
+                    return
+                remaining = [len(followups)]
+                for fn, *args in followups:
+                    executor.submit(step, fn, result, remaining, *args)
+
+            for result in results:
+                executor.submit(start, result)
+            for _ in results:
+                pending.acquire()
+
+        return results
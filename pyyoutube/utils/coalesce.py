@@ -0,0 +1,92 @@
+"""
+Single-flight coalescing of identical in-flight calls.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Executor, Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+
+class SingleFlight:
+    """Share one execution between the concurrent calls with the same key.
+
+    The first caller of a key runs the function, the callers arriving while it is
+    in flight wait for it and get the same result or exception. Once it finished,
+    the next call of the key runs the function again, nothing is cached.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+        self.shared = 0  # Number of calls served by another call's execution.
+
+    def _join(self, key: Hashable) -> Tuple[Future, bool]:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.shared += 1
+                return future, False
+            future = self._calls[key] = Future()
+            return future, True
+
+    def _run(self, key: Hashable, future: Future, func: Callable[[], Any]):
+        try:
+            result = func()
+        except BaseException as e:
+            with self._lock:
+                self._calls.pop(key, None)
+            future.set_exception(e)
+        else:
+            with self._lock:
+                self._calls.pop(key, None)
+            future.set_result(result)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Run func, or wait for the in-flight call of the key.
+
+        Args:
+            key:
+                Key identifying identical calls.
+            func:
+                Function without arguments to run.
+
+        Returns:
+            Result of the shared execution.
+        """
+        future, leader = self._join(key)
+        if leader:
+            self._run(key, future, func)
+        return future.result()
+
+    async def do_async(
+        self,
+        key: Hashable,
+        func: Callable[[], Any],
+        executor: Optional[Executor] = None,
+    ) -> Any:
+        """Coroutine version of ``do``, the blocking func runs in the executor.
+
+        Coroutines and threads calling with the same key share the execution.
+
+        Args:
+            key:
+                Key identifying identical calls.
+            func:
+                Blocking function without arguments to run.
+            executor:
+                Executor for func, defaults to the loop's default executor.
+
+        Returns:
+            Result of the shared execution.
+        """
+        future, leader = self._join(key)
+        if leader:
+            loop = asyncio.get_running_loop()
+            loop.run_in_executor(executor, self._run, key, future, func)
+        # Cancelling this caller must not cancel the execution the others share.
+        return await asyncio.shield(asyncio.wrap_future(future))
@@ -91,6 +91,20 @@ RESOURCE_PARTS_MAPPING = {
     "guideCategories": GUIDE_CATEGORY_RESOURCE_PROPERTIES,
 }
 
+# Maximum ids in one list request, and maximum results in one page.
+MAX_IDS_PER_REQUEST = 50
+
+# Quota units charged by the write operations used by the upload and edit helpers.
+# Refer: https://developers.google.com/youtube/v3/determine_quota_cost
+QUOTA_COSTS = {
+    "videos.insert": 1600,
+    "thumbnails.set": 50,
+    "captions.insert": 400,
+    "playlistItems.insert": 50,
+    "playlistItems.update": 50,
+    "playlistItems.delete": 50,
+}
+
 TOPICS = {
     # Music topics
     "/m/04rlf": "Music (parent topic)",
@@ -0,0 +1,112 @@
+"""
+Fast parsers for the ISO 8601 values returned by YouTube.
+
+Durations like PT14H23M42S and datetimes like 2019-05-16T18:46:20.123Z are parsed
+with a single regex. Other forms fall back to isodate. Results are memoized, as
+the same values come back across many resources.
+"""
+
+import datetime
+import re
+from functools import lru_cache
+from typing import Iterable, List, Optional
+
+import isodate
+
+_DURATION_RE = re.compile(
+    r"P(?:(\d+)W)?(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)(?:\.(\d+))?S)?)?"
+)
+_DATETIME_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?(Z|[+-]\d{2}:?\d{2})"
+)
+
+CACHE_SIZE = 8192
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_duration(value: str) -> float:
+    """Parse an ISO 8601 duration to seconds.
+
+    Args:
+        value:
+            Duration like PT14H23M42S.
+
+    Returns:
+        Seconds of the duration.
+
+    Raises:
+        ISO8601Error: The value is not a duration.
+    """
+    m = _DURATION_RE.fullmatch(value)
+    if m is None or not any(m.groups()):
+        return isodate.parse_duration(value).total_seconds()
+    weeks, days, hours, minutes, seconds, fraction = m.groups()
+    total = (
+        int(weeks or 0) * 604800
+        + int(days or 0) * 86400
+        + int(hours or 0) * 3600
+        + int(minutes or 0) * 60
+        + int(seconds or 0)
+    )
+    if fraction:
+        return total + int(fraction) / 10 ** len(fraction)
+    return float(total)
+
+
+@lru_cache(maxsize=64)
+def _timezone(value: str) -> datetime.timezone:
+    if value == "Z":
+        return datetime.timezone.utc
+    sign = -1 if value[0] == "-" else 1
+    value = value[1:].replace(":", "")
+    offset = datetime.timedelta(hours=int(value[:2]), minutes=int(value[2:]))
+    return datetime.timezone(sign * offset)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_datetime(value: str) -> datetime.datetime:
+    """Parse an ISO 8601 datetime.
+
+    Args:
+        value:
+            Datetime like 2019-05-16T18:46:20.123Z.
+
+    Returns:
+        Timezone aware datetime if the value has an offset. Fractions are
+        truncated to microseconds.
+
+    Raises:
+        ISO8601Error: The value is not a datetime.
+    """
+    m = _DATETIME_RE.fullmatch(value)
+    if m is None:
+        return isodate.parse_datetime(value)
+    year, month, day, hour, minute, second, fraction, tz = m.groups()
+    try:
+        return datetime.datetime(
+            int(year),
+            int(month),
+            int(day),
+            int(hour),
+            int(minute),
+            int(second),
+            int(fraction[:6].ljust(6, "0")) if fraction else 0,
+            tzinfo=_timezone(tz),
+        )
+    except ValueError:
+        # Out of range values, let isodate report them.
+        return isodate.parse_datetime(value)
+
+
+def parse_many_durations(values: Iterable[Optional[str]]) -> List[Optional[float]]:
+    """Parse durations to seconds, None stays None."""
+    parse = parse_duration
+    return [parse(value) if value else None for value in values]
+
+
+def parse_many_datetimes(
+    values: Iterable[Optional[str]],
+) -> List[Optional[datetime.datetime]]:
+    """Parse datetimes, None stays None."""
+    parse = parse_datetime
+    return [parse(value) if value else None for value in values]
@@ -0,0 +1,40 @@
+"""
+Lazy attributes for package __init__ modules (PEP 562).
+"""
+
+import importlib
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def lazy_exports(
+    package: str, exports: Dict[str, Iterable[str]]
+) -> Tuple[Callable[[str], object], Callable[[], List[str]], List[str]]:
+    """Build the module __getattr__, __dir__ and __all__ of a package.
+
+    Names are imported from their module on first access, then stored in the
+    package namespace, so later accesses are plain lookups.
+
+    Args:
+        package:
+            Name of the package, usually __name__.
+        exports:
+            Relative module name for each group of exported names.
+
+    Returns:
+        __getattr__, __dir__ and __all__ for the package.
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str):
+        module = modules.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(modules))
+
+    return __getattr__, __dir__, list(modules)
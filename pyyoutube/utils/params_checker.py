@@ -3,14 +3,23 @@ function's params checker.
 """
 
 import logging
-
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Optional, Tuple, Union
 
 from pyyoutube.error import ErrorCode, ErrorMessage, PyYouTubeException
 from pyyoutube.utils.constants import RESOURCE_PARTS_MAPPING
 
 logger = logging.getLogger(__name__)
 
+_set_order_warned = False
+
+
+def _warn_set_order():
+    global _set_order_warned
+    if not _set_order_warned:
+        _set_order_warned = True
+        logger.warning("Note: The order of the set is unreliable, values are sorted.")
+
 
 def enf_comma_separated(
     field: str,
@@ -36,7 +45,8 @@ def enf_comma_separated(
             return value
         elif isinstance(value, (list, tuple, set)):
             if isinstance(value, set):
-                logging.warning(f"Note: The order of the set is unreliable.")
+                _warn_set_order()
+                value = sorted(value)
             return ",".join(value)
         else:
             raise PyYouTubeException(
@@ -70,32 +80,52 @@ def enf_parts(resource: str, value: Optional[Union[str, list, tuple, set]], chec
     Returns:
         Api needed part string
     """
+    message = (
+        "Parameter (parts) must be single str,comma-separated str,list,tuple or set"
+    )
+    try:
+        if value is None or isinstance(value, str):
+            key = value
+        elif isinstance(value, (list, tuple)):
+            key = tuple(value)
+        elif isinstance(value, (set, frozenset)):
+            # Parts are sorted anyway, so the order of the set does not matter.
+            key = tuple(sorted(value))
+        else:
+            raise PyYouTubeException(
+                ErrorMessage(status_code=ErrorCode.INVALID_PARAMS, message=message)
+            )
+        return _normalize_parts(resource, key, check)
+    except (TypeError, AttributeError):
+        raise PyYouTubeException(
+            ErrorMessage(status_code=ErrorCode.INVALID_PARAMS, message=message)
+        )
+
+
+@lru_cache(maxsize=1024)
+def _normalize_parts(
+    resource: str, value: Optional[Union[str, Tuple[str, ...]]], check: bool
+) -> str:
+    """Memoized body of enf_parts. Parts are sorted, so the result is stable."""
     if value is None:
         parts = RESOURCE_PARTS_MAPPING[resource]
     elif isinstance(value, str):
-        parts = set(value.split(","))
-    elif isinstance(value, (list, tuple, set)):
-        parts = set(value)
+        parts = value.split(",")
     else:
-        raise PyYouTubeException(
-            ErrorMessage(
-                status_code=ErrorCode.INVALID_PARAMS,
-                message=f"Parameter (parts) must be single str,comma-separated str,list,tuple or set",
-            )
-        )
+        parts = value
 
     # Remove leading/trailing whitespaces
-    parts = set({part.strip() for part in parts})
+    parts = {part.strip() for part in parts}
 
     # check parts whether support.
     if check:
         support_parts = RESOURCE_PARTS_MAPPING[resource]
         if not support_parts.issuperset(parts):
-            not_support_parts = ",".join(parts.difference(support_parts))
+            not_support_parts = ",".join(sorted(parts.difference(support_parts)))
             raise PyYouTubeException(
                 ErrorMessage(
                     status_code=ErrorCode.INVALID_PARAMS,
                     message=f"Parts {not_support_parts} for resource {resource} not support",
                 )
             )
-    return ",".join(parts)
+    return ",".join(sorted(parts))
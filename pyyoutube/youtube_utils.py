@@ -2,10 +2,10 @@
 This provide some common utils methods for YouTube resource.
 """
 
-import isodate
 from isodate.isoerror import ISO8601Error
 
 from pyyoutube.error import ErrorMessage, PyYouTubeException
+from pyyoutube.utils.iso8601 import parse_duration
 
 
 def get_video_duration(duration: str) -> int:
@@ -20,7 +20,7 @@ def get_video_duration(duration: str) -> int:
         integer for seconds.
     """
     try:
-        seconds = isodate.parse_duration(duration).total_seconds()
+        seconds = parse_duration(duration)
         return int(seconds)
     except ISO8601Error as e:
         raise PyYouTubeException(
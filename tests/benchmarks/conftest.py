@@ -0,0 +1,136 @@
+"""
+Benchmark fixtures.
+
+With pytest-benchmark installed, its ``benchmark`` fixture is used. Otherwise a
+compatible fallback times the benchmarks and writes the results to the json file
+given by ``--benchmark-json``.
+
+Run:
+    pytest tests/benchmarks --no-cov --benchmark-json=benchmark.json
+"""
+
+import json
+import platform
+import statistics
+import sys
+import time
+from typing import Callable, List, Optional
+
+import pytest
+
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+    HAS_PYTEST_BENCHMARK = False
+else:
+    HAS_PYTEST_BENCHMARK = True
+
+MIN_ROUNDS = 5
+MAX_ROUNDS = 1000
+MIN_TIME = 0.05  # Seconds spent on each benchmark at least, rounds allowing.
+
+_results: List[dict] = []
+
+
+class Benchmark:
+    def __init__(self, name: str, fullname: str, group: Optional[str]) -> None:
+        """Fallback for the pytest-benchmark fixture, with the same call interface."""
+        self.name = name
+        self.fullname = fullname
+        self.group = group
+        self.extra_info = {}
+        self.stats: Optional[dict] = None
+
+    def _record(self, times: List[float], iterations: int = 1):
+        times = [t / iterations for t in times]
+        mean = statistics.mean(times)
+        self.stats = {
+            "min": min(times),
+            "max": max(times),
+            "mean": mean,
+            "median": statistics.median(times),
+            "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+            "rounds": len(times),
+            "iterations": iterations,
+            "ops": 1 / mean if mean else 0.0,
+        }
+        _results.append(
+            {
+                "name": self.name,
+                "fullname": self.fullname,
+                "group": self.group,
+                "extra_info": self.extra_info,
+                "stats": self.stats,
+            }
+        )
+
+    def __call__(self, func: Callable, *args, **kwargs):
+        result = func(*args, **kwargs)  # Warmup, caches and lazy imports.
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        times = [time.perf_counter() - start]
+        rounds = int(MIN_TIME / times[0]) if times[0] else MAX_ROUNDS
+        for _ in range(min(max(rounds, MIN_ROUNDS), MAX_ROUNDS) - 1):
+            start = time.perf_counter()
+            func(*args, **kwargs)
+            times.append(time.perf_counter() - start)
+        self._record(times)
+        return result
+
+    def pedantic(
+        self,
+        target: Callable,
+        args: tuple = (),
+        kwargs: Optional[dict] = None,
+        setup: Optional[Callable] = None,
+        rounds: int = 1,
+        warmup_rounds: int = 0,
+        iterations: int = 1,
+    ):
+        kwargs = kwargs or {}
+        result = None
+        times = []
+        for index in range(warmup_rounds + rounds):
+            if setup is not None:
+                setup_result = setup()
+                if setup_result is not None:
+                    args, kwargs = setup_result
+            start = time.perf_counter()
+            for _ in range(iterations):
+                result = target(*args, **kwargs)
+            if index >= warmup_rounds:
+                times.append(time.perf_counter() - start)
+        self._record(times, iterations)
+        return result
+
+
+if not HAS_PYTEST_BENCHMARK:
+
+    def pytest_configure(config):
+        config.addinivalue_line(
+            "markers", "benchmark(group): options of the benchmark fixture"
+        )
+
+    @pytest.fixture
+    def benchmark(request):
+        marker = request.node.get_closest_marker("benchmark")
+        group = marker.kwargs.get("group") if marker else None
+        return Benchmark(request.node.name, request.node.nodeid, group)
+
+    def pytest_sessionfinish(session):
+        path = session.config.getoption("benchmark_json", None)
+        if not path or not _results:
+            return
+        data = {
+            "machine_info": {
+                "python_version": platform.python_version(),
+                "python_implementation": platform.python_implementation(),
+                "machine": platform.machine(),
+                "system": platform.system(),
+            },
+            "datetime": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "argv": sys.argv,
+            "benchmarks": _results,
+        }
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
@@ -0,0 +1,20 @@
+"""
+Benchmark of the client construction.
+"""
+
+import pytest
+
+from pyyoutube import Client
+
+
+@pytest.mark.benchmark(group="client")
+def test_client_construction_benchmark(benchmark):
+    cli = benchmark(Client, api_key="key")
+    # Resources are only created on access.
+    assert "videos" not in vars(cli)
+
+
+@pytest.mark.benchmark(group="client")
+def test_client_first_access_benchmark(benchmark):
+    videos = benchmark(lambda: Client(api_key="key").videos)
+    assert videos is not None
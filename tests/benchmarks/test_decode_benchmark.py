@@ -0,0 +1,50 @@
+"""
+Benchmark of the response decoding, for every list response with 50 items.
+"""
+
+import pytest
+
+import pyyoutube.models as mds
+
+ITEMS = 50
+
+# List response model -> testdata file, under testdata/apidata/.
+LIST_RESPONSES = {
+    "ActivityListResponse": "activities/activities_by_channel_p1.json",
+    "CaptionListResponse": "captions/captions_by_video.json",
+    "VideoCategoryListResponse": "categories/video_category_multi.json",
+    "ChannelListResponse": "channels/info_multiple.json",
+    "ChannelSectionListResponse": "channel_sections/channel_sections_by_ids.json",
+    "CommentListResponse": "comments/comments_multi.json",
+    "CommentThreadListResponse": "comment_threads/comment_threads_multi.json",
+    "I18nRegionListResponse": "i18ns/regions_res.json",
+    "I18nLanguageListResponse": "i18ns/language_res.json",
+    "MemberListResponse": "members/members_data.json",
+    "MembershipsLevelListResponse": "members/membership_levels.json",
+    "PlaylistItemListResponse": "playlist_items/playlist_items_multi.json",
+    "PlaylistListResponse": "playlists/playlists_multi.json",
+    "SearchListResponse": "search/search_by_keywords_p1.json",
+    "SubscriptionListResponse": "subscriptions/subscriptions_by_id.json",
+    "VideoAbuseReportReasonListResponse": "abuse_reasons/abuse_reason.json",
+    "VideoListResponse": "videos/videos_info_multi.json",
+}
+
+
+def scaled(data: dict, size: int = ITEMS) -> dict:
+    items = data["items"]
+    return {**data, "items": [items[i % len(items)] for i in range(size)]}
+
+
+def test_every_list_response_covered():
+    models = {name for name in mds.__all__ if name.endswith("ListResponse")}
+    assert models == set(LIST_RESPONSES)
+
+
+@pytest.mark.benchmark(group="decode")
+@pytest.mark.parametrize("model_name", sorted(LIST_RESPONSES))
+def test_from_dict_benchmark(benchmark, helpers, model_name):
+    data = scaled(helpers.load_json(f"testdata/apidata/{LIST_RESPONSES[model_name]}"))
+    model = getattr(mds, model_name)
+    benchmark.extra_info["items"] = ITEMS
+    res = benchmark(model.from_dict, data)
+    assert len(res.items) == ITEMS
@@ -0,0 +1,43 @@
+"""
+Benchmark of the package import time, in a fresh interpreter each round.
+
+The import time is reported as ``extra_info["import_time"]``, the stats
+include the interpreter startup.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+
+def import_time(statement: str) -> float:
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)"
+    )
+    return float(
+        subprocess.run(
+            [sys.executable, "-c", code], check=True, capture_output=True, text=True
+        ).stdout
+    )
+
+
+@pytest.mark.benchmark(group="import")
+@pytest.mark.parametrize(
+    "statement",
+    ["import pyyoutube", "import pyyoutube; pyyoutube.Client; pyyoutube.Api"],
+    ids=["lazy", "full"],
+)
+def test_import_benchmark(benchmark, statement):
+    # The benchmark stats time the whole child process, interpreter startup
+    # included, so only compare them between runs. The import alone is timed
+    # in the child and recorded as extra info, which is the number to read.
+    times = []
+    benchmark.pedantic(
+        lambda: times.append(import_time(statement)), rounds=3, warmup_rounds=1
+    )
+    benchmark.extra_info["import_time"] = min(times[1:])
+    assert min(times) > 0
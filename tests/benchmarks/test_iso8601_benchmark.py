@@ -0,0 +1,39 @@
+"""
+Benchmark of the ISO 8601 parsers against isodate.
+"""
+
+import isodate
+import pytest
+
+from pyyoutube.utils.iso8601 import parse_datetime, parse_duration
+
+DURATIONS = [f"PT{h}H{m}M{s}S" for h in range(3) for m in range(60) for s in (7, 42)]
+DATETIMES = [
+    f"2020-01-{d:02d}T09:40:{s:02d}.981Z" for d in range(1, 29) for s in range(60)
+]
+
+
+def parse_all(func, values):
+    for value in values:
+        func(value)
+
+
+# Without the memoization, so every value is parsed.
+@pytest.mark.benchmark(group="duration")
+@pytest.mark.parametrize(
+    "func",
+    [parse_duration.__wrapped__, parse_duration, isodate.parse_duration],
+    ids=["regex", "memoized", "isodate"],
+)
+def test_duration_benchmark(benchmark, func):
+    benchmark(parse_all, func, DURATIONS)
+
+
+@pytest.mark.benchmark(group="datetime")
+@pytest.mark.parametrize(
+    "func",
+    [parse_datetime.__wrapped__, parse_datetime, isodate.parse_datetime],
+    ids=["regex", "memoized", "isodate"],
+)
+def test_datetime_benchmark(benchmark, func):
+    benchmark(parse_all, func, DATETIMES)
@@ -0,0 +1,52 @@
+"""
+Benchmark of paged_by_page_token over synthetic pages.
+"""
+
+import json
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import responses
+
+from pyyoutube import Api
+
+PAGES = 10
+PAGE_SIZE = 50
+
+
+def page_callback(request):
+    query = parse_qs(urlsplit(request.url).query)
+    page = int(query.get("pageToken", ["0"])[0])
+    data = {
+        "kind": "youtube#playlistItemListResponse",
+        "pageInfo": {"totalResults": PAGES * PAGE_SIZE, "resultsPerPage": PAGE_SIZE},
+        "items": [
+            {"kind": "youtube#playlistItem", "id": f"item{page * PAGE_SIZE + i}"}
+            for i in range(PAGE_SIZE)
+        ],
+    }
+    if page + 1 < PAGES:
+        data["nextPageToken"] = str(page + 1)
+    if page > 0:
+        data["prevPageToken"] = str(page - 1)
+    return 200, {}, json.dumps(data)
+
+
+@pytest.mark.benchmark(group="pagination")
+def test_paged_by_page_token_benchmark(benchmark):
+    api = Api(api_key="key")
+    with responses.RequestsMock() as m:
+        m.add_callback(
+            method="GET",
+            url="https://www.googleapis.com/youtube/v3/playlistItems",
+            callback=page_callback,
+        )
+        res = benchmark(
+            lambda: api.paged_by_page_token(
+                resource="playlistItems",
+                args={"part": "id", "playlistId": "playlist"},
+            )
+        )
+    benchmark.extra_info["pages"] = PAGES
+    assert len(res["items"]) == PAGES * PAGE_SIZE
+    assert res["items"][-1]["id"] == f"item{PAGES * PAGE_SIZE - 1}"
@@ -0,0 +1,20 @@
+"""
+Benchmark of the parts normalization.
+"""
+
+import pytest
+
+from pyyoutube.utils.params_checker import enf_parts
+
+PARTS = "id, snippet,contentDetails , statistics,status"
+
+
+@pytest.mark.benchmark(group="params")
+@pytest.mark.parametrize(
+    "value",
+    [PARTS, PARTS.split(","), set(PARTS.split(","))],
+    ids=["str", "list", "set"],
+)
+def test_enf_parts_benchmark(benchmark, value):
+    res = benchmark(enf_parts, resource="videos", value=value)
+    assert res == "contentDetails,id,snippet,statistics,status"
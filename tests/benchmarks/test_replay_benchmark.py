@@ -0,0 +1,35 @@
+"""
+Offline throughput benchmark of list requests and decoding, on replayed responses.
+"""
+
+import pytest
+import responses
+
+from pyyoutube import Client
+from pyyoutube.instrumentation import Instrumentation
+from pyyoutube.transport import CassetteTransport
+
+
+@pytest.mark.benchmark(group="replay")
+@pytest.mark.parametrize("instrumented", [False, True], ids=["plain", "instrumented"])
+def test_replay_benchmark(benchmark, helpers, tmp_path, instrumented):
+    path = str(tmp_path / "cassette.json")
+    data = helpers.load_json("testdata/apidata/videos/videos_info_multi.json")
+
+    transport = CassetteTransport(path, mode="record")
+    cli = Client(api_key="key", transport=transport)
+    with responses.RequestsMock() as m:
+        m.add(
+            method="GET", url="https://www.googleapis.com/youtube/v3/videos", json=data
+        )
+        cli.videos.list(video_id="D-lhorsDlUQ,c0KYU2j0TM4")
+    transport.save()
+
+    instrumentation = Instrumentation() if instrumented else None
+    cli = Client(
+        api_key="key",
+        transport=CassetteTransport(path),
+        instrumentation=instrumentation,
+    )
+    res = benchmark(cli.videos.list, video_id="D-lhorsDlUQ,c0KYU2j0TM4")
+    assert len(res.items) == len(data["items"])
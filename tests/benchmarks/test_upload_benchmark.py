@@ -0,0 +1,52 @@
+"""
+Benchmark of resumable upload chunk loops, against the fake API server.
+"""
+
+import io
+
+import pytest
+
+from pyyoutube import Client
+from pyyoutube.fake_server import FakeDataset, FakeYouTubeServer
+from pyyoutube.media import Media, MediaUpload
+
+SIZE = 1024 * 1024
+CHUNK_SIZE = 64 * 1024
+
+
+@pytest.fixture(scope="module")
+def server():
+    dataset = FakeDataset(channels=1, videos_per_channel=0, comments_per_video=0)
+    with FakeYouTubeServer(dataset) as server:
+        yield server
+
+
+def upload(cli, data: bytes, chunk_size: int, checksum=None):
+    media = Media(
+        fd=io.BytesIO(data),
+        mimetype="video/mp4",
+        chunk_size=chunk_size,
+        checksum=checksum,
+    )
+    upload = MediaUpload(
+        client=cli,
+        resource="videos",
+        media=media,
+        params={"part": "snippet"},
+        body={"snippet": {"title": "video"}},
+    )
+    body = None
+    while body is None:
+        _, body = upload.next_chunk()
+    return body
+
+
+@pytest.mark.benchmark(group="upload")
+@pytest.mark.parametrize("checksum", [None, "md5"])
+def test_upload_benchmark(benchmark, server, checksum):
+    cli = Client(api_key="key")
+    server.configure(cli)
+    data = b"x" * SIZE
+    benchmark.extra_info.update(size=SIZE, chunks=SIZE // CHUNK_SIZE)
+    body = benchmark(upload, cli, data, CHUNK_SIZE, checksum)
+    assert body["id"] in server.dataset.videos
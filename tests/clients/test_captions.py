@@ -5,6 +5,7 @@ Tests for captions resources.
 import io
 
 import pytest
+import requests
 import responses
 
 import pyyoutube.models as mds
@@ -89,6 +90,89 @@ class TestCaptionsResource(BaseTestCase):
             res = authed_cli.captions.download(caption_id=caption_id)
             assert res.status_code == 200
 
+    def test_stream_download(self, helpers, authed_cli, tmp_path):
+        caption_id = "AUieDabWmL88_xoRtxyxjTMtmvdoF9dLTW3WxfJvaThUXkNptljUijDFS-kDjyA"
+        content = b"WEBVTT\n\n00:00:00.000 --> 00:00:01.000\nhello\n"
+
+        with responses.RequestsMock() as m:
+            m.add(method="GET", url=f"{self.url}/{caption_id}", body=content)
+            chunks = list(
+                authed_cli.captions.iter_download(caption_id=caption_id, chunk_size=8)
+            )
+            assert chunks[0] == content[:8]
+            assert b"".join(chunks) == content
+
+        with responses.RequestsMock() as m:
+            m.add(method="GET", url=f"{self.url}/{caption_id}", body=content)
+            path = tmp_path / "caption.vtt"
+            written = authed_cli.captions.download_to(
+                caption_id=caption_id, destination=str(path), tfmt="vtt"
+            )
+            assert written == len(content)
+            assert path.read_bytes() == content
+
+        with responses.RequestsMock() as m:
+            m.add(method="GET", url=f"{self.url}/{caption_id}", body=content)
+            fd = io.BytesIO()
+            authed_cli.captions.download_to(caption_id=caption_id, destination=fd)
+            assert fd.getvalue() == content
+
+        with pytest.raises(PyYouTubeException):
+            with responses.RequestsMock() as m:
+                m.add(
+                    method="GET",
+                    url=f"{self.url}/{caption_id}",
+                    status=403,
+                    json=self.load_json("error_permission_resp.json", helpers),
+                )
+                authed_cli.captions.download_to(
+                    caption_id=caption_id, destination=str(tmp_path / "error.vtt")
+                )
+        assert not (tmp_path / "error.vtt").exists()
+
+    def test_download_to_interrupted(self, authed_cli, tmp_path, monkeypatch):
+        def iter_download(**kwargs):
+            yield b"WEBVTT\n"
+            raise requests.exceptions.ConnectionError("reset")
+
+        captions = authed_cli.captions
+        monkeypatch.setattr(captions, "iter_download", iter_download)
+        path = tmp_path / "caption.vtt"
+        path.write_bytes(b"previous")
+        with pytest.raises(requests.exceptions.ConnectionError):
+            captions.download_to(caption_id="caption", destination=str(path))
+        # Neither truncated nor left aside.
+        assert path.read_bytes() == b"previous"
+        assert [p.name for p in tmp_path.iterdir()] == ["caption.vtt"]
+
+    def test_download_many(self, helpers, authed_cli, tmp_path):
+        with responses.RequestsMock() as m:
+            m.add(method="GET", url=f"{self.url}/caption1", body=b"caption1")
+            m.add(method="GET", url=f"{self.url}/caption2", body=b"caption2")
+            m.add(
+                method="GET",
+                url=f"{self.url}/caption3",
+                status=403,
+                json=self.load_json("error_permission_resp.json", helpers),
+            )
+            m.add(
+                method="GET",
+                url=f"{self.url}/caption4",
+                body=requests.exceptions.ConnectionError("refused"),
+            )
+            results = authed_cli.captions.download_many(
+                caption_ids=["caption1", "caption2", "caption3", "caption4"],
+                directory=str(tmp_path),
+                tfmt="srt",
+                max_workers=2,
+            )
+
+        assert list(results) == ["caption1", "caption2", "caption3", "caption4"]
+        assert (tmp_path / "caption2.srt").read_bytes() == b"caption2"
+        assert results["caption1"] == str(tmp_path / "caption1.srt")
+        assert isinstance(results["caption3"], PyYouTubeException)
+        assert isinstance(results["caption4"], requests.exceptions.ConnectionError)
+
     def test_delete(self, helpers, authed_cli):
         caption_id = "AUieDabWmL88_xoRtxyxjTMtmvdoF9dLTW3WxfJvaThUXkNptljUijDFS-kDjyA"
 
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 import responses
 
@@ -87,3 +89,61 @@ class TestChannelsResource(BaseTestCase):
                 ),
             )
             assert updated_channel.brandingSettings.channel.defaultLanguage == "en"
+
+    def test_iter_all_videos(self, helpers, key_cli):
+        def playlist_items(request):
+            playlist_id = request.params["playlistId"]
+            if request.params.get("pageToken"):
+                video_ids, next_token = [f"{playlist_id}-2"], None
+            else:
+                video_ids, next_token = [f"{playlist_id}-0", f"{playlist_id}-1"], "p2"
+            data = {
+                "items": [{"contentDetails": {"videoId": vid}} for vid in video_ids],
+                "nextPageToken": next_token,
+            }
+            return 200, {}, json.dumps(data)
+
+        def videos(request):
+            ids = request.params["id"].split(",")
+            assert len(ids) <= 50
+            return 200, {}, json.dumps({"items": [{"id": vid} for vid in ids]})
+
+        with responses.RequestsMock() as m:
+            m.add(
+                method="GET",
+                url=self.url,
+                json=self.load_json("channels/info_multiple.json", helpers),
+            )
+            m.add_callback(
+                method="GET",
+                url=f"{self.BASE_URL}/playlistItems",
+                callback=playlist_items,
+            )
+            m.add_callback(method="GET", url=f"{self.BASE_URL}/videos", callback=videos)
+
+            videos = list(
+                key_cli.channels.iter_all_videos(
+                    channel_id=["UCK8sQmJBp8GCxrOtXWBpyEA", "UC_x5XG1OV2P6uZZ5FSM9Ttw"],
+                    parts="id,snippet",
+                    max_workers=2,
+                )
+            )
+            assert len(videos) == 6
+            uploads = [v.id for v in videos if v.id.startswith("UUK8")]
+            assert uploads == [
+                "UUK8sQmJBp8GCxrOtXWBpyEA-0",
+                "UUK8sQmJBp8GCxrOtXWBpyEA-1",
+                "UUK8sQmJBp8GCxrOtXWBpyEA-2",
+            ]
+
+            videos = list(
+                key_cli.channels.iter_all_videos(
+                    channel_id="UC_x5XG1OV2P6uZZ5FSM9Ttw", return_json=True
+                )
+            )
+            assert videos[0]["id"] == "UU_x5XG1OV2P6uZZ5FSM9Ttw-0"
+
+    def test_iter_all_videos_not_found(self, key_cli):
+        with responses.RequestsMock() as m:
+            m.add(method="GET", url=self.url, json={"items": []})
+            assert list(key_cli.channels.iter_all_videos(channel_id="unknown")) == []
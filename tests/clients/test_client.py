@@ -2,6 +2,10 @@
 Tests for client.
 """
 
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 
 import responses
@@ -9,6 +13,7 @@ from requests import Response, HTTPError
 
 from .base import BaseTestCase
 from pyyoutube import Client, PyYouTubeException
+from pyyoutube.resources import VideosResource
 
 
 class TestClient(BaseTestCase):
@@ -22,6 +27,15 @@ class TestClient(BaseTestCase):
         cli = Client(api_key="key", headers={"HA": "P"})
         assert cli.session.headers["HA"] == "P"
 
+    def test_lazy_resources(self):
+        cli = Client(api_key="key")
+        assert "videos" not in cli.__dict__
+        videos = cli.videos
+        assert isinstance(videos, VideosResource)
+        assert videos._client is cli
+        assert cli.videos is videos
+        assert Client(api_key="key").videos is not videos
+
     def test_client_secret_web(self):
         filename = "apidata/client_secrets/client_secret_web.json"
         client_secret_path = f"{self.BASE_PATH}/{filename}"
@@ -78,6 +92,51 @@ class TestClient(BaseTestCase):
                 )
                 key_cli.channels.list(id="xxxx")
 
+    def test_coalesce_requests(self, helpers):
+        cli = Client(api_key="api key", coalesce_requests=True)
+
+        def callback(request):
+            helpers.wait_for(lambda: cli.single_flight.shared == 3)
+            return 200, {}, json.dumps({"items": [{"id": "channel"}]})
+
+        def get(_):
+            return cli.channels.list(channel_id="channel", parts=["id"])
+
+        with responses.RequestsMock() as m:
+            m.add_callback(method="GET", url=self.url, callback=callback)
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(get, range(4)))
+            assert len(m.calls) == 1
+            assert all(r.items[0].id == "channel" for r in results)
+
+            # requests with other params or methods are not coalesced.
+            m.add(method="GET", url=self.url, json={"items": []})
+            m.add(method="POST", url=self.url, json={})
+            cli.channels.list(channel_id="other", parts="id")
+            cli.request(path="channels", method="POST", json={})
+            assert len(m.calls) == 3
+
+    def test_arequest(self, helpers):
+        cli = Client(api_key="api key", coalesce_requests=True)
+
+        def callback(request):
+            helpers.wait_for(lambda: cli.single_flight.shared == 1)
+            return 200, {}, json.dumps({"items": []})
+
+        async def main():
+            return await asyncio.gather(
+                cli.arequest(path="channels", params={"id": "channel"}),
+                cli.arequest(path="channels", params={"id": "channel", "a": None}),
+                cli.arequest(path="channels", method="POST"),
+            )
+
+        with responses.RequestsMock() as m:
+            m.add_callback(method="GET", url=self.url, callback=callback)
+            m.add(method="POST", url=self.url, json={})
+            first, second, _ = asyncio.run(main())
+            assert first is second
+            assert len(m.calls) == 2
+
     def test_oauth(self, helpers):
         cli = Client(client_id="id", client_secret="secret")
         url, state = cli.get_authorize_url()
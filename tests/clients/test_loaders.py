@@ -0,0 +1,103 @@
+"""
+Tests for batch loaders.
+"""
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+import responses
+
+from pyyoutube import Client, PyYouTubeException
+from pyyoutube.loaders import BatchLoader, Loaders
+
+BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+
+def items_callback(request):
+    ids = request.params["id"].split(",")
+    assert len(ids) <= 50
+    items = [{"id": item_id} for item_id in ids if item_id != "missing"]
+    return 200, {}, json.dumps({"items": items})
+
+
+def test_load_concurrent():
+    cli = Client(api_key="api key")
+    cli.loaders = Loaders(cli, parts={"video": "id"}, window_ms=100)
+    loader = cli.loaders.video
+    assert cli.loaders.video is loader
+
+    ids = [f"video{i}" for i in range(120)] + ["video0", "missing"]
+    with responses.RequestsMock() as m:
+        m.add_callback(method="GET", url=f"{BASE_URL}/videos", callback=items_callback)
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = list(executor.map(loader.submit, ids))
+        videos = [future.result() for future in futures]
+        assert len(m.calls) == 3
+        assert m.calls[0].request.params["part"] == "id"
+
+    assert [v.id for v in videos[:120]] == ids[:120]
+    assert videos[120].id == "video0"
+    assert videos[121] is None
+
+
+def test_load_many():
+    loader = Client(api_key="api key").loaders.channel
+    with responses.RequestsMock() as m:
+        m.add_callback(
+            method="GET", url=f"{BASE_URL}/channels", callback=items_callback
+        )
+        channels = loader.load_many([f"channel{i}" for i in range(60)])
+        assert len(m.calls) == 2
+    assert channels[59].id == "channel59"
+
+
+def test_load_async():
+    cli = Client(api_key="api key")
+
+    async def main():
+        return await asyncio.gather(
+            *[cli.loaders.playlist.load_async(f"playlist{i}") for i in range(10)],
+            cli.loaders.comment.load_async("comment"),
+        )
+
+    with responses.RequestsMock() as m:
+        m.add_callback(
+            method="GET", url=f"{BASE_URL}/playlists", callback=items_callback
+        )
+        m.add_callback(
+            method="GET", url=f"{BASE_URL}/comments", callback=items_callback
+        )
+        results = asyncio.run(main())
+        assert len(m.calls) == 2
+    assert results[3].id == "playlist3"
+    assert results[-1].id == "comment"
+
+
+def test_load_error():
+    cli = Client(api_key="api key")
+    with responses.RequestsMock() as m:
+        m.add(
+            method="GET",
+            url=f"{BASE_URL}/videos",
+            json={"error": {"code": 400, "message": "error"}},
+            status=400,
+        )
+        with pytest.raises(PyYouTubeException):
+            cli.loaders.video.load("video")
+
+
+def test_batch_loader_window():
+    batches = []
+
+    def fetch(ids):
+        batches.append(ids)
+        return [SimpleNamespace(id=i) for i in ids]
+
+    loader = BatchLoader(fetch, max_batch_size=3, window_ms=1000)
+    futures = [loader.submit(str(i)) for i in range(3)]
+    # The full batch is fetched without waiting for the window.
+    assert [f.result(timeout=0.5).id for f in futures] == ["0", "1", "2"]
+    assert batches == [["0", "1", "2"]]
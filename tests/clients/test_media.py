@@ -2,12 +2,14 @@
 Tests for media upload.
 """
 
+import hashlib
 import io
 
 import pytest
 import responses
 from requests import Response
 
+import pyyoutube.media as media_module
 from pyyoutube.error import PyYouTubeException
 from pyyoutube.media import Media, MediaUpload, MediaUploadProgress
 
@@ -131,3 +133,83 @@ class TestMediaUpload:
         resp.status_code = 308
         resp.headers = {"location": location}
         upload.process_response(resp=resp)
+
+
+class TestMediaChecksum:
+    @pytest.mark.parametrize(
+        "algorithm,expected",
+        [
+            ("md5", hashlib.md5(b"123456789").hexdigest()),
+            ("sha256", hashlib.sha256(b"123456789").hexdigest()),
+            ("crc32c", "e3069283"),
+        ],
+    )
+    def test_checksum(self, algorithm, expected):
+        media = Media(fd=io.BytesIO(b"123456789"), chunk_size=4, checksum=algorithm)
+        assert media.hexdigest() is None
+
+        media.get_bytes(0, 4)
+        media.get_bytes(4, 4)
+        # range sent again after a 308 response
+        media.get_bytes(2, 4)
+        assert not media.checksum_complete
+        media.get_bytes(6, 4)
+        assert media.checksum_complete
+        assert media.hexdigest() == expected
+
+    def test_crc32c(self):
+        data = bytes(range(256)) * 10
+        crc = media_module._crc32c_extend_python(0, data[:1000])
+        assert media_module._crc32c_extend_python(crc, data[1000:]) == 0x42ECEDF2
+        # The C implementation, when installed, gives the same result.
+        extend = media_module._find_crc32c_extend()
+        assert extend(extend(0, data[:1000]), data[1000:]) == 0x42ECEDF2
+
+    def test_checksum_gap(self):
+        media = Media(fd=io.StringIO("123456789"), checksum="md5")
+        media.get_bytes(4, 5)
+        assert media.hexdigest() == hashlib.md5(b"123456789").hexdigest()
+
+    def test_checksum_invalid(self):
+        with pytest.raises(PyYouTubeException):
+            Media(fd=io.BytesIO(b"1"), checksum="sha1")
+
+        media = Media(fd=io.BytesIO(b"1"))
+        assert media.hexdigest() is None
+
+    def test_upload_checksum(self, helpers, authed_cli):
+        location = "https://youtube.googleapis.com/upload/youtube/v3/videos?uploadType=resumable&upload_id=upload_id"
+        media = Media(
+            fd=io.BytesIO(b"1234567890"),
+            mimetype="video/mp4",
+            chunk_size=4,
+            checksum="sha256",
+        )
+        upload = MediaUpload(
+            client=authed_cli, resource="videos", media=media, params={}
+        )
+
+        with responses.RequestsMock() as m:
+            m.add(
+                method="POST",
+                url="https://www.googleapis.com/upload/youtube/v3/videos",
+                status=200,
+                adding_headers={"location": location},
+            )
+            # server only persisted part of the first chunk.
+            m.add(
+                method="PUT", url=location, status=308, adding_headers={"range": "0-1"}
+            )
+            m.add(
+                method="PUT", url=location, status=308, adding_headers={"range": "0-5"}
+            )
+            m.add(
+                method="PUT",
+                url=location,
+                json=helpers.load_json("testdata/apidata/videos/insert_response.json"),
+            )
+            body = None
+            while body is None:
+                _, body = upload.next_chunk()
+
+        assert media.hexdigest() == hashlib.sha256(b"1234567890").hexdigest()
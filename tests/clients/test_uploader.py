@@ -0,0 +1,159 @@
+"""
+Tests for upload scheduler.
+"""
+
+import io
+
+import pytest
+import responses
+
+import pyyoutube.models as mds
+from pyyoutube.error import ErrorCode, PyYouTubeException
+from pyyoutube.media import Media
+from pyyoutube.uploader import (
+    CaptionUploadJob,
+    QuotaBudget,
+    UploadJob,
+    UploadScheduler,
+)
+
+UPLOAD_URL = "https://www.googleapis.com/upload/youtube/v3"
+LOCATION = "https://www.googleapis.com/upload/youtube/v3/session?upload_id=upload_id"
+
+
+def add_upload(m, resource, json):
+    m.add(
+        method="POST",
+        url=f"{UPLOAD_URL}/{resource}",
+        status=200,
+        adding_headers={"location": f"{LOCATION}&resource={resource}"},
+    )
+    m.add(method="PUT", url=f"{LOCATION}&resource={resource}", json=json)
+
+
+class TestQuotaBudget:
+    def test_consume(self):
+        budget = QuotaBudget(limit=100)
+        budget.consume(60)
+        assert budget.remaining == 40
+
+        with pytest.raises(PyYouTubeException) as e:
+            budget.consume(50)
+        assert e.value.status_code == ErrorCode.QUOTA_EXHAUSTED
+
+
+class TestUploadScheduler:
+    def test_run(self, helpers, authed_cli):
+        video_data = helpers.load_json("testdata/apidata/videos/insert_response.json")
+        caption_data = helpers.load_json(
+            "testdata/apidata/captions/insert_response.json"
+        )
+        item_data = helpers.load_json(
+            "testdata/apidata/playlist_items/insert_response.json"
+        )
+
+        job = UploadJob(
+            body=mds.Video(snippet=mds.VideoSnippet(title="title")),
+            media=Media(fd=io.BytesIO(b"video content"), mimetype="video/mp4"),
+            parts="snippet",
+            thumbnail=Media(fd=io.BytesIO(b"jpeg"), mimetype="image/jpeg"),
+            captions=[
+                CaptionUploadJob(
+                    body={"snippet": {"language": "ja", "name": "caption"}},
+                    media=Media(fd=io.BytesIO(b"caption"), mimetype="text/vtt"),
+                )
+            ],
+            playlist_ids=["PLBaidt0ilCManGDIKr8UVBFZwN_UvMKvS"],
+        )
+        snapshots = []
+        scheduler = UploadScheduler(
+            client=authed_cli, max_workers=2, on_progress=snapshots.append
+        )
+
+        with responses.RequestsMock() as m:
+            add_upload(m, "videos", video_data)
+            add_upload(m, "thumbnails/set", {"kind": "youtube#thumbnailSetResponse"})
+            add_upload(m, "captions", caption_data)
+            m.add(
+                method="POST",
+                url="https://www.googleapis.com/youtube/v3/playlistItems",
+                json=item_data,
+            )
+            results = scheduler.run([job])
+
+        result = results[0]
+        assert result.ok
+        assert result.video.id == "D-lhorsDlUQ"
+        assert result.thumbnail["kind"] == "youtube#thumbnailSetResponse"
+        assert result.captions[0].snippet.language == "ja"
+        assert result.playlist_items[0].snippet.title
+
+        progress = scheduler.progress
+        assert progress.finished_jobs == 1
+        assert progress.failed_jobs == 0
+        assert progress.uploaded_bytes == progress.total_bytes == 24
+        assert progress.quota_used == 1600 + 50 + 400 + 50
+        assert snapshots[-1].finished_jobs == 1
+        assert progress.progress() == 1.0
+
+    def test_run_with_quota(self, helpers, authed_cli):
+        video_data = helpers.load_json("testdata/apidata/videos/insert_response.json")
+        jobs = [
+            UploadJob(
+                body={"snippet": {"title": "title"}},
+                media=Media(fd=io.BytesIO(b"video"), mimetype="video/mp4"),
+                thumbnail=Media(fd=io.BytesIO(b"jpeg"), mimetype="image/jpeg"),
+            )
+        ]
+        scheduler = UploadScheduler(client=authed_cli, quota=1600)
+
+        with responses.RequestsMock() as m:
+            add_upload(m, "videos", video_data)
+            results = scheduler.run(jobs)
+
+        assert not results[0].ok
+        assert results[0].video.id == "D-lhorsDlUQ"
+        assert results[0].errors[0].status_code == ErrorCode.QUOTA_EXHAUSTED
+        assert scheduler.progress.failed_jobs == 1
+
+    def test_run_with_error(self, helpers, authed_cli):
+        jobs = [
+            UploadJob(
+                body={"snippet": {"title": "title"}},
+                media=Media(fd=io.BytesIO(b"video"), mimetype="video/mp4"),
+            )
+        ]
+        scheduler = UploadScheduler(client=authed_cli)
+
+        with responses.RequestsMock() as m:
+            m.add(
+                method="POST",
+                url=f"{UPLOAD_URL}/videos",
+                status=400,
+                json=helpers.load_json("testdata/error_response.json"),
+            )
+            results = scheduler.run(jobs)
+
+        assert isinstance(results[0].errors[0], PyYouTubeException)
+        assert scheduler.progress.throughput == 0.0
+
+    def test_run_with_failing_callback(self, helpers, authed_cli):
+        video_data = helpers.load_json("testdata/apidata/videos/insert_response.json")
+        jobs = [
+            UploadJob(
+                body={"snippet": {"title": "title"}},
+                media=Media(fd=io.BytesIO(b"video"), mimetype="video/mp4"),
+            )
+        ]
+
+        def on_progress(progress):
+            raise ValueError("callback error")
+
+        scheduler = UploadScheduler(client=authed_cli, on_progress=on_progress)
+
+        with responses.RequestsMock() as m:
+            add_upload(m, "videos", video_data)
+            results = scheduler.run(jobs)
+
+        assert results[0].ok
+        assert scheduler.progress.finished_jobs == 1
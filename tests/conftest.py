@@ -1,9 +1,23 @@
 import json
+import time
 
 import pytest
 
 from pyyoutube import Client
 
+try:
+    import pytest_benchmark  # noqa: F401
+except ImportError:
+
+    def pytest_addoption(parser):
+        # Same option as pytest-benchmark, for the fallback fixture of the benchmarks.
+        parser.addoption(
+            "--benchmark-json",
+            dest="benchmark_json",
+            default=None,
+            help="Save the benchmark results in a json file.",
+        )
+
 
 class Helpers:
     @staticmethod
@@ -16,6 +30,13 @@ class Helpers:
         with open(filename, "rb") as f:
             return f.read()
 
+    @staticmethod
+    def wait_for(predicate, timeout=5.0):
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+
 
 @pytest.fixture
 def helpers():
@@ -2,6 +2,7 @@ import json
 import unittest
 import pyyoutube
 import pyyoutube.models as models
+from pyyoutube.models.mixins import PublishedAtMixin
 
 
 class VideoModelTest(unittest.TestCase):
@@ -41,6 +42,14 @@ class VideoModelTest(unittest.TestCase):
             m.duration = "error datetime"
             m.get_video_seconds_duration()
 
+    def testVideoContentDetailsCached(self) -> None:
+        m = models.VideoContentDetails.from_dict(self.CONTENT_DETAILS_INFO)
+        self.assertEqual(m.duration_seconds, 1267)
+        # parsed once per instance.
+        m.duration = "PT1S"
+        self.assertEqual(m.duration_seconds, 1267)
+        self.assertNotIn("duration_seconds", m.to_dict())
+
     def testVideoTopicDetails(self) -> None:
         m = models.VideoTopicDetails.from_dict(self.TOPIC_DETAILS_INFO)
 
@@ -65,6 +74,19 @@ class VideoModelTest(unittest.TestCase):
         with self.assertRaises(pyyoutube.PyYouTubeException):
             m.string_to_datetime("error datetime string")
 
+    def testVideoSnippetCached(self) -> None:
+        m = models.VideoSnippet.from_dict(self.SNIPPET_INFO)
+        published_at = m.published_at_dt
+        self.assertEqual(published_at.isoformat(), "2019-03-21T20:37:49+00:00")
+        self.assertIs(m.published_at_dt, published_at)
+
+        class SlottedSnippet(PublishedAtMixin):
+            __slots__ = ("publishedAt",)
+
+        slotted = SlottedSnippet()
+        slotted.publishedAt = "2019-03-21T20:37:49Z"
+        self.assertEqual(slotted.published_at_dt, published_at)
+
         self.assertEqual(m.channelId, "UC_x5XG1OV2P6uZZ5FSM9Ttw")
         self.assertEqual(
             m.thumbnails.default.url, "https://i.ytimg.com/vi/D-lhorsDlUQ/default.jpg"
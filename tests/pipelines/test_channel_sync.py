@@ -0,0 +1,112 @@
+"""
+Tests for incremental channel sync.
+"""
+
+import json
+
+import responses
+
+from pyyoutube.pipelines import ChannelSync, JSONSyncStateStore
+
+BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+
+def make_item(idx):
+    return {
+        "id": f"item{idx}",
+        "contentDetails": {
+            "videoId": f"video{idx}",
+            "videoPublishedAt": f"2022-01-{idx:02d}T00:00:00Z",
+        },
+    }
+
+
+class FakePlaylist:
+    def __init__(self, count, page_size=3):
+        self.count = count
+        self.page_size = page_size
+        self.requests = 0
+
+    def __call__(self, request):
+        self.requests += 1
+        start = int(request.params.get("pageToken", 0))
+        # newest first
+        ids = list(range(self.count, 0, -1))[start : start + self.page_size]
+        data = {"items": [make_item(idx) for idx in ids]}
+        if start + self.page_size < self.count:
+            data["nextPageToken"] = str(start + self.page_size)
+        return 200, {}, json.dumps(data)
+
+
+class TestChannelSync:
+    def test_sync(self, helpers, key_cli, tmp_path):
+        path = str(tmp_path / "state.json")
+        playlist = FakePlaylist(count=7)
+
+        with responses.RequestsMock() as m:
+            m.add(
+                method="GET",
+                url=f"{BASE_URL}/channels",
+                json=helpers.load_json("testdata/apidata/channels/info_multiple.json"),
+            )
+            m.add_callback(
+                method="GET", url=f"{BASE_URL}/playlistItems", callback=playlist
+            )
+            syncer = ChannelSync(client=key_cli, store=JSONSyncStateStore(path))
+            result = syncer.sync("UC_x5XG1OV2P6uZZ5FSM9Ttw")
+
+        items = result["UC_x5XG1OV2P6uZZ5FSM9Ttw"]
+        assert [i.contentDetails.videoId for i in items][:2] == ["video7", "video6"]
+        assert len(items) == 7
+        assert playlist.requests == 3
+
+        # new process, state is loaded from file
+        playlist.count = 9
+        playlist.requests = 0
+        store = JSONSyncStateStore(path)
+        state = store.get("UC_x5XG1OV2P6uZZ5FSM9Ttw")
+        assert state.uploads_playlist_id == "UU_x5XG1OV2P6uZZ5FSM9Ttw"
+        assert state.last_video_id == "video7"
+
+        with responses.RequestsMock() as m:
+            m.add_callback(
+                method="GET", url=f"{BASE_URL}/playlistItems", callback=playlist
+            )
+            result = ChannelSync(client=key_cli, store=store).sync(
+                ["UC_x5XG1OV2P6uZZ5FSM9Ttw"]
+            )
+
+        items = result["UC_x5XG1OV2P6uZZ5FSM9Ttw"]
+        assert [i.contentDetails.videoId for i in items] == ["video9", "video8"]
+        assert playlist.requests == 1
+        assert store.get("UC_x5XG1OV2P6uZZ5FSM9Ttw").last_published_at == (
+            "2022-01-09T00:00:00Z"
+        )
+
+        # no new uploads
+        with responses.RequestsMock() as m:
+            m.add_callback(
+                method="GET", url=f"{BASE_URL}/playlistItems", callback=playlist
+            )
+            result = ChannelSync(client=key_cli, store=store).sync(
+                ["UC_x5XG1OV2P6uZZ5FSM9Ttw"]
+            )
+        assert result["UC_x5XG1OV2P6uZZ5FSM9Ttw"] == []
+
+    def test_initial_max_pages(self, helpers, key_cli):
+        playlist = FakePlaylist(count=7)
+
+        with responses.RequestsMock() as m:
+            m.add(
+                method="GET",
+                url=f"{BASE_URL}/channels",
+                json=helpers.load_json("testdata/apidata/channels/info_multiple.json"),
+            )
+            m.add_callback(
+                method="GET", url=f"{BASE_URL}/playlistItems", callback=playlist
+            )
+            syncer = ChannelSync(client=key_cli, initial_max_pages=1)
+            result = syncer.sync(["UC_x5XG1OV2P6uZZ5FSM9Ttw", "unknown"])
+
+        assert list(result) == ["UC_x5XG1OV2P6uZZ5FSM9Ttw"]
+        assert len(result["UC_x5XG1OV2P6uZZ5FSM9Ttw"]) == 3
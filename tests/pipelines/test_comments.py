@@ -0,0 +1,79 @@
+"""
+Tests for comment harvester.
+"""
+
+import pytest
+import responses
+
+from pyyoutube.error import PyYouTubeException
+from pyyoutube.pipelines import CommentHarvester
+
+BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+
+class TestCommentHarvester:
+    def test_harvest(self, helpers, key_cli):
+        harvester = CommentHarvester(client=key_cli, max_workers=2, buffer_size=2)
+        comments = []
+
+        with responses.RequestsMock() as m:
+            for idx in (1, 2):
+                m.add(
+                    method="GET",
+                    url=f"{BASE_URL}/commentThreads",
+                    json=helpers.load_json(
+                        f"testdata/apidata/comment_threads/comment_threads_by_video_paged_{idx}.json"
+                    ),
+                )
+                m.add(
+                    method="GET",
+                    url=f"{BASE_URL}/comments",
+                    json=helpers.load_json(
+                        f"testdata/apidata/comments/comments_by_parent_paged_{idx}.json"
+                    ),
+                )
+            count = harvester.harvest(video_id="F1UP7wRCPH8", sink=comments.append)
+
+        # page two repeats the threads of page one.
+        assert count == len(comments) == 8
+        assert len({c.id for c in comments}) == 8
+        assert sum(1 for c in comments if c.snippet.parentId) == 3
+
+    def test_harvest_error(self, helpers, key_cli):
+        harvester = CommentHarvester(client=key_cli)
+
+        with pytest.raises(PyYouTubeException):
+            with responses.RequestsMock() as m:
+                m.add(
+                    method="GET",
+                    url=f"{BASE_URL}/commentThreads",
+                    json=helpers.load_json(
+                        "testdata/apidata/comment_threads/comment_threads_by_video_paged_2.json"
+                    ),
+                )
+                m.add(
+                    method="GET",
+                    url=f"{BASE_URL}/comments",
+                    status=403,
+                    json=helpers.load_json(
+                        "testdata/apidata/error_permission_resp.json"
+                    ),
+                )
+                list(harvester.iter_comments(video_id="F1UP7wRCPH8"))
+
+    def test_stop_early(self, helpers, key_cli):
+        harvester = CommentHarvester(client=key_cli, buffer_size=1)
+
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as m:
+            m.add(
+                method="GET",
+                url=f"{BASE_URL}/commentThreads",
+                json=helpers.load_json(
+                    "testdata/apidata/comment_threads/comment_threads_by_video_paged_1.json"
+                ),
+            )
+            iterator = harvester.iter_comments(video_id="F1UP7wRCPH8")
+            first = next(iterator)
+            iterator.close()
+
+        assert first.id == "UgyZ1jqkHKYvi1-ruOZ4AaABAg"
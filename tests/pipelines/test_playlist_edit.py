@@ -0,0 +1,243 @@
+"""
+Tests for the playlist bulk edit engine.
+"""
+
+import json
+import random
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import responses
+
+from pyyoutube import PyYouTubeException
+from pyyoutube.pipelines import (
+    PlaylistEditJournal,
+    PlaylistEditor,
+    diff_playlist,
+)
+from pyyoutube.pipelines.playlist_edit import (
+    DELETE,
+    INSERT,
+    MOVE,
+    longest_increasing_subsequence,
+)
+
+URL = "https://www.googleapis.com/youtube/v3/playlistItems"
+
+
+def simulate(current, operations):
+    """Apply the operations on (item id, video id) pairs, as the API would."""
+    playlist = list(current)
+    for count, operation in enumerate(operations):
+        if operation.kind == DELETE:
+            playlist = [i for i in playlist if i[0] != operation.playlist_item_id]
+            continue
+        if operation.kind == MOVE:
+            item = next(i for i in playlist if i[0] == operation.playlist_item_id)
+            playlist.remove(item)
+        else:
+            item = (f"new{count}", operation.video_id)
+        playlist.insert(operation.position, item)
+    return playlist
+
+
+def test_longest_increasing_subsequence():
+    values = [3, 1, 4, 1, 5, 9, 2, 6]
+    indexes = longest_increasing_subsequence(values)
+    assert len(indexes) == 4
+    assert [values[i] for i in indexes] == sorted({values[i] for i in indexes})
+    assert longest_increasing_subsequence([]) == []
+
+
+def test_diff_playlist():
+    current = [(f"item{v}", v) for v in "abcde"]
+
+    # A rotation is one move.
+    operations = diff_playlist(current, list("eabcd"))
+    assert [(o.kind, o.video_id, o.position) for o in operations] == [(MOVE, "e", 0)]
+
+    assert diff_playlist(current, list("abcde")) == []
+
+    operations = diff_playlist(current, list("axcdb"))
+    assert [o.kind for o in operations] == [DELETE, INSERT, MOVE]
+    assert [v for _, v in simulate(current, operations)] == list("axcdb")
+
+    # Repeated videos keep their items, in order.
+    current = [("i1", "a"), ("i2", "b"), ("i3", "a")]
+    operations = diff_playlist(current, list("aab"))
+    assert [(o.kind, o.playlist_item_id) for o in operations] == [(MOVE, "i2")]
+    assert simulate(current, operations) == [("i1", "a"), ("i3", "a"), ("i2", "b")]
+
+
+def test_diff_playlist_random():
+    rand = random.Random(0)
+    for _ in range(200):
+        current = [(f"item{i}", rand.choice("abcdefgh")) for i in range(12)]
+        desired = [rand.choice("abcdefghij") for _ in range(rand.randint(0, 12))]
+        operations = diff_playlist(current, desired)
+        assert [v for _, v in simulate(current, operations)] == desired
+
+        kept = len(current) - sum(o.kind == DELETE for o in operations)
+        moves = sum(o.kind == MOVE for o in operations)
+        assert kept + sum(o.kind == INSERT for o in operations) == len(desired)
+        # Every kept item out of a longest ordered run has to move.
+        remaining = {v: [i for i, d in enumerate(desired) if d == v] for v in desired}
+        matched = [remaining[v].pop(0) for _, v in current if remaining.get(v)]
+        assert moves == kept - len(longest_increasing_subsequence(matched))
+
+
+class FakePlaylistItems:
+    """Stateful playlistItems endpoint, failing the requests given in advance.
+
+    Writes in ``lost`` are applied, but answered with an error.
+    """
+
+    def __init__(self, video_ids):
+        self.items = [(f"item{i}", v) for i, v in enumerate(video_ids)]
+        self.failures = {}  # (method, video or item id): [status, ...]
+        self.lost = set()  # (method, video id)
+        self.calls = []
+        self.created = 0
+
+    def _error(self, status, reason):
+        body = {"error": {"code": status, "message": reason, "errors": []}}
+        body["error"]["errors"].append({"reason": reason, "domain": "youtube"})
+        return status, {}, json.dumps(body)
+
+    def _item(self, item_id, video_id):
+        return {
+            "kind": "youtube#playlistItem",
+            "id": item_id,
+            "snippet": {"resourceId": {"kind": "youtube#video", "videoId": video_id}},
+        }
+
+    def __call__(self, request):
+        params = parse_qs(urlsplit(request.url).query)
+        if request.method == "GET":
+            start = int(params.get("pageToken", ["0"])[0])
+            size = int(params["maxResults"][0])
+            data = {
+                "items": [
+                    self._item(*item) for item in self.items[start : start + size]
+                ]
+            }
+            if start + size < len(self.items):
+                data["nextPageToken"] = str(start + size)
+            return 200, {}, json.dumps(data)
+
+        if request.method == "DELETE":
+            key = params["id"][0]
+        else:
+            snippet = json.loads(request.body)["snippet"]
+            key = snippet["resourceId"]["videoId"]
+        self.calls.append((request.method, key))
+        failures = self.failures.get((request.method, key))
+        if failures:
+            return self._error(*failures.pop(0))
+
+        if request.method == "DELETE":
+            self.items = [item for item in self.items if item[0] != key]
+            return 204, {}, ""
+        if request.method == "POST":
+            self.created += 1
+            item = (f"new{self.created}", key)
+        else:
+            item_id = json.loads(request.body)["id"]
+            item = next(item for item in self.items if item[0] == item_id)
+            self.items.remove(item)
+        self.items.insert(snippet["position"], item)
+        if (request.method, key) in self.lost:
+            self.lost.remove((request.method, key))
+            return self._error(503, "backendError")
+        return 200, {}, json.dumps(self._item(*item))
+
+
+def add_callbacks(m, playlist):
+    for method in ("GET", "POST", "PUT", "DELETE"):
+        m.add_callback(method=method, url=URL, callback=playlist)
+
+
+class TestPlaylistEditor:
+    def test_edit(self, authed_cli):
+        playlist = FakePlaylistItems(["v1", "v2", "v3", "v4", "v5"])
+        desired = ["v5", "v1", "v6", "v3", "v2"]
+        playlist.failures[("PUT", "v5")] = [(503, "backendError")]
+        sleeps = []
+
+        with responses.RequestsMock() as m:
+            add_callbacks(m, playlist)
+            editor = PlaylistEditor(
+                authed_cli, "PL", max_workers=2, sleep=sleeps.append
+            )
+            plan = editor.plan(desired)
+            assert plan.counts == {DELETE: 1, INSERT: 1, MOVE: 2}
+            assert plan.quota_cost == 200
+            result = editor.apply(plan)
+
+        assert result.ok
+        assert sleeps == [1.0]
+        assert [v for _, v in playlist.items] == desired
+
+    def test_resume(self, authed_cli, tmp_path):
+        playlist = FakePlaylistItems(["v1", "v2", "v3", "v4"])
+        desired = ["v3", "v5", "v1"]
+        playlist.failures[("POST", "v5")] = [(400, "invalidValue")]
+        journal = PlaylistEditJournal(str(tmp_path / "edit.jsonl"))
+
+        with responses.RequestsMock() as m:
+            add_callbacks(m, playlist)
+            editor = PlaylistEditor(authed_cli, "PL", journal=journal)
+            result = editor.edit(desired)
+            assert not result.ok
+            assert len(result.failed) == 1
+            assert not result.failed[result.pending[0]].retryable
+
+            # A new editor picks up from the journal, without deleting again.
+            deletes = [call for call in playlist.calls if call[0] == "DELETE"]
+            editor = PlaylistEditor(authed_cli, "PL", journal=journal)
+            result = editor.resume()
+
+        assert result.ok
+        assert [call for call in playlist.calls if call[0] == "DELETE"] == deletes
+        assert [v for _, v in playlist.items] == desired
+
+    def test_resume_lost_response(self, authed_cli, tmp_path):
+        playlist = FakePlaylistItems(["v1", "v2"])
+        desired = ["v3", "v1", "v4", "v2"]
+        playlist.lost.add(("POST", "v3"))
+        journal = PlaylistEditJournal(str(tmp_path / "edit.jsonl"))
+
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as m:
+            add_callbacks(m, playlist)
+            editor = PlaylistEditor(authed_cli, "PL", journal=journal)
+            result = editor.edit(desired)
+            assert not result.ok
+            assert playlist.calls.count(("POST", "v3")) == 1
+            # The insert went through, resuming must not add the video again.
+            result = editor.resume()
+
+        assert result.ok
+        assert [v for _, v in playlist.items] == desired
+        assert playlist.calls.count(("POST", "v3")) == 1
+
+    def test_delete_errors(self, authed_cli):
+        playlist = FakePlaylistItems(["v1", "v2", "v3"])
+        playlist.failures[("DELETE", "item0")] = [(404, "playlistItemNotFound")]
+        playlist.failures[("DELETE", "item1")] = [(403, "forbidden")]
+
+        with responses.RequestsMock(assert_all_requests_are_fired=False) as m:
+            add_callbacks(m, playlist)
+            editor = PlaylistEditor(authed_cli, "PL")
+            result = editor.edit(["v3"])
+
+        # An item already gone is done, the other failure stops the edit.
+        assert not result.ok
+        assert len(result.done) == 1
+        assert len(result.failed) == 1
+        assert result.failed[result.pending[0]].status_code == 403
+
+    def test_resume_without_plan(self, authed_cli, tmp_path):
+        journal = PlaylistEditJournal(str(tmp_path / "missing.jsonl"))
+        editor = PlaylistEditor(authed_cli, "PL", journal=journal)
+        with pytest.raises(PyYouTubeException):
+            editor.resume()
@@ -0,0 +1,112 @@
+"""
+Tests for statistics poller.
+"""
+
+import json
+
+import pytest
+import responses
+
+from pyyoutube.error import PyYouTubeException
+from pyyoutube.pipelines import StatisticsPoint, StatisticsPoller, StatisticsStore
+from pyyoutube.pipelines.statistics import decode_points, encode_point
+
+BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+
+def test_encode_decode():
+    points = [
+        StatisticsPoint(1000, 10, 1, 0),
+        StatisticsPoint(1900, 300, 0, 2),
+        StatisticsPoint(2800, 2**40, None, 3),
+    ]
+    data = b""
+    previous = None
+    for point in points:
+        data += encode_point(point, previous)
+        previous = StatisticsPoint(**point.__dict__)
+        if previous.likeCount is None:
+            previous.likeCount = 0
+    decoded = list(decode_points(data))
+    assert decoded[0] == points[0]
+    assert decoded[1] == points[1]
+    assert decoded[2] == StatisticsPoint(2800, 2**40, 0, 3)
+
+
+def test_store(tmp_path):
+    store = StatisticsStore(str(tmp_path))
+    store.append("abc", StatisticsPoint(0, 100, 10, 1))
+    store.append("abc", StatisticsPoint(900, 190, None, 4))
+    store.append("abc", StatisticsPoint(1800, 460, 20, 4))
+
+    # small records after the first one
+    assert len(open(store.path("abc"), "rb").read()) < 20
+
+    # a new store reads the last point from the file
+    store = StatisticsStore(str(tmp_path))
+    store.append("abc", StatisticsPoint(2700, 460, 20, 4))
+    series = store.series("abc")
+    assert [p.viewCount for p in series] == [100, 190, 460, 460]
+    assert series[1].likeCount == 10
+    assert store.series("abc", start=900, end=1800)[-1].timestamp == 1800
+
+    assert store.rate("abc") == 360 / 2700
+    assert store.rate("abc", start=900, end=1800) == 0.3
+    assert store.rate("abc", metric="likeCount", start=1800) == 0.0
+    assert store.rate("abc", start=2700) is None
+    assert store.rate("unknown") is None
+    with pytest.raises(PyYouTubeException):
+        store.rate("abc", metric="dislikeCount")
+
+
+def test_store_truncated(tmp_path):
+    store = StatisticsStore(str(tmp_path), cache_size=1)
+    store.append("abc", StatisticsPoint(0, 100, 10, 1))
+    store.append("abc", StatisticsPoint(900, 2**20, 10, 1))
+    # A crash cut the last record.
+    path = store.path("abc")
+    with open(path, "rb+") as f:
+        f.truncate(len(f.read()) - 1)
+    assert [p.viewCount for p in store.series("abc")] == [100]
+
+    store.append("other", StatisticsPoint(0, 1))
+    assert list(store._last) == ["other"]
+    # The truncated record is dropped before appending.
+    store.append("abc", StatisticsPoint(1800, 300, 12, 1))
+    assert [p.viewCount for p in store.series("abc")] == [100, 300]
+    assert store.rate("abc") == 200 / 1800
+
+
+def test_poller(key_cli, tmp_path):
+    counts = {"views": 100}
+
+    def videos(request):
+        ids = request.params["id"].split(",")
+        assert len(ids) <= 50
+        assert request.params["part"] == "statistics"
+        items = [
+            {
+                "id": vid,
+                "statistics": {"viewCount": str(counts["views"]), "likeCount": "5"},
+            }
+            for vid in ids
+            if vid != "deleted"
+        ]
+        return 200, {}, json.dumps({"items": items})
+
+    video_ids = [f"video{i}" for i in range(120)] + ["deleted"]
+    poller = StatisticsPoller(client=key_cli, directory=str(tmp_path), max_workers=3)
+
+    with responses.RequestsMock() as m:
+        m.add_callback(method="GET", url=f"{BASE_URL}/videos", callback=videos)
+        assert poller.poll(video_ids, timestamp=1000) == 120
+        assert len(m.calls) == 3
+        counts["views"] = 400
+        assert poller.poll(video_ids, timestamp=1600) == 120
+
+    series = poller.series("video7")
+    assert [(p.timestamp, p.viewCount, p.commentCount) for p in series] == [
+        (1000, 100, None),
+        (1600, 400, None),
+    ]
+    assert poller.rate("video7") == 0.5
@@ -0,0 +1,98 @@
+"""
+Tests for notification enrichment.
+"""
+
+import json
+import time
+
+import responses
+
+from pyyoutube.push import PushNotification, VideoEnricher
+
+BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+
+def test_enricher(key_cli):
+    def videos(request):
+        ids = request.params["id"].split(",")
+        items = [{"id": vid, "snippet": {"title": vid}} for vid in ids if vid != "gone"]
+        return 200, {}, json.dumps({"items": items})
+
+    received, errors = [], []
+
+    def handler(video):
+        if video.id == "bad":
+            raise ValueError(video.id)
+        received.append(video)
+
+    enricher = VideoEnricher(
+        client=key_cli, handlers=[handler], max_delay_ms=10_000, on_error=errors.append
+    )
+    assert not enricher.submit(PushNotification(video_id="x", deleted=True))
+    for i in range(55):
+        enricher.submit(PushNotification(video_id=f"video{i}"))
+    enricher.submit("video0")
+    enricher.submit("gone")
+    enricher.submit("bad")
+
+    with responses.RequestsMock() as m:
+        m.add_callback(method="GET", url=f"{BASE_URL}/videos", callback=videos)
+        # The first batch is full, the remaining ids are sent on stop.
+        # video0 is requested again, it arrived after its first batch was taken.
+        with enricher:
+            pass
+        assert len(m.calls) == 2
+        assert len(m.calls[0].request.params["id"].split(",")) == 50
+
+    assert len(received) == 56
+    assert received[0].snippet.title == "video0"
+    assert isinstance(errors[0], ValueError)
+
+    metrics = enricher.metrics()
+    assert metrics["batches"] == 2
+    assert metrics["requested"] == 58
+    assert metrics["enriched"] == 57
+    assert metrics["missing"] == 1
+    assert metrics["errors"] == 1
+    assert metrics["batch_fill"] == 0.58
+    assert 0 <= metrics["latency_p50"] <= metrics["latency_max"]
+
+
+def test_enricher_request_error(key_cli):
+    errors = []
+    enricher = VideoEnricher(client=key_cli, max_delay_ms=10, on_error=errors.append)
+    assert enricher.metrics()["latency_max"] == 0.0
+
+    with responses.RequestsMock() as m:
+        m.add(
+            method="GET",
+            url=f"{BASE_URL}/videos",
+            status=500,
+            json={"error": {"code": 500, "message": "error"}},
+        )
+        enricher.start()
+        enricher("video1")
+        enricher.stop()
+
+    assert len(errors) == 1
+    assert enricher.metrics()["errors"] == 1
+
+
+def test_enricher_backlog(key_cli):
+    def videos(request):
+        ids = request.params["id"].split(",")
+        return 200, {}, json.dumps({"items": [{"id": vid} for vid in ids]})
+
+    enricher = VideoEnricher(client=key_cli, max_delay_ms=1)
+    for i in range(40):
+        enricher.submit(f"video{i}")
+    # The ids waited longer than the delay before the thread started.
+    time.sleep(0.01)
+
+    with responses.RequestsMock() as m:
+        m.add_callback(method="GET", url=f"{BASE_URL}/videos", callback=videos)
+        with enricher:
+            pass
+        assert len(m.calls) == 1
+
+    assert enricher.metrics()["batch_fill"] == 0.8
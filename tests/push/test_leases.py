@@ -0,0 +1,100 @@
+"""
+Tests for push subscription lease manager.
+"""
+
+import responses
+
+from pyyoutube import Client
+from pyyoutube.push import JSONLeaseStore, LeaseManager
+
+TOPIC = "https://www.youtube.com/xml/feeds/videos.xml?channel_id={}"
+
+
+class Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestLeaseManager:
+    def test_renew(self, key_cli, tmp_path):
+        clock = Clock()
+        path = str(tmp_path / "leases.json")
+        manager = LeaseManager(
+            client=key_cli,
+            callback_url="https://example.com/callback",
+            store=JSONLeaseStore(path),
+            lease_seconds=1000,
+            renew_before=100,
+            jitter=50,
+            clock=clock,
+        )
+        manager.add(["channel1", "channel2", "channel3"])
+        manager.add(["channel1"])
+        assert manager.metrics()["pending"] == 3
+
+        with responses.RequestsMock() as m:
+            m.add(method="POST", url=Client.HUB_URL, status=202)
+            m.add(method="POST", url=Client.HUB_URL, status=202)
+            m.add(method="POST", url=Client.HUB_URL, status=500, body="error")
+            renewed, failed = manager.renew_due()
+        assert (renewed, failed) == (2, 1)
+        assert manager.renew_due() == (0, 0)
+
+        metrics = manager.metrics()
+        assert metrics["subscribed"] == 2
+        assert metrics["failing"] == 1
+        assert metrics["near_expiry"] == 0
+
+        # leases are loaded by a new manager
+        manager = LeaseManager(
+            client=key_cli,
+            callback_url="https://example.com/callback",
+            store=JSONLeaseStore(path),
+            lease_seconds=1000,
+            renew_before=100,
+            jitter=50,
+            retry_base=10,
+            clock=clock,
+        )
+        assert manager.metrics()["total"] == 3
+
+        # failed renewal is retried after the backoff.
+        clock.now += 60
+        with responses.RequestsMock() as m:
+            m.add(method="POST", url=Client.HUB_URL, status=202)
+            assert manager.renew_due() == (1, 0)
+
+        # renew before the expiry
+        clock.now += 900
+        assert manager.metrics()["near_expiry"] > 0
+        with responses.RequestsMock() as m:
+            m.add(method="POST", url=Client.HUB_URL, status=202)
+            m.add(method="POST", url=Client.HUB_URL, status=202)
+            m.add(method="POST", url=Client.HUB_URL, status=202)
+            renewed, failed = manager.renew_due(limit=2)
+            assert renewed == 2
+            assert manager.renew_due() == (1, 0)
+
+        clock.now += 2000
+        assert manager.metrics()["expired"] == 3
+
+    def test_verification(self, key_cli):
+        clock = Clock()
+        manager = LeaseManager(
+            client=key_cli, callback_url="https://example.com/callback", clock=clock
+        )
+        manager.add(["channel1"])
+
+        assert manager.on_verification("subscribe", TOPIC.format("channel1"), 500)
+        assert manager.store.get("channel1").expires_at == clock.now + 500
+        assert not manager.on_verification("subscribe", TOPIC.format("other"), 500)
+        assert manager.on_verification("unsubscribe", TOPIC.format("other"), None)
+
+        with responses.RequestsMock() as m:
+            m.add(method="POST", url=Client.HUB_URL, status=202)
+            manager.remove("channel1")
+        assert manager.store.get("channel1") is None
+        assert manager.due() == []
@@ -0,0 +1,231 @@
+"""
+Tests for push notification receiver.
+"""
+
+import asyncio
+import datetime
+import hashlib
+import hmac
+import io
+
+import pytest
+
+from pyyoutube.push import (
+    PushNotificationReceiver,
+    parse_feed,
+    verify_signature,
+)
+
+FEED = b"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" xmlns="http://www.w3.org/2005/Atom">
+  <link rel="hub" href="https://pubsubhubbub.appspot.com"/>
+  <link rel="self" href="https://www.youtube.com/xml/feeds/videos.xml?channel_id=UC_x5XG1OV2P6uZZ5FSM9Ttw"/>
+  <title>YouTube video feed</title>
+  <updated>2015-04-01T19:05:24.552394234+00:00</updated>
+  <entry>
+    <id>yt:video:D-lhorsDlUQ</id>
+    <yt:videoId>D-lhorsDlUQ</yt:videoId>
+    <yt:channelId>UC_x5XG1OV2P6uZZ5FSM9Ttw</yt:channelId>
+    <title>Video title</title>
+    <link rel="alternate" href="http://www.youtube.com/watch?v=D-lhorsDlUQ"/>
+    <author>
+     <name>Channel title</name>
+     <uri>http://www.youtube.com/channel/UC_x5XG1OV2P6uZZ5FSM9Ttw</uri>
+    </author>
+    <published>2015-03-06T21:40:57+00:00</published>
+    <updated>2015-03-09T19:05:24.552394234+00:00</updated>
+  </entry>
+</feed>
+"""
+
+DELETED_FEED = b"""<feed xmlns:at="http://purl.org/atompub/tombstones/1.0" xmlns="http://www.w3.org/2005/Atom">
+  <at:deleted-entry ref="yt:video:D-lhorsDlUQ" when="2015-03-10T10:00:00.000000+00:00">
+    <link href="https://www.youtube.com/watch?v=D-lhorsDlUQ"/>
+    <at:by>
+      <name>Channel title</name>
+      <uri>https://www.youtube.com/channel/UC_x5XG1OV2P6uZZ5FSM9Ttw</uri>
+    </at:by>
+  </at:deleted-entry>
+</feed>
+"""
+
+SECRET = "secret"
+
+
+def sign(body: bytes) -> str:
+    return "sha1=" + hmac.new(SECRET.encode(), body, hashlib.sha1).hexdigest()
+
+
+def test_parse_feed():
+    notification = parse_feed(FEED)[0]
+    assert notification.video_id == "D-lhorsDlUQ"
+    assert notification.channel_id == "UC_x5XG1OV2P6uZZ5FSM9Ttw"
+    assert notification.title == "Video title"
+    assert notification.link == "http://www.youtube.com/watch?v=D-lhorsDlUQ"
+    assert notification.published == datetime.datetime(
+        2015, 3, 6, 21, 40, 57, tzinfo=datetime.timezone.utc
+    )
+    assert notification.updated.microsecond == 552394
+    assert not notification.deleted
+
+    deleted = parse_feed([DELETED_FEED[:50], DELETED_FEED[50:]])[0]
+    assert deleted.deleted
+    assert deleted.video_id == "D-lhorsDlUQ"
+    assert deleted.channel_id == "UC_x5XG1OV2P6uZZ5FSM9Ttw"
+    assert deleted.updated.day == 10
+
+
+def test_verify_signature():
+    assert verify_signature(SECRET, FEED, sign(FEED))
+    assert not verify_signature(SECRET, FEED, sign(b"other"))
+    assert not verify_signature(SECRET, FEED, None)
+    assert not verify_signature(SECRET, FEED, "md5=abc")
+    assert not verify_signature(SECRET, FEED, "sha1=é")
+
+
+def test_handle():
+    received = []
+    verified = []
+
+    def on_verification(mode, topic, lease_seconds):
+        verified.append((mode, topic, lease_seconds))
+        return "deny" not in topic
+
+    receiver = PushNotificationReceiver(
+        secret=SECRET,
+        on_notification=received.append,
+        on_verification=on_verification,
+        cache_size=1,
+    )
+
+    params = {
+        "hub.mode": "subscribe",
+        "hub.topic": "https://www.youtube.com/xml/feeds/videos.xml?channel_id=id",
+        "hub.challenge": "challenge",
+        "hub.lease_seconds": "432000",
+    }
+    assert receiver.handle("GET", params, {}) == (
+        200,
+        {"Content-Type": "text/plain"},
+        b"challenge",
+    )
+    assert verified[0][2] == 432000
+    assert receiver.handle("GET", {**params, "hub.topic": "deny"}, {})[0] == 404
+    assert receiver.handle("GET", {"hub.mode": "subscribe"}, {})[0] == 400
+    invalid = {**params, "hub.lease_seconds": "forever"}
+    assert receiver.handle("GET", invalid, {})[0] == 400
+
+    # bad signature is acknowledged but ignored.
+    status, _, _ = receiver.handle("POST", {}, {"X-Hub-Signature": "sha1=bad"}, FEED)
+    assert status == 204
+    status, _, _ = receiver.handle("POST", {}, {"X-Hub-Signature": "sha1=é"}, FEED)
+    assert status == 204
+    assert received == []
+
+    headers = {"x-hub-signature": sign(FEED)}
+    receiver.handle("POST", {}, headers, [FEED[:100], FEED[100:]])
+    assert len(received) == 1
+    # redelivery
+    receiver.handle("POST", {}, headers, FEED)
+    assert len(received) == 1
+    # new entry evicts the oldest one from the cache.
+    receiver.handle("POST", {}, {"X-Hub-Signature": sign(DELETED_FEED)}, DELETED_FEED)
+    receiver.handle("POST", {}, headers, FEED)
+    assert len(received) == 3
+
+    assert receiver.handle_notification(b"<feed", sign(b"<feed")) == []
+    assert receiver.handle("PUT", {}, {})[0] == 405
+
+
+def test_handler_error():
+    received = []
+
+    def on_notification(notification):
+        if not received:
+            received.append(None)
+            raise RuntimeError("handler error")
+        received.append(notification)
+
+    receiver = PushNotificationReceiver(on_notification=on_notification)
+    with pytest.raises(RuntimeError):
+        receiver.handle("POST", {}, {}, FEED)
+    # The redelivery after the error is not skipped.
+    receiver.handle("POST", {}, {}, FEED)
+    assert received[1].video_id == "D-lhorsDlUQ"
+
+
+def test_wsgi_app():
+    received = []
+    receiver = PushNotificationReceiver(secret=SECRET, on_notification=received.append)
+    statuses = []
+
+    def start_response(status, headers):
+        statuses.append(status)
+
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "QUERY_STRING": "hub.mode=subscribe&hub.topic=topic&hub.challenge=abc",
+    }
+    assert receiver.wsgi_app(environ, start_response) == [b"abc"]
+    assert statuses[-1] == "200 OK"
+
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "CONTENT_LENGTH": str(len(FEED)),
+        "HTTP_X_HUB_SIGNATURE": sign(FEED),
+        "wsgi.input": io.BytesIO(FEED),
+    }
+    receiver.wsgi_app(environ, start_response)
+    assert statuses[-1] == "204 No Content"
+    assert received[0].video_id == "D-lhorsDlUQ"
+
+    receiver.wsgi_app({"REQUEST_METHOD": "PUT"}, start_response)
+    assert statuses[-1] == "405 Method Not Allowed"
+
+
+def test_asgi_app():
+    received = []
+    receiver = PushNotificationReceiver(secret=SECRET, on_notification=received.append)
+
+    async def call(scope, messages):
+        sent = []
+
+        async def receive():
+            return messages.pop(0)
+
+        async def send(message):
+            sent.append(message)
+
+        await receiver.asgi_app(scope, receive, send)
+        return sent
+
+    sent = asyncio.run(
+        call(
+            {
+                "type": "http",
+                "method": "GET",
+                "query_string": b"hub.mode=subscribe&hub.topic=topic&hub.challenge=abc",
+            },
+            [],
+        )
+    )
+    assert sent[0]["status"] == 200
+    assert sent[1]["body"] == b"abc"
+
+    sent = asyncio.run(
+        call(
+            {
+                "type": "http",
+                "method": "POST",
+                "headers": [(b"x-hub-signature", sign(FEED).encode())],
+            },
+            [
+                {"type": "http.request", "body": FEED[:100], "more_body": True},
+                {"type": "http.request", "body": FEED[100:]},
+            ],
+        )
+    )
+    assert sent[0]["status"] == 204
+    assert received[0].channel_id == "UC_x5XG1OV2P6uZZ5FSM9Ttw"
+
+    assert asyncio.run(call({"type": "lifespan"}, [])) == []
@@ -0,0 +1,121 @@
+"""
+Tests for caption parser.
+"""
+
+import pytest
+
+from pyyoutube.caption_parser import (
+    CaptionTrack,
+    Cue,
+    format_timestamp,
+    iter_cues,
+    parse_timestamp,
+)
+from pyyoutube.error import PyYouTubeException
+
+VTT = """WEBVTT
+Kind: captions
+Language: en
+
+NOTE a comment
+
+1
+00:00:01.000 --> 00:00:04.000 align:start position:0%
+Never drink liquid nitrogen.
+
+00:05.000 --> 00:09.500
+It will perforate
+your stomach.
+"""
+
+SRT = """1
+00:00:01,000 --> 00:00:04,000
+Never drink liquid nitrogen.
+
+2
+00:00:05,000 --> 00:00:09,500
+It will perforate
+your stomach.
+"""
+
+SBV = """0:00:01.000,0:00:04.000
+Never drink liquid nitrogen.
+
+0:00:05.000,0:00:09.500
+It will perforate
+your stomach.
+"""
+
+TTML = """<?xml version="1.0" encoding="utf-8" ?>
+<tt xml:lang="en" xmlns="http://www.w3.org/ns/ttml"><body><div>
+<p begin="00:00:01.000" end="00:00:04.000">Never drink liquid nitrogen.</p>
+<p begin="5s" dur="4500ms">It will perforate<br/>your stomach.</p>
+</div></body></tt>
+"""
+
+EXPECTED = [
+    Cue(1.0, 4.0, "Never drink liquid nitrogen."),
+    Cue(5.0, 9.5, "It will perforate\nyour stomach."),
+]
+
+
+def test_timestamp():
+    assert parse_timestamp("01:02:03.456") == 3723.456
+    assert parse_timestamp("02:03,5") == 123.5
+    assert parse_timestamp("1.5s") == 1.5
+    assert parse_timestamp("1m") == 60.0
+    with pytest.raises(PyYouTubeException):
+        parse_timestamp("abc")
+
+    assert format_timestamp(3723.456, "vtt") == "01:02:03.456"
+    assert format_timestamp(3723.456, "srt") == "01:02:03,456"
+    assert format_timestamp(3723.456, "sbv") == "1:02:03.456"
+
+
+@pytest.mark.parametrize(
+    "content,fmt", [(VTT, "vtt"), (SRT, "srt"), (SBV, "sbv"), (TTML, "ttml")]
+)
+def test_parse(content, fmt):
+    track = CaptionTrack.parse(content, fmt)
+    assert list(track) == EXPECTED
+
+    # streaming from bytes chunks split at any position
+    data = content.encode("utf-8")
+    chunks = [data[i : i + 7] for i in range(0, len(data), 7)]
+    assert list(iter_cues(chunks, fmt)) == EXPECTED
+
+
+@pytest.mark.parametrize("fmt", ["vtt", "srt", "sbv", "ttml"])
+def test_convert(fmt):
+    track = CaptionTrack.parse(SRT, "srt")
+    converted = CaptionTrack.parse(track.dumps(fmt), fmt)
+    assert list(converted) == EXPECTED
+
+
+def test_dumps():
+    track = CaptionTrack.parse(VTT, "vtt")
+    assert track.dumps("srt") == SRT
+    assert track.dumps("sbv") == SBV
+    assert track.dumps("vtt").startswith("WEBVTT\n\n00:00:01.000 --> 00:00:04.000\n")
+    with pytest.raises(PyYouTubeException):
+        track.dumps("scc")
+
+
+def test_lookup():
+    track = CaptionTrack(
+        [
+            (5.0, 6.0, "c"),
+            (0.0, 10.0, "a"),
+            (1.0, 2.0, "b"),
+            (11.0, 12.0, "d"),
+        ]
+    )
+    assert len(track) == 4
+    assert track[0].text == "a"
+    assert track.text_at(1.5) == "a\nb"
+    assert [c.text for c in track.cues_at(5.5)] == ["a", "c"]
+    assert track.text_at(2.0) == "a"
+    assert track.text_at(10.5) is None
+    assert track.text_at(-1) is None
+    assert track.text_at(11.0) == "d"
+    assert CaptionTrack().text_at(1) is None
@@ -1,8 +1,19 @@
+import json
 import unittest
 
 from requests import Response
 
-from pyyoutube.error import ErrorCode, ErrorMessage, PyYouTubeException
+from pyyoutube.error import (
+    ErrorCode,
+    ErrorMessage,
+    Forbidden,
+    NotFound,
+    PyYouTubeException,
+    QuotaExceeded,
+    RateLimited,
+    Transient,
+    error_from_response,
+)
 
 
 class ErrorTest(unittest.TestCase):
@@ -23,6 +34,8 @@ class ErrorTest(unittest.TestCase):
         self.assertEqual(ex.status_code, 400)
         self.assertEqual(ex.message, "Bad Request")
         self.assertEqual(ex.error_type, "YouTubeException")
+        self.assertEqual(ex.reason, "keyInvalid")
+        self.assertEqual(ex.domain, "usageLimits")
         error_msg = "YouTubeException(status_code=400,message=Bad Request)"
         self.assertEqual(repr(ex), error_msg)
         self.assertTrue(str(ex), error_msg)
@@ -34,6 +47,7 @@ class ErrorTest(unittest.TestCase):
 
         ex = PyYouTubeException(response=response)
         self.assertEqual(ex.status_code, 400)
+        self.assertEqual(ex.reason, "error message")
 
     def testErrorMessage(self):
         response = ErrorMessage(status_code=ErrorCode.HTTP_ERROR, message="error")
@@ -43,3 +57,90 @@ class ErrorTest(unittest.TestCase):
         self.assertEqual(ex.status_code, 10000)
         self.assertEqual(ex.message, "error")
         self.assertEqual(ex.error_type, "PyYouTubeException")
+
+    @staticmethod
+    def error_response(status_code, reason, domain="global") -> Response:
+        response = Response()
+        response.status_code = status_code
+        response._content = json.dumps(
+            {
+                "error": {
+                    "code": status_code,
+                    "message": "message",
+                    "errors": [
+                        {"message": "message", "domain": domain, "reason": reason}
+                    ],
+                }
+            }
+        ).encode("utf-8")
+        return response
+
+    def testErrorFromResponse(self):
+        cases = [
+            (403, "quotaExceeded", QuotaExceeded, False),
+            (403, "rateLimitExceeded", RateLimited, True),
+            (429, "tooManyRequests", RateLimited, True),
+            (503, "backendError", Transient, True),
+            (500, "unknown", Transient, True),
+            (404, "videoNotFound", NotFound, False),
+            (400, "playlistNotFound", NotFound, False),
+            (403, "forbidden", Forbidden, False),
+            (400, "keyInvalid", PyYouTubeException, False),
+        ]
+        for status_code, reason, cls, retryable in cases:
+            ex = error_from_response(self.error_response(status_code, reason, "d"))
+            self.assertIs(type(ex), cls)
+            self.assertEqual(ex.status_code, status_code)
+            self.assertEqual(ex.reason, reason)
+            self.assertEqual(ex.domain, "d")
+            self.assertEqual(ex.retryable, retryable)
+
+    def testParsedBodyNotParsedAgain(self):
+        response = self.error_response(403, "quotaExceeded")
+        data = response.json()
+        response._content = b"not json"
+
+        ex = error_from_response(response, data)
+        self.assertIsInstance(ex, QuotaExceeded)
+        self.assertEqual(ex.errors, data["error"]["errors"])
+
+        # Decoded by Client.parse_response.
+        response._decoded_json = data
+        self.assertIsInstance(error_from_response(response), QuotaExceeded)
+
+    def testResponseNotJson(self):
+        response = Response()
+        response.status_code = 502
+        response.reason = "Bad Gateway"
+        response._content = b"<html></html>"
+
+        ex = error_from_response(response)
+        self.assertIsInstance(ex, Transient)
+        self.assertEqual(ex.message, "Bad Gateway")
+
+    def testErrorWithoutCode(self):
+        response = Response()
+        response.status_code = 503
+        response._content = b'{"error": {"message": "unavailable"}}'
+
+        ex = error_from_response(response)
+        self.assertIsInstance(ex, Transient)
+        self.assertEqual(ex.status_code, 503)
+        self.assertEqual(ex.message, "unavailable")
+
+    def testClientResponseNotJson(self):
+        from pyyoutube import Client
+
+        response = Response()
+        response.status_code = 503
+        response.reason = "Service Unavailable"
+        response._content = b""
+
+        with self.assertRaises(Transient):
+            Client.parse_response(response)
+
+        response = Response()
+        response.status_code = 200
+        response._content = b""
+        with self.assertRaises(ValueError):
+            Client.parse_response(response)
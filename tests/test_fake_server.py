@@ -0,0 +1,232 @@
+"""
+Tests for the fake YouTube Data API server.
+"""
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from pyyoutube import Client, PyYouTubeException, QuotaExceeded
+from pyyoutube.fake_server import FakeDataset, FakeYouTubeServer
+from pyyoutube.media import Media, MediaUpload
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    return FakeDataset(
+        channels=2, videos_per_channel=60, comments_per_video=3, replies_per_comment=2
+    )
+
+
+@pytest.fixture
+def server(dataset):
+    with FakeYouTubeServer(dataset) as server:
+        yield server
+
+
+@pytest.fixture
+def cli(server):
+    cli = Client(api_key="api key")
+    server.configure(cli)
+    return cli
+
+
+def test_dataset(dataset):
+    same = FakeDataset(
+        channels=2, videos_per_channel=60, comments_per_video=3, replies_per_comment=2
+    )
+    assert same.video_ids == dataset.video_ids
+    channel = dataset.channels[dataset.channel_ids[0]]
+    assert channel["statistics"]["videoCount"] == 60
+    assert len(dataset.videos) == 120
+    assert len(dataset.comments) == 120 * 3 * 3
+
+
+def test_list(cli, dataset):
+    channel_id = dataset.channel_ids[0]
+    res = cli.channels.list(channel_id=channel_id, parts="snippet,contentDetails")
+    channel = res.items[0]
+    assert channel.id == channel_id
+    assert channel.statistics is None
+    uploads = channel.contentDetails.relatedPlaylists.uploads
+
+    # Page through the uploads.
+    video_ids, page_token = [], None
+    while True:
+        res = cli.playlistItems.list(
+            playlist_id=uploads,
+            parts="contentDetails",
+            max_results=50,
+            page_token=page_token,
+        )
+        video_ids.extend(item.contentDetails.videoId for item in res.items)
+        page_token = res.nextPageToken
+        if page_token is None:
+            break
+    assert res.prevPageToken is not None
+    assert len(video_ids) == res.pageInfo.totalResults == 60
+
+    res = cli.videos.list(video_id=video_ids[:50])
+    assert [video.id for video in res.items] == video_ids[:50]
+    assert res.items[0].contentDetails.get_video_seconds_duration() > 0
+
+    threads = cli.commentThreads.list(video_id=video_ids[0], parts="snippet,replies")
+    assert len(threads.items) == 3
+    replies = cli.comments.list(parent_id=threads.items[0].id)
+    assert replies.items == threads.items[0].replies.comments
+
+    popular = cli.videos.list(chart="mostPopular", max_results=5, parts="statistics")
+    counts = [video.statistics.viewCount for video in popular.items]
+    assert counts == sorted(counts, reverse=True)
+
+
+def test_list_errors(cli, dataset):
+    with pytest.raises(PyYouTubeException) as e:
+        cli.videos.list(video_id=dataset.video_ids[:51])
+    assert e.value.status_code == 400
+
+    with pytest.raises(PyYouTubeException) as e:
+        cli.videos.list(chart="mostPopular", page_token="invalid")
+    assert e.value.status_code == 400
+
+    with pytest.raises(PyYouTubeException) as e:
+        cli.playlistItems.list(playlist_id="unknown")
+    assert e.value.status_code == 404
+
+    with pytest.raises(PyYouTubeException) as e:
+        cli.parse_response(
+            cli.request(path="videos", params={"part": "unknown", "id": "x"})
+        )
+    assert e.value.status_code == 400
+
+    with pytest.raises(PyYouTubeException) as e:
+        cli.videos.list(video_id="x", max_results=51)
+    assert e.value.status_code == 400
+
+    res = requests.get(cli.BASE_URL + "videos", params={"part": "id", "id": "x"})
+    assert res.status_code == 403
+
+
+def test_etag(server, dataset):
+    url = server.base_url + "videos"
+    params = {"part": "id", "id": dataset.video_ids[0], "key": "api key"}
+    res = requests.get(url, params=params)
+    etag = res.headers["ETag"]
+    assert res.json()["etag"] == etag
+
+    res = requests.get(url, params=params, headers={"If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+
+    res = requests.get(url, params=params, headers={"If-None-Match": "old"})
+    assert res.status_code == 200
+
+
+def test_quota_and_errors(cli, server, dataset):
+    server.quota = 2
+    video_id = dataset.video_ids[0]
+    cli.videos.list(video_id=video_id)
+    cli.videos.list(video_id=video_id)
+    with pytest.raises(PyYouTubeException) as e:
+        cli.videos.list(video_id=video_id)
+    assert isinstance(e.value, QuotaExceeded)
+    assert "quota" in e.value.message
+    server.reset_quota()
+
+    server.fail_next(503, count=2)
+    for _ in range(2):
+        with pytest.raises(PyYouTubeException) as e:
+            cli.videos.list(video_id=video_id)
+        assert e.value.status_code == 503
+        assert e.value.retryable
+    cli.videos.list(video_id=video_id)
+
+    server.error_rate = 1.0
+    server.error_statuses = (429,)
+    with pytest.raises(PyYouTubeException) as e:
+        cli.videos.list(video_id=video_id)
+    assert e.value.status_code == 429
+    assert server.requests[("GET", "videos", 429)] == 1
+    assert server.requests[("GET", "videos", 200)] == 3
+
+
+def test_latency(server, dataset):
+    cli = Client(api_key="api key", timeout=0.01)
+    server.configure(cli)
+    server.latency = lambda: 0.05
+    with pytest.raises(requests.exceptions.Timeout):
+        cli.videos.list(video_id=dataset.video_ids[0])
+
+
+def test_upload():
+    dataset = FakeDataset(channels=1, videos_per_channel=1, comments_per_video=0)
+    with FakeYouTubeServer(dataset) as server:
+        cli = Client(api_key="api key")
+        server.configure(cli)
+        data = b"x" * (600 * 1024)
+        upload = MediaUpload(
+            client=cli,
+            resource="videos",
+            media=Media(
+                fd=io.BytesIO(data), mimetype="video/mp4", chunk_size=256 * 1024
+            ),
+            params={"part": "snippet"},
+            body={"snippet": {"title": "Uploaded"}},
+        )
+        progress, body = upload.next_chunk()
+        assert progress.progressed_seize == 256 * 1024
+        assert server.quota_used == 1600
+
+        # A chunk not at the stored range is ignored.
+        upload.resumable_progress = 512 * 1024
+        progress, body = upload.next_chunk()
+        assert progress.progressed_seize == 256 * 1024
+
+        while body is None:
+            progress, body = upload.next_chunk()
+        assert body["snippet"]["title"] == "Uploaded"
+        channel = dataset.channels[dataset.channel_ids[0]]
+        uploads = channel["contentDetails"]["relatedPlaylists"]["uploads"]
+        assert (
+            dataset.playlist_items[uploads][-1]["contentDetails"]["videoId"]
+            == body["id"]
+        )
+
+        res = requests.put(
+            upload.resumable_uri,
+            params={"key": "api key"},
+            data=b"x",
+            headers={"Content-Range": "bytes 0-0/1"},
+        )
+        assert res.status_code == 404
+
+
+def test_concurrent_adds():
+    dataset = FakeDataset(channels=1, videos_per_channel=1, comments_per_video=0)
+    server = FakeYouTubeServer(dataset)
+    channel_id = dataset.channel_ids[0]
+    uploads = dataset.channels[channel_id]["contentDetails"]["relatedPlaylists"][
+        "uploads"
+    ]
+    url = (
+        f"{server.base_url}playlistItems?part=id&maxResults=50"
+        f"&playlistId={uploads}&key=key"
+    )
+
+    def add():
+        for _ in range(200):
+            dataset.add_video(channel_id)
+
+    def read():
+        for _ in range(200):
+            assert server.handle("GET", url)[0] == 200
+        for _ in range(100):
+            server.handle("GET", f"{server.base_url}videos?part=id&chart=mostPopular")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(fn) for fn in (add, read, read, add)]
+        for future in futures:
+            future.result()
+    assert len(dataset.videos) == 401
@@ -0,0 +1,161 @@
+"""
+Tests for the client instrumentation.
+"""
+
+import pytest
+import requests
+import responses
+
+from pyyoutube import Client, PyYouTubeException
+from pyyoutube.models import Channel
+from pyyoutube.instrumentation import Instrumentation, current_call
+
+VIDEOS_URL = "https://www.googleapis.com/youtube/v3/videos"
+
+
+@pytest.fixture
+def instrumentation():
+    return Instrumentation()
+
+
+@pytest.fixture
+def cli(instrumentation):
+    return Client(api_key="api key", instrumentation=instrumentation)
+
+
+def test_call_phases(helpers, cli, instrumentation):
+    events = []
+    for event in ("request", "response", "parse", "decode"):
+        instrumentation.add_hook(
+            event, lambda call, event=event: events.append((event, call))
+        )
+
+    with responses.RequestsMock() as m:
+        m.add(
+            method="GET",
+            url=VIDEOS_URL,
+            json=helpers.load_json("testdata/apidata/videos/videos_info_multi.json"),
+        )
+        res = cli.videos.list(video_id="D-lhorsDlUQ,c0KYU2j0TM4")
+    assert len(res.items) == 2
+
+    assert [event for event, _ in events] == ["request", "response", "parse", "decode"]
+    call = events[0][1]
+    assert all(c is call for _, c in events)
+    assert (call.method, call.endpoint, call.status) == ("GET", "videos", 200)
+    assert call.model == "VideoListResponse"
+    assert set(call.timings) == {"send", "download", "parse", "decode"}
+    assert current_call.get() is None
+
+    metrics = instrumentation.metrics()
+    assert metrics["requests"] == {("GET", "videos", 200): 1}
+    assert metrics["errors"] == {}
+    assert metrics["phases"][("videos", "decode")]["count"] == 1
+
+    with pytest.raises(PyYouTubeException):
+        instrumentation.add_hook("unknown", print)
+
+
+def test_call_errors(helpers, cli, instrumentation):
+    with responses.RequestsMock() as m:
+        m.add(
+            method="GET",
+            url=VIDEOS_URL,
+            status=400,
+            json=helpers.load_json("testdata/error_response.json"),
+        )
+        m.add(
+            method="GET",
+            url=VIDEOS_URL,
+            body=requests.exceptions.ConnectionError("refused"),
+        )
+        with pytest.raises(PyYouTubeException):
+            cli.videos.list(video_id="D-lhorsDlUQ")
+        with pytest.raises(requests.exceptions.ConnectionError):
+            cli.videos.list(video_id="D-lhorsDlUQ")
+    # Error bodies are not decoded.
+    assert current_call.get() is None
+
+    metrics = instrumentation.metrics()
+    assert metrics["requests"] == {
+        ("GET", "videos", 400): 1,
+        ("GET", "videos", "error"): 1,
+    }
+    assert metrics["errors"] == {
+        ("videos", "keyInvalid"): 1,
+        ("videos", "ConnectionError"): 1,
+    }
+
+
+def test_to_prometheus(cli, instrumentation):
+    with responses.RequestsMock() as m:
+        m.add(method="GET", url=VIDEOS_URL, json={"items": []})
+        cli.videos.list(video_id="id")
+    text = instrumentation.to_prometheus()
+    assert (
+        'pyyoutube_requests_total{method="GET",endpoint="videos",status="200"} 1'
+        in text
+    )
+    assert "# TYPE pyyoutube_phase_seconds histogram" in text
+    assert (
+        'pyyoutube_phase_seconds_bucket{endpoint="videos",phase="parse",le="+Inf"} 1'
+        in text
+    )
+    assert 'pyyoutube_phase_seconds_count{endpoint="videos",phase="decode"} 1' in text
+
+    instrumentation.reset()
+    assert instrumentation.metrics()["requests"] == {}
+
+
+def test_disabled(key_cli):
+    with responses.RequestsMock() as m:
+        m.add(method="GET", url=VIDEOS_URL, json={"items": []})
+        response = key_cli.request(path="videos", params={"id": "id"})
+        key_cli.parse_response(response)
+    assert "_instrumented_call" not in vars(response)
+    assert current_call.get() is None
+
+
+def test_opentelemetry(cli, instrumentation):
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    from pyyoutube.instrumentation import OpenTelemetryHooks
+
+    exporter = InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    OpenTelemetryHooks(provider.get_tracer("test")).install(instrumentation)
+
+    with responses.RequestsMock() as m:
+        m.add(method="GET", url=VIDEOS_URL, json={"items": []})
+        cli.videos.list(video_id="id")
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    assert set(spans) == {"GET videos", "parse", "decode VideoListResponse"}
+    request_span = spans["GET videos"]
+    assert request_span.attributes["http.response.status_code"] == 200
+    assert spans["parse"].parent.span_id == request_span.context.span_id
+
+
+def test_return_json(helpers, cli, instrumentation):
+    events = []
+    instrumentation.add_hook("decode", events.append)
+    data = helpers.load_json("testdata/apidata/channel_info_single.json")
+
+    with responses.RequestsMock() as m:
+        m.add(method="GET", url=VIDEOS_URL, json={"items": []})
+        cli.videos.list(video_id="id", return_json=True)
+    # Unrelated data decoded afterwards is not timed as the call decoding.
+    Channel.from_dict(data["items"][0])
+    assert events == []
+    assert ("videos", "decode") not in instrumentation.metrics()["phases"]
+
+    with responses.RequestsMock() as m:
+        m.add(method="GET", url=VIDEOS_URL, json={"items": []})
+        response = cli.request(path="videos", params={"id": "id"})
+        cli.parse_response(response)
+        cli.request(path="videos", params={"id": "id"})
+    assert current_call.get() is None
@@ -0,0 +1,66 @@
+"""
+Tests for the lazy package attributes.
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import pyyoutube
+import pyyoutube.models
+import pyyoutube.resources
+
+
+def loaded_modules(code: str) -> set:
+    out = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return set(out.split())
+
+
+def test_import_is_lazy():
+    modules = loaded_modules("import pyyoutube")
+    for name in [
+        "pyyoutube.api",
+        "pyyoutube.client",
+        "pyyoutube.models.video",
+        "pyyoutube.resources",
+        "requests",
+        "requests_oauthlib",
+        "dataclasses_json",
+    ]:
+        assert name not in modules
+
+    modules = loaded_modules("from pyyoutube import Video")
+    assert "pyyoutube.models.video" in modules
+    assert "pyyoutube.models.playlist" not in modules
+    assert "pyyoutube.api" not in modules
+
+    modules = loaded_modules(
+        "from pyyoutube import Client\nClient(api_key='key').channels"
+    )
+    assert "pyyoutube.pipelines" not in modules
+    assert "pyyoutube.push" not in modules
+
+
+def test_public_names():
+    from pyyoutube import Client, PyYouTubeException, TOPICS, Video  # noqa
+
+    assert pyyoutube.Channel is pyyoutube.models.channel.Channel
+    assert "Video" in dir(pyyoutube)
+    assert "Api" in pyyoutube.__all__
+    assert set(pyyoutube.models.__all__) <= set(pyyoutube.__all__)
+    assert pyyoutube.resources.VideosResource.__name__ == "VideosResource"
+
+    namespace = {}
+    exec("from pyyoutube.models import *", namespace)
+    assert "PlaylistItem" in namespace
+
+    with pytest.raises(AttributeError):
+        pyyoutube.NotExists
+    with pytest.raises(ImportError):
+        from pyyoutube.models import NotExists  # noqa
@@ -0,0 +1,61 @@
+"""
+Tests for fields mask projection.
+"""
+
+import pytest
+import responses
+
+from pyyoutube import Channel, PyYouTubeException, Video
+from pyyoutube.projection import FieldPath, Projection
+
+
+def test_projection():
+    video = FieldPath(Video)
+    projection = Projection(
+        Video,
+        "id",
+        video.snippet.title,
+        "snippet.thumbnails.default.url",
+        video.statistics.viewCount,
+    )
+    assert str(video.snippet.title) == "snippet.title"
+    assert projection.fields == (
+        "id,snippet(title,thumbnails(default(url))),statistics(viewCount)"
+    )
+    assert projection.parts == "snippet,statistics"
+    assert projection.list_fields() == f"items({projection.fields}),nextPageToken"
+    assert projection.list_fields("pageInfo") == f"items({projection.fields}),pageInfo"
+
+    # A whole attribute covers its sub attributes.
+    projection = Projection(Channel, "snippet.title", "snippet", "snippet.description")
+    assert projection.fields == "snippet"
+    assert Projection(Channel, "id").parts == "id"
+
+
+def test_projection_invalid():
+    with pytest.raises(PyYouTubeException):
+        Projection(Video, "snippet.unknown")
+    with pytest.raises(PyYouTubeException):
+        Projection(Video, "snippet.title.text")
+    with pytest.raises(PyYouTubeException):
+        FieldPath(Video).snippet.unknown
+
+
+def test_projection_request(key_cli):
+    projection = Projection(Video, "id", "statistics.viewCount")
+    with responses.RequestsMock() as m:
+        m.add(
+            method="GET",
+            url="https://www.googleapis.com/youtube/v3/videos",
+            json={"items": [{"id": "video", "statistics": {"viewCount": "10"}}]},
+        )
+        res = key_cli.videos.list(
+            video_id="video",
+            parts=projection.parts,
+            fields=projection.list_fields(),
+        )
+        assert m.calls[0].request.params["fields"] == (
+            "items(id,statistics(viewCount)),nextPageToken"
+        )
+    assert res.items[0].statistics.viewCount == 10
+    assert res.items[0].snippet is None
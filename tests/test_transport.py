@@ -0,0 +1,127 @@
+"""
+Tests for record/replay transport.
+"""
+
+import json
+import time
+
+import pytest
+import requests
+import responses
+
+from pyyoutube import Api, Client, PyYouTubeException
+from pyyoutube.transport import Cassette, CassetteTransport, request_key
+
+BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+
+def load(name):
+    with open(f"testdata/apidata/videos/{name}", "rb") as f:
+        return json.loads(f.read().decode("utf-8"))
+
+
+def test_record_replay(tmp_path):
+    path = str(tmp_path / "cassette.json")
+    transport = CassetteTransport(path, mode="record")
+    cli = Client(api_key="secret key", transport=transport)
+    with responses.RequestsMock() as m:
+        m.add(
+            method="GET", url=f"{BASE_URL}/videos", json=load("videos_info_single.json")
+        )
+        m.add(
+            method="GET", url=f"{BASE_URL}/videos", json=load("videos_info_multi.json")
+        )
+        m.add(method="GET", url=f"{BASE_URL}/channels", status=404, body=b"\xff\x00")
+        cli.videos.list(video_id="D-lhorsDlUQ")
+        cli.videos.list(video_id="D-lhorsDlUQ")
+        cli.request(path="channels", params={"id": "x"})
+    transport.save()
+
+    with open(path) as f:
+        saved = f.read()
+    assert "secret key" not in saved and "secret+key" not in saved
+    assert len(json.loads(saved)["interactions"]) == 3
+
+    # Replayed without network, with any credentials.
+    transport = CassetteTransport(path, latency=0.01)
+    cli = Client(api_key="other key", transport=transport)
+    start = time.perf_counter()
+    first = cli.videos.list(video_id="D-lhorsDlUQ")
+    assert time.perf_counter() - start >= 0.01
+    second = cli.videos.list(video_id="D-lhorsDlUQ")
+    third = cli.videos.list(video_id="D-lhorsDlUQ")
+    assert len(first.items) == 1
+    assert len(second.items) == 2
+    assert len(third.items) == 2  # The last recording is served again.
+    response = cli.request(path="channels", params={"id": "x"})
+    assert response.status_code == 404
+    assert response.content == b"\xff\x00"
+
+    with pytest.raises(PyYouTubeException):
+        cli.videos.list(video_id="unknown")
+
+    transport = CassetteTransport(Cassette(path), repeat=False)
+    cli = Client(api_key="key", transport=transport)
+    cli.videos.list(video_id="D-lhorsDlUQ")
+    cli.videos.list(video_id="D-lhorsDlUQ")
+    with pytest.raises(PyYouTubeException):
+        cli.videos.list(video_id="D-lhorsDlUQ")
+    transport.cassette.rewind()
+    assert len(cli.videos.list(video_id="D-lhorsDlUQ").items) == 1
+
+
+def test_request_key():
+    request = requests.Request(
+        method="POST",
+        url="https://pubsubhubbub.appspot.com/subscribe?key=secret",
+        data={"hub.mode": "subscribe", "hub.secret": "secret", "code": "secret"},
+    ).prepare()
+    key = request_key(request)
+    assert "secret" not in key
+    assert "hub.mode=subscribe" in key
+
+
+def test_replay_stream_and_secrets(tmp_path):
+    path = str(tmp_path / "cassette.json")
+    transport = CassetteTransport(path, mode="record")
+    cli = Client(access_token="access token", transport=transport)
+    token = {"access_token": "secret token", "refresh_token": "secret refresh"}
+    with responses.RequestsMock() as m:
+        m.add(method="GET", url=f"{BASE_URL}/captions/caption", body=b"caption")
+        m.add(
+            method="GET",
+            url=f"{BASE_URL}/token",
+            json=token,
+            headers={"Set-Cookie": "session=secret"},
+        )
+        list(cli.captions.iter_download(caption_id="caption"))
+        cli.request(path="token")
+    transport.save()
+
+    with open(path) as f:
+        saved = f.read()
+    assert "secret" not in saved
+
+    cli = Client(access_token="access token", transport=CassetteTransport(path))
+    chunks = cli.captions.iter_download(caption_id="caption", chunk_size=3)
+    assert list(chunks) == [b"cap", b"tio", b"n"]
+    assert cli.request(path="token").json()["access_token"] == "REDACTED"
+
+
+def test_api_transport(tmp_path):
+    path = str(tmp_path / "cassette.json")
+    transport = CassetteTransport(path, mode="record", latency=lambda: 0.001)
+    api = Api(api_key="key", transport=transport)
+    with responses.RequestsMock() as m:
+        m.add(
+            method="GET", url=f"{BASE_URL}/videos", json=load("videos_info_single.json")
+        )
+        api.get_video_by_id(video_id="D-lhorsDlUQ")
+    transport.save()
+
+    api = Api(api_key="key", transport=CassetteTransport(path))
+    res = api.get_video_by_id(video_id="D-lhorsDlUQ")
+    assert res.items[0].id == "D-lhorsDlUQ"
+
+    with pytest.raises(PyYouTubeException):
+        CassetteTransport(path, mode="unknown")
@@ -0,0 +1,96 @@
+"""
+Tests for single-flight coalescing.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyyoutube.utils.coalesce import SingleFlight
+
+
+def test_do(helpers):
+    single_flight = SingleFlight()
+    calls = []
+
+    def func():
+        calls.append(1)
+        helpers.wait_for(lambda: single_flight.shared == 3)
+        return {"items": []}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: single_flight.do("key", func), range(4)))
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert single_flight.in_flight() == 0
+
+    # Finished calls are not cached.
+    single_flight.do("key", func=lambda: calls.append(1))
+    assert len(calls) == 2
+
+
+def test_do_error(helpers):
+    single_flight = SingleFlight()
+    started = threading.Event()
+
+    def func():
+        started.set()
+        helpers.wait_for(lambda: single_flight.shared == 1)
+        raise ValueError("error")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(single_flight.do, "key", func)
+        started.wait()
+        second = executor.submit(single_flight.do, "key", func)
+        for future in (first, second):
+            with pytest.raises(ValueError):
+                future.result()
+    assert single_flight.in_flight() == 0
+
+
+def test_do_async(helpers):
+    single_flight = SingleFlight()
+    calls = []
+
+    def func():
+        calls.append(1)
+        helpers.wait_for(lambda: single_flight.shared == 2)
+        return len(calls)
+
+    async def main():
+        return await asyncio.gather(
+            single_flight.do_async("key", func),
+            single_flight.do_async("key", func),
+            single_flight.do_async("key", func),
+            single_flight.do_async("other", lambda: 0),
+        )
+
+    assert asyncio.run(main()) == [1, 1, 1, 0]
+    assert len(calls) == 1
+
+
+def test_do_async_cancel(helpers):
+    single_flight = SingleFlight()
+    release = threading.Event()
+
+    def func():
+        release.wait(5)
+        return "result"
+
+    async def main():
+        tasks = [
+            asyncio.ensure_future(single_flight.do_async("key", func)) for _ in range(3)
+        ]
+        while single_flight.shared < 2:
+            await asyncio.sleep(0.001)
+        tasks[0].cancel()
+        await asyncio.sleep(0.01)
+        release.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    first, *others = asyncio.run(main())
+    assert isinstance(first, asyncio.CancelledError)
+    assert others == ["result", "result"]
+    assert single_flight.in_flight() == 0
@@ -0,0 +1,56 @@
+"""
+Tests for ISO 8601 parsers.
+"""
+
+import datetime
+
+import isodate
+import pytest
+from isodate import ISO8601Error
+
+from pyyoutube.utils.iso8601 import (
+    parse_datetime,
+    parse_duration,
+    parse_many_datetimes,
+    parse_many_durations,
+)
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["PT14H23M42S", "PT21M7S", "PT59S", "P1DT2H", "P0D", "P1W", "PT1.5S", "PT"],
+)
+def test_parse_duration(value):
+    assert parse_duration(value) == isodate.parse_duration(value).total_seconds()
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2019-05-16T18:46:20Z",
+        "2020-01-14T09:40:49.981Z",
+        "2019-05-16T18:46:20.123456789Z",
+        "2019-05-16T18:46:20+08:00",
+        "2019-05-16T18:46:20.5-0530",
+        "2019-05-16T18:46:20",
+    ],
+)
+def test_parse_datetime(value):
+    assert parse_datetime(value) == isodate.parse_datetime(value)
+
+
+def test_invalid():
+    with pytest.raises(ISO8601Error):
+        parse_duration("PT14H23M42")
+    with pytest.raises(ISO8601Error):
+        parse_datetime("not a datetime")
+    with pytest.raises(ValueError):
+        parse_datetime("2019-13-16T18:46:20Z")
+
+
+def test_parse_many():
+    assert parse_many_durations(["PT1M", None, "PT1M"]) == [60, None, 60]
+    assert parse_many_datetimes(["2019-05-16T18:46:20Z", ""]) == [
+        datetime.datetime(2019, 5, 16, 18, 46, 20, tzinfo=datetime.timezone.utc),
+        None,
+    ]
@@ -31,3 +31,21 @@ class ParamCheckerTest(unittest.TestCase):
 
         with self.assertRaises(pyyoutube.PyYouTubeException):
             enf_parts(resource="channels", value="not_part")
+
+    def testEnfPartsDeterministic(self) -> None:
+        expected = "contentDetails,id,snippet"
+        for value in [
+            "snippet,id,contentDetails",
+            " id, snippet ,contentDetails",
+            ["snippet", "contentDetails", "id", "id"],
+            {"snippet", "id", "contentDetails"},
+        ]:
+            self.assertEqual(enf_parts(resource="channels", value=value), expected)
+
+        with self.assertRaises(pyyoutube.PyYouTubeException):
+            enf_parts(resource="channels", value=[None])
+        with self.assertRaises(pyyoutube.PyYouTubeException):
+            enf_parts(resource="channels", value={"id", 1})
+
+    def testEnfCommaSeparatedSet(self) -> None:
+        self.assertEqual(enf_comma_separated("id", {"id2", "id1"}), "id1,id2")